@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Benchmark extract_data_and_method_reference.py against synthetic Playwright projects.
+
+A project of the requested size is generated in a temporary directory, with page
+objects shaped like page-objects/CartPage.ts, helpers shaped like
+helpers/CommonActionsHelpers.ts and data files shaped like data/products/products.ts.
+Every stage of the reference generation is then timed on it: discovery, each
+extractor, merging, rendering the HTML and writing it. A separate pass traces the
+peak memory each stage allocates with tracemalloc. The peak RSS of the process and
+of the --jobs worker processes and the output size are reported too, so regressions
+in the hot paths show up as numbers.
+
+USAGE:
+    python scripts/benchmark_data_and_method_reference.py
+    python scripts/benchmark_data_and_method_reference.py --page-objects 200 --methods 40 --locators 20
+    python scripts/benchmark_data_and_method_reference.py --data-files 5 --data-entries 100000
+    python scripts/benchmark_data_and_method_reference.py --repeat 5 --json
+    python scripts/benchmark_data_and_method_reference.py --keep /tmp/synthetic-project
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.insert(0, str(Path(__file__).parent))
+import extract_data_and_method_reference as reference  # noqa: E402
+
+
+# ============================================================================
+# Synthetic Project Generation
+# ============================================================================
+
+METHOD_TEMPLATES = [
+    ('click{name}', '', "    await this.{locator}.click();\n"),
+    ('fill{name}', 'value: string', "    await this.{locator}.fill(value);\n"),
+    ('verify{name}IsVisible', '', "    await expect(this.{locator}).toBeVisible();\n"),
+    ('verify{name}Text', 'expectedText: string, timeout: number = 10000',
+     "    await expect(this.{locator}).toHaveText(expectedText, {{ timeout }});\n"),
+    ('select{name}', 'options: { label: string; index?: number }, retries = 3',
+     "    for (let i = 0; i < retries; i++) {{\n"
+     "      await this.{locator}.selectOption({{ label: options.label }});\n"
+     "    }}\n"),
+]
+
+
+def _page_object_source(class_name: str, methods: int, locators: int) -> str:
+    """A page object in the style of page-objects/CartPage.ts."""
+    locator_names = [f'btn_Element{index}' for index in range(locators)] or ['btn_Element0']
+    lines = [
+        "import { Locator, Page, expect } from '@playwright/test';",
+        "",
+        "import { BasePage } from './BasePage';",
+        "",
+        f"export class {class_name} extends BasePage {{",
+    ]
+    lines += [f"  private readonly {name}: Locator;" for name in locator_names[:locators]]
+    lines += ["", "  constructor(page: Page) {", "    super(page);"]
+    for index, name in enumerate(locator_names[:locators]):
+        if index % 2:
+            lines.append(f"    this.{name} = page.getByRole('button', {{name: 'Element {index}'}});")
+        else:
+            lines.append(f"    this.{name} = page.locator('#element-{index}');")
+    lines += ["  }", ""]
+
+    body = []
+    for index in range(methods):
+        name_template, params, statement = METHOD_TEMPLATES[index % len(METHOD_TEMPLATES)]
+        method_name = name_template.format(name=f'Element{index}')
+        locator = locator_names[index % len(locator_names)]
+        body.append(f"  async {method_name}({params}) {{\n{statement.format(locator=locator)}  }}\n")
+    return '\n'.join(lines) + '\n' + '\n'.join(body) + '\n}\n'
+
+
+def _helper_source(class_name: str, methods: int) -> str:
+    """A helper class in the style of helpers/CommonActionsHelpers.ts."""
+    body = []
+    for index in range(methods):
+        body.append(
+            f"  static async step{index}(poManager: POManager, username: string, password: string){{\n"
+            f"    return await test.step(`Step: {class_name}.step{index}(\"${{username}}\")`, async () => {{\n"
+            f"      await poManager.getLoginPage().login(username, password);\n"
+            f"    }});\n"
+            f"  }}\n"
+        )
+    return (
+        "import { test } from '@playwright/test';\n\n"
+        "import {POManager} from '../page-objects/POManager';\n\n"
+        f"export class {class_name} {{\n" + '\n'.join(body) + "}\n"
+    )
+
+
+def _data_source(const_name: str, entries: int) -> str:
+    """A data file in the style of data/products/products.ts."""
+    items = ',\n'.join(
+        f"  {{\n"
+        f"    'productName': 'Product {index}; model {index % 97}',\n"
+        f"    'productPrice': {100 + index % 900},\n"
+        f"    'imgSrc': 'imgs/product_{index}.jpg'\n"
+        f"  }}"
+        for index in range(entries)
+    )
+    return (
+        "import type {Product} from '../data-interfaces';\n\n"
+        f"export const {const_name}:Product[] = [\n{items}\n];\n\n"
+        f"export const {const_name}_COUNT = {entries};\n"
+    )
+
+
+def generate_project(root: Path, page_objects: int, methods: int, locators: int,
+                     helpers: int, data_files: int, data_entries: int) -> Dict[str, int]:
+    """Write a synthetic project under root and return its file and byte counts."""
+    helpers_dir = root / reference.HELPERS_DIR
+    page_objects_dir = root / reference.PAGE_OBJECTS_DIR
+    data_dir = root / reference.DATA_DIR
+    for directory in (helpers_dir, page_objects_dir, data_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    files = {}
+    for index in range(helpers):
+        files[helpers_dir / f'Helpers{index}.ts'] = _helper_source(f'Helpers{index}', methods)
+    for index in range(page_objects):
+        files[page_objects_dir / f'Page{index}.ts'] = _page_object_source(f'Page{index}', methods, locators)
+    for index in range(data_files):
+        files[data_dir / f'catalog{index}' / f'catalog{index}.ts'] = _data_source(f'CATALOG_{index}', data_entries)
+
+    total_bytes = 0
+    for path, text in files.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+        total_bytes += len(text.encode('utf-8'))
+    return {'files': len(files), 'bytes': total_bytes}
+
+
+# ============================================================================
+# Stage Timing
+# ============================================================================
+
+def peak_rss_mb(children: bool = False) -> Optional[float]:
+    """Peak resident set size so far in MB, of this process or of its largest child (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class StageTimer:
+    """Collects the wall time of named stages, keeping the best of repeated runs.
+
+    With trace_memory it collects the peak memory each stage allocates above
+    what was held when it started instead, keeping the largest. tracemalloc
+    slows the stages down too much to time them in the same run.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, float] = {}
+
+    def measure(self, function, *args, **kwargs):
+        """Call function; return its result and cost, in seconds or as (peak, held) bytes."""
+        if not self.trace_memory:
+            started = time.perf_counter()
+            result = function(*args, **kwargs)
+            return result, time.perf_counter() - started
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        result = function(*args, **kwargs)
+        current, peak = tracemalloc.get_traced_memory()
+        return result, (peak - before, current - before)
+
+    def add(self, first, second):
+        """The cost of two measured calls run one after the other (first may be None)."""
+        if first is None:
+            return second
+        if not self.trace_memory:
+            return first + second
+        return max(first[0], first[1] + second[0]), first[1] + second[1]
+
+    def record(self, name: str, cost):
+        if self.trace_memory:
+            peak_mb = cost[0] / 1024 / 1024
+            if peak_mb > self.stages.get(name, -1.0):
+                self.stages[name] = peak_mb
+        elif name not in self.stages or cost < self.stages[name]:
+            self.stages[name] = cost
+
+    def time(self, name: str, function, *args, **kwargs):
+        result, cost = self.measure(function, *args, **kwargs)
+        self.record(name, cost)
+        return result
+
+
+def run_stages(timer: StageTimer, project_root: Path, output_file: Path, jobs: int, html_options: Dict):
+    """Run every stage once on project_root, recording each in timer; return the sources and merged records."""
+    sources = timer.time('discovery', reference.discover_source_files, project_root)
+
+    # Each extractor on its own, serially and without the cache
+    per_kind = {}
+    results = []
+    for source in sources:
+        result, cost = timer.measure(reference.extract_source_file, *source)
+        results.append(result)
+        per_kind[source[0]] = timer.add(per_kind.get(source[0]), cost)
+    for kind, cost in per_kind.items():
+        timer.record(f'extract {kind}', cost)
+    # The worker processes' memory is not traced, only timed
+    if jobs > 1 and not timer.trace_memory:
+        timer.time(f'extract all (jobs={jobs})', reference.extract_source_files, sources, None, jobs)
+
+    all_methods, locators_by_class, all_data = timer.time('merge', reference.merge_records, sources, results)
+
+    # Rendering alone, then rendering plus writing the file
+    all_locators = [locator for locator_list in locators_by_class.values() for locator in locator_list]
+    timer.time('search index', lambda: sum(len(chunk) for chunk in reference.iter_search_index(
+        all_methods, all_locators, all_data
+    )))
+    shard_dir = 'shards' if html_options.get('split') else None
+    timer.time('render html', lambda: sum(len(chunk) for chunk in reference.iter_combined_html(
+        all_methods, all_data, locators_by_class, compact=html_options.get('compact', False),
+        shard_dir=shard_dir, virtualize=html_options.get('virtualize', False)
+    )))
+    timer.time('generate_combined_html + write', reference.generate_combined_html,
+               all_methods, all_data, locators_by_class, str(output_file), **html_options)
+    return sources, all_methods, locators_by_class, all_data
+
+
+def run_benchmark(project_root: Path, output_dir: Path, repeat: int, jobs: int, html_options: Dict) -> Dict:
+    """Run every stage repeat times on project_root, then once traced; return the best timings, peaks and sizes.
+
+    tracemalloc only sees Python allocations in this process, so the peak RSS
+    of the process (and where it stood before the stages ran) and of the
+    worker processes are reported as well.
+    """
+    rss_before_mb = peak_rss_mb()
+    timer = StageTimer()
+    output_file = output_dir / reference.DEFAULT_OUTPUT_FILE
+    for _ in range(repeat):
+        sources, all_methods, locators_by_class, all_data = run_stages(
+            timer, project_root, output_file, jobs, html_options
+        )
+    del all_methods, locators_by_class, all_data
+
+    # Traced from here on, so neither generating the project nor the timed runs count
+    memory = StageTimer(trace_memory=True)
+    tracemalloc.start()
+    try:
+        sources, all_methods, locators_by_class, all_data = run_stages(
+            memory, project_root, output_file, jobs, html_options
+        )
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'sources': len(sources),
+        'methods': len(all_methods),
+        'locators': sum(len(locator_list) for locator_list in locators_by_class.values()),
+        'data_objects': len(all_data),
+        'stages': timer.stages,
+        'stage_peak_mb': memory.stages,
+        'output_bytes': sum(path.stat().st_size for path in output_dir.rglob('*') if path.is_file()),
+        'peak_rss_mb': peak_rss_mb(),
+        'peak_rss_before_stages_mb': rss_before_mb,
+        'workers_peak_rss_mb': peak_rss_mb(children=True) if jobs > 1 else None,
+    }
+
+
+def print_report(project: Dict, result: Dict, repeat: int):
+    print(f"Project: {project['files']} files, {project['bytes'] / 1024 / 1024:.1f} MB")
+    print(f"Extracted: {result['methods']} methods, {result['locators']} locators, "
+          f"{result['data_objects']} data objects from {result['sources']} files")
+    print(f"\nStage timings (best of {repeat}) and peak memory allocated:")
+    width = max(len(name) for name in result['stages'])
+    for name, seconds in result['stages'].items():
+        peak_mb = result['stage_peak_mb'].get(name)
+        peak = f"{peak_mb:10.1f} MB" if peak_mb is not None else ''
+        print(f"   {name:<{width}}  {seconds * 1000:10.1f} ms  {peak}".rstrip())
+    print(f"\nOutput size: {result['output_bytes'] / 1024 / 1024:.2f} MB")
+    if result['peak_rss_mb'] is not None:
+        print(f"Peak RSS: {result['peak_rss_mb']:.1f} MB "
+              f"({result['peak_rss_before_stages_mb']:.1f} MB before the stages ran)")
+    if result['workers_peak_rss_mb'] is not None:
+        print(f"Peak RSS of a worker process: {result['workers_peak_rss_mb']:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the data and method reference generator on a synthetic project')
+    parser.add_argument('--page-objects', type=int, default=50, help='Number of page object files (default: 50)')
+    parser.add_argument('--methods', type=int, default=20, help='Methods per page object and helper (default: 20)')
+    parser.add_argument('--locators', type=int, default=10, help='Locators per page object (default: 10)')
+    parser.add_argument('--helpers', type=int, default=3, help='Number of helper files (default: 3)')
+    parser.add_argument('--data-files', type=int, default=10, help='Number of data files (default: 10)')
+    parser.add_argument('--data-entries', type=int, default=1000, help='Catalog entries per data file (default: 1000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per stage; the best time is reported (default: 3)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Also time extraction with this many worker processes; 0 uses every CPU (default: 1)')
+    parser.add_argument('--compact', action='store_true', help='Benchmark --compact output')
+    parser.add_argument('--split', action='store_true', help='Benchmark --split output')
+    parser.add_argument('--virtualize', action='store_true', help='Benchmark --virtualize output')
+    parser.add_argument('--assets', action='store_true', help='Benchmark --assets output')
+    parser.add_argument('--keep', metavar='DIR', help='Generate the project in DIR and keep it instead of a temporary directory')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON for comparing runs')
+
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error('--repeat must be at least 1')
+    if args.split and args.virtualize:
+        parser.error('--split already renders sections on demand; use it without --virtualize')
+    jobs = args.jobs or os.cpu_count() or 1
+    html_options = {'compact': args.compact, 'split': args.split, 'virtualize': args.virtualize, 'assets': args.assets}
+
+    with tempfile.TemporaryDirectory(prefix='reference-benchmark-') as temp_dir:
+        project_root = Path(args.keep) if args.keep else Path(temp_dir) / 'project'
+        output_dir = Path(temp_dir) / 'output'
+        output_dir.mkdir()
+
+        project = generate_project(
+            project_root, args.page_objects, args.methods, args.locators,
+            args.helpers, args.data_files, args.data_entries
+        )
+        result = run_benchmark(project_root, output_dir, args.repeat, jobs, html_options)
+
+    if args.json:
+        print(json.dumps({'project': project, **result}, indent=2))
+    else:
+        print_report(project, result, args.repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -13,14 +13,43 @@ Before running this script, update the constants at the top of this file to matc
 USAGE:
     python scripts/extract_data_and_method_reference.py
     python scripts/extract_data_and_method_reference.py --output MY_REFERENCE.html
+    python scripts/extract_data_and_method_reference.py --no-cache
+    python scripts/extract_data_and_method_reference.py --jobs 8
+    python scripts/extract_data_and_method_reference.py --compact
+    python scripts/extract_data_and_method_reference.py --split
+    python scripts/extract_data_and_method_reference.py --virtualize
+    python scripts/extract_data_and_method_reference.py --preview-lines 20
+    python scripts/extract_data_and_method_reference.py --assets
+    python scripts/extract_data_and_method_reference.py --format ndjson
+    python scripts/extract_data_and_method_reference.py --manifest
+    python scripts/extract_data_and_method_reference.py --profile --profile-trace trace.json
+    python scripts/extract_data_and_method_reference.py --watch
+    python scripts/extract_data_and_method_reference.py serve --port 8765
 """
 
 import re
 from pathlib import Path
 from datetime import datetime, timezone
 import argparse
-from typing import List, Dict
+from typing import List, Dict, Optional
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import gzip
+import os
 import json
+import time
+import threading
+import cProfile
+from contextlib import contextmanager
+import heapq
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+try:
+    import brotli
+except ImportError:  # optional: --assets then writes only gzip variants
+    brotli = None
 
 
 # ============================================================================
@@ -40,16 +69,302 @@ DATA_DIR = 'data'
 EXCLUDED_PAGE_OBJECTS = {'POManager.ts', 'BasePage.ts'}
 EXCLUDED_DATA_FILES = {'data-interfaces.ts'}
 
+# Extra extraction patterns, compiled once at import alongside the built-in ones
+# (see Extraction Pattern Registry below). Keys are pattern roles:
+#   - 'class_declaration': group 1 is the exported class name
+#   - 'helper_method', 'page_object_method': group 1 is the method name and the
+#     match must end at the '(' that opens the parameter list
+#   - 'locator_declaration': group 1 is the locator property name
+#   - 'locator_assignment': group 1 is the property name, group 2 the assigned expression
+#   - 'data_export': group 1 is the constant name and the match must end just
+#     before its type annotation or '='
+# Example:
+#   CUSTOM_EXTRACTION_PATTERNS = {
+#       'locator_declaration': [r'^\s*(?:public\s+)?readonly\s+(\w+)\s*:\s*Locator\s*;'],
+#   }
+CUSTOM_EXTRACTION_PATTERNS: Dict[str, List[str]] = {}
+
 # Default output file name
 DEFAULT_OUTPUT_FILE = 'DATA_METHODS_REFERENCE.html'
 
+# Supported output formats (--format)
+OUTPUT_FORMATS = ('html', 'json', 'ndjson')
+
+# Extraction cache file (relative to project root), reused between runs to skip unchanged files
+DEFAULT_CACHE_FILE = '.data_methods_reference_cache.json'
+
+
+# ============================================================================
+# TypeScript Signature Tokenizer
+# ============================================================================
+
+_CLOSING_BRACKETS = {'(': ')', '[': ']', '{': '}', '<': '>'}
+
+# Body of a string literal up to (not including) its closing quote; ' and " strings also end at a newline
+_STRING_BODIES = {
+    "'": re.compile(r"(?:[^'\\\n]|\\[\s\S])*"),
+    '"': re.compile(r'(?:[^"\\\n]|\\[\s\S])*'),
+    '`': re.compile(r'(?:[^`\\]|\\[\s\S])*'),
+}
+
+# Compiled "next significant character" patterns, keyed by (stops, angles)
+_SCAN_PATTERNS: Dict[tuple, re.Pattern] = {}
+
+
+class _ScanState:
+    """Nesting of a _scan_to pass that ran out of text, so it can continue once more text is appended.
+
+    resume is where scanning continues: the end of the scanned text, or the
+    start of a string literal or comment that was cut off by it.
+    """
+
+    __slots__ = ('resume', 'expected', 'opened_in_value', 'in_value')
+
+    def __init__(self, resume: int):
+        self.resume = resume
+        self.expected: List[str] = []
+        self.opened_in_value: List[bool] = []
+        self.in_value = False
+
+
+def _scan_to(text: str, start: int, stops: str, end: Optional[int] = None, angles: bool = True,
+             state: Optional[_ScanState] = None) -> int:
+    """Return the index of the first stop character outside brackets, strings and comments.
+
+    One linear pass that tracks (), [], {} and (unless angles is False) <>
+    nesting, jumping straight between significant characters. The '>' of an
+    arrow (=>) never closes a bracket. After an '=' (up to the next ',' or ';'
+    at its level) the text is a value, where '<' only opens type arguments
+    right after a name (new Map<K, V>()) and is otherwise a comparison. An
+    unclosed '<' is dropped when an enclosing bracket closes. Returns end
+    when no stop character is found.
+
+    With a state the nesting starts from and is saved back into it, and
+    state.resume tells where to call again after text is appended, so a
+    value that grows chunk by chunk is scanned once.
+    """
+    end = len(text) if end is None else end
+    pattern = _SCAN_PATTERNS.get((stops, angles))
+    if pattern is None:
+        significant = '\'"`/()[]{}' + ('<>=,;' if angles else '') + stops
+        pattern = _SCAN_PATTERNS[(stops, angles)] = re.compile(f'[{re.escape(significant)}]')
+    search = pattern.search
+
+    if state is None:
+        state = _ScanState(start)
+    expected = state.expected
+    # Whether each open bracket was opened inside a value, and whether the current level is one
+    opened_in_value = state.opened_in_value
+    in_value = state.in_value
+    i = start
+    while True:
+        match = search(text, i, end)
+        if match is None:
+            state.resume = end
+            state.in_value = in_value
+            return end
+        i = match.start()
+        char = text[i]
+        if char in '\'"`':
+            close = _STRING_BODIES[char].match(text, i + 1, end).end()
+            if close >= end or text[close] == '\\':
+                # Cut off by the end of the text, possibly inside an escape
+                break
+            i = close + 1
+            continue
+        if char == '/':
+            following = text[i + 1:i + 2]
+            if following == '/':
+                newline = text.find('\n', i, end)
+                if newline == -1:
+                    break
+                i = newline
+                continue
+            if following == '*':
+                close = text.find('*/', i + 2, end)
+                if close == -1:
+                    break
+                i = close + 2
+                continue
+            if i + 1 >= end:
+                break
+        if char in ')]}':
+            while expected and expected[-1] == '>':
+                expected.pop()
+                in_value = opened_in_value.pop()
+        if not expected and char in stops and not (char == '=' and text[i + 1:i + 2] in ('=', '>')):
+            return i
+        if char in _CLOSING_BRACKETS:
+            if char != '<' or (angles and (not in_value or text[i - 1:i].isalnum() or text[i - 1:i] in '_$')):
+                expected.append(_CLOSING_BRACKETS[char])
+                opened_in_value.append(in_value)
+        elif char in ')]}':
+            if expected and expected[-1] == char:
+                expected.pop()
+                in_value = opened_in_value.pop()
+        elif char == '>':
+            if expected and expected[-1] == '>' and not (i > start and text[i - 1] == '='):
+                expected.pop()
+                in_value = opened_in_value.pop()
+        elif char == '=':
+            if text[i + 1:i + 2] not in ('=', '>') and text[i - 1:i] not in ('=', '!', '<', '>'):
+                in_value = True
+        elif char in ',;':
+            in_value = opened_in_value[-1] if opened_in_value else False
+        i += 1
+
+    # A string literal or comment runs past the end; continue from its start
+    state.resume = i
+    state.in_value = in_value
+    return end
+
+
+# String literals and comments, for stripping comments without touching strings
+_COMMENT_OR_STRING = re.compile(
+    r"'(?:[^'\\\n]|\\[\s\S])*'?"
+    r'|"(?:[^"\\\n]|\\[\s\S])*"?'
+    r'|`(?:[^`\\]|\\[\s\S])*`?'
+    r'|//[^\n]*'
+    r'|/\*[\s\S]*?(?:\*/|\Z)'
+)
+
+
+def strip_comments(text: str) -> str:
+    """Remove // and /* */ comments, leaving string literals intact."""
+    return _COMMENT_OR_STRING.sub(lambda match: '' if match.group().startswith('/') else match.group(), text)
+
+
+def split_top_level(text: str, separator: str = ',') -> List[str]:
+    """Split text at separators that are not nested in brackets or string literals."""
+    parts = []
+    start = 0
+    while True:
+        stop = _scan_to(text, start, separator)
+        parts.append(text[start:stop])
+        if stop >= len(text):
+            return parts
+        start = stop + 1
+
+
+def match_signature(content: str, open_paren: int):
+    """Parse '(params)[: ReturnType] {' from the parenthesis at open_paren.
+
+    Returns (params, return_type, body_start), where return_type is None when
+    the signature has no annotation, or None when no method body follows.
+    """
+    close = _scan_to(content, open_paren + 1, ')')
+    if close >= len(content):
+        return None
+    params = content[open_paren + 1:close]
+
+    i = close + 1
+    while i < len(content) and content[i].isspace():
+        i += 1
+    return_type = None
+    if i < len(content) and content[i] == ':':
+        type_start = i + 1
+        i = type_start
+        while True:
+            i = _scan_to(content, i, '{;')
+            if i >= len(content) or content[i] == ';':
+                return None
+            # A brace where a type is expected opens an object literal type, not the body
+            if content[type_start:i].strip() in ('', '|', '&') or content[type_start:i].rstrip().endswith(('|', '&', '=>')):
+                i = _scan_to(content, i + 1, '}') + 1
+                continue
+            break
+        return_type = content[type_start:i]
+
+    if i >= len(content) or content[i] != '{':
+        return None
+    return params, return_type, i
+
+
+# ============================================================================
+# Extraction Pattern Registry
+# ============================================================================
+
+
+class PatternRegistry:
+    """Extraction regexes grouped by role and compiled once, at import.
+
+    A role normally has a single pattern, which is used directly. Roles
+    extended through CUSTOM_EXTRACTION_PATTERNS merge the matches of all their
+    patterns in source order; a match ending where an earlier one ended is
+    the same hit and is skipped.
+    """
+
+    def __init__(self):
+        self._patterns: Dict[str, List[re.Pattern]] = {}
+        self._flags: Dict[str, int] = {}
+
+    def register(self, role: str, pattern: str, flags: Optional[int] = None):
+        """Compile pattern for role; flags default to those of the role's first pattern."""
+        if flags is None:
+            if role not in self._flags:
+                raise ValueError(f"Unknown extraction pattern role {role!r}; expected one of {sorted(self._flags)}")
+            flags = self._flags[role]
+        self._flags.setdefault(role, flags)
+        self._patterns.setdefault(role, []).append(re.compile(pattern, flags))
+
+    def search(self, role: str, text: str, pos: int = 0) -> Optional[re.Match]:
+        """Return the earliest match of any pattern of role at or after pos."""
+        patterns = self._patterns[role]
+        if len(patterns) == 1:
+            return patterns[0].search(text, pos)
+        matches = [match for match in (pattern.search(text, pos) for pattern in patterns) if match]
+        return min(matches, key=lambda match: (match.start(), -match.end()), default=None)
+
+    def finditer(self, role: str, text: str):
+        """Iterate over the matches of every pattern of role in source order."""
+        patterns = self._patterns[role]
+        if len(patterns) == 1:
+            return patterns[0].finditer(text)
+        return self._merged(patterns, text)
+
+    @staticmethod
+    def _merged(patterns: List[re.Pattern], text: str):
+        seen_ends = set()
+        for match in heapq.merge(*(pattern.finditer(text) for pattern in patterns), key=lambda match: match.start()):
+            if match.end() not in seen_ends:
+                seen_ends.add(match.end())
+                yield match
+
+
+EXTRACTION_PATTERNS = PatternRegistry()
+EXTRACTION_PATTERNS.register('class_declaration', r'export\s+class\s+(\w+)', 0)
+# Method heads; the parameter list and return type are read by match_signature
+EXTRACTION_PATTERNS.register('helper_method', r'(?:static\s+)?async\s+(\w+)\s*\(', re.MULTILINE)
+EXTRACTION_PATTERNS.register('page_object_method', r'^\s*(?:async\s+)?(\w+)\s*\(', re.MULTILINE)
+EXTRACTION_PATTERNS.register('locator_declaration', r'^\s*private\s+(?:readonly\s+)?(\w+)\s*:\s*Locator\s*;', re.MULTILINE)
+EXTRACTION_PATTERNS.register('locator_assignment', r'this\.(\w+)\s*=\s*([^;]+);', re.MULTILINE | re.DOTALL)
+# Head of exported const declarations (both objects and arrays); the initializer is read by _scan_to
+EXTRACTION_PATTERNS.register('data_export', r'export\s+const\s+(\w+)\s*', 0)
+
+for _role, _custom_patterns in CUSTOM_EXTRACTION_PATTERNS.items():
+    for _custom_pattern in _custom_patterns:
+        EXTRACTION_PATTERNS.register(_role, _custom_pattern)
+
+# Helper patterns used on every record
+_NEWLINE_PATTERN = re.compile('\n')
+_WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+_CAMEL_CASE_BOUNDARY_PATTERN = re.compile(r'([a-z])([A-Z])')
+_KEBAB_CASE_BOUNDARY_PATTERN = re.compile(r'(?<!^)(?=[A-Z])')
+
 
 # ============================================================================
 # PlaywrightMethod Class and Extraction Functions
 # ============================================================================
 
 class PlaywrightMethod:
-    """Represents a Playwright method with enhanced metadata."""
+    """Represents a Playwright method with enhanced metadata.
+
+    Slotted to keep large projects compact; parsed_params and purpose are
+    inferred on first access and memoized.
+    """
+
+    __slots__ = ('class_name', 'method_name', 'parameters', 'return_type', 'location', 'method_type',
+                 '_parsed_params', '_purpose')
 
     def __init__(self, class_name: str, method_name: str, parameters: str, return_type: str, location: str, method_type: str = "page_object"):
         self.class_name = class_name
@@ -58,8 +373,20 @@ class PlaywrightMethod:
         self.return_type = return_type
         self.location = location
         self.method_type = method_type  # "common" or "page_object"
-        self.parsed_params = self._parse_parameters()
-        self.purpose = self._infer_purpose()
+        self._parsed_params: Optional[List[Dict[str, str]]] = None
+        self._purpose: Optional[str] = None
+
+    @property
+    def parsed_params(self) -> List[Dict[str, str]]:
+        if self._parsed_params is None:
+            self._parsed_params = self._parse_parameters()
+        return self._parsed_params
+
+    @property
+    def purpose(self) -> str:
+        if self._purpose is None:
+            self._purpose = self._infer_purpose()
+        return self._purpose
 
     def _parse_parameters(self) -> List[Dict[str, str]]:
         """Parse and describe parameters from the method signature."""
@@ -68,25 +395,27 @@ class PlaywrightMethod:
         if not self.parameters or self.parameters.strip() == "":
             return params
 
-        # Remove outer parentheses and split by comma
-        param_string = self.parameters.strip("()")
-        if not param_string:
-            return params
+        for param_part in split_top_level(strip_comments(self.parameters)):
+            param_part = param_part.strip()
+            if not param_part:
+                continue
 
-        # Simple parameter parsing - can be enhanced
-        param_parts = [p.strip() for p in param_string.split(',')]
+            # Drop a default value ('name: type = value' or 'name = value')
+            default_at = _scan_to(param_part, 0, '=')
+            declaration = param_part[:default_at].strip()
 
-        for param_part in param_parts:
-            if ':' in param_part:
-                param_name, param_type = param_part.split(':', 1)
+            type_at = _scan_to(declaration, 0, ':')
+            if type_at < len(declaration):
+                param_name = declaration[:type_at].strip()
+                param_type = declaration[type_at + 1:].strip()
                 params.append({
-                    'name': param_name.strip(),
-                    'type': param_type.strip(),
-                    'description': self._infer_param_description(param_name.strip(), param_type.strip())
+                    'name': param_name,
+                    'type': param_type,
+                    'description': self._infer_param_description(param_name, param_type)
                 })
             else:
                 params.append({
-                    'name': param_part,
+                    'name': declaration,
                     'type': 'any',
                     'description': 'Parameter'
                 })
@@ -151,7 +480,7 @@ class PlaywrightMethod:
 
         # Generic page methods - work for any page type
         else:
-            readable_method = re.sub(r'([a-z])([A-Z])', r'\1 \2', self.method_name).lower()
+            readable_method = _CAMEL_CASE_BOUNDARY_PATTERN.sub(r'\1 \2', self.method_name).lower()
             return f"Perform '{readable_method}' operation"
 
     def to_dict(self) -> Dict:
@@ -167,10 +496,27 @@ class PlaywrightMethod:
             'purpose': self.purpose,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'PlaywrightMethod':
+        """Rebuild a method from the output of to_dict, reusing its inferred fields."""
+        method = cls(
+            class_name=data['class_name'],
+            method_name=data['method_name'],
+            parameters=data['parameters'],
+            return_type=data['return_type'],
+            location=data['location'],
+            method_type=data['method_type']
+        )
+        method._parsed_params = data.get('parsed_params')
+        method._purpose = data.get('purpose')
+        return method
+
 
 class LocatorDefinition:
     """Represents a locator defined inside a page object."""
 
+    __slots__ = ('class_name', 'property_name', 'assignment', 'location')
+
     def __init__(self, class_name: str, property_name: str, assignment: str, location: str):
         self.class_name = class_name
         self.property_name = property_name
@@ -185,6 +531,29 @@ class LocatorDefinition:
             'location': self.location,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LocatorDefinition':
+        return cls(data['class_name'], data['property_name'], data['assignment'], data['location'])
+
+
+class LineIndex:
+    """Maps character offsets in a file's content to 1-based line numbers.
+
+    The newline positions are collected once per file, so each lookup is a
+    binary search instead of rescanning the content before the match.
+    """
+
+    def __init__(self, content: str, relative_path: str):
+        self.relative_path = relative_path
+        self.newlines = [match.start() for match in _NEWLINE_PATTERN.finditer(content)]
+
+    def line_of(self, offset: int) -> int:
+        return bisect_left(self.newlines, offset) + 1
+
+    def location(self, offset: int) -> str:
+        """Return the 'path:line' location for an offset."""
+        return f'{self.relative_path}:{self.line_of(offset)}'
+
 
 def extract_methods_from_common_helpers(file_path: Path, relative_path: str) -> List[PlaywrightMethod]:
     """Extract static methods from CommonActionsHelpers.ts."""
@@ -194,26 +563,24 @@ def extract_methods_from_common_helpers(file_path: Path, relative_path: str) ->
         content = f.read()
 
     # Extract class name (same logic as extract_methods_from_page_object)
-    class_match = re.search(r'export\s+class\s+(\w+)', content)
+    class_match = EXTRACTION_PATTERNS.search('class_declaration', content)
     if not class_match:
         return methods
 
     class_name = class_match.group(1)
+    line_index = LineIndex(content, relative_path)
 
-    # Pattern to match static async methods AND instance async methods
-    method_pattern = re.compile(
-        r'(?:static\s+)?async\s+(\w+)\s*\(([^)]*)\)\s*(?::\s*([^{]+))?\s*{',
-        re.MULTILINE
-    )
+    # Heads of static async methods AND instance async methods
+    for match in EXTRACTION_PATTERNS.finditer('helper_method', content):
+        signature = match_signature(content, match.end() - 1)
+        if signature is None:
+            continue
 
-    for match in method_pattern.finditer(content):
         method_name = match.group(1)
-        parameters = match.group(2) if match.group(2) else ""
-        return_type = match.group(3).strip() if match.group(3) else "Promise<void>"
+        parameters, return_type, _ = signature
+        return_type = return_type.strip() if return_type else "Promise<void>"
 
-        # Find line number
-        line_num = content[:match.start()].count('\n') + 1
-        location = f'{relative_path}:{line_num}'
+        location = line_index.location(match.start())
 
         method = PlaywrightMethod(
             class_name=class_name,
@@ -228,27 +595,12 @@ def extract_methods_from_common_helpers(file_path: Path, relative_path: str) ->
     return methods
 
 
-def extract_methods_from_page_object(file_path: Path, relative_path: str) -> List[PlaywrightMethod]:
-    """Extract methods from a page object file."""
+def _extract_page_object_methods(content: str, class_name: str, line_index: LineIndex) -> List[PlaywrightMethod]:
+    """Extract methods from the content of a page object file."""
     methods = []
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Extract class name
-    class_match = re.search(r'export\s+class\s+(\w+)', content)
-    if not class_match:
-        return methods
-
-    class_name = class_match.group(1)
-
-    # Pattern to match class methods (both async and sync)
-    method_pattern = re.compile(
-        r'^\s*(?:async\s+)?(\w+)\s*\(([^)]*)\)\s*(?::\s*([^{]+))?\s*\{',
-        re.MULTILINE
-    )
-
-    for match in method_pattern.finditer(content):
+    # Heads of class methods (both async and sync)
+    for match in EXTRACTION_PATTERNS.finditer('page_object_method', content):
         method_name = match.group(1)
 
         # Skip constructor, control structures, proxy handlers, and non-method patterns
@@ -259,12 +611,14 @@ def extract_methods_from_page_object(file_path: Path, relative_path: str) -> Lis
         if method_name.startswith('_'):
             continue
 
-        parameters = match.group(2) if match.group(2) else ""
-        return_type = match.group(3).strip() if match.group(3) else "Promise<void>"
+        signature = match_signature(content, match.end() - 1)
+        if signature is None:
+            continue
+
+        parameters, return_type, _ = signature
+        return_type = return_type.strip() if return_type else "Promise<void>"
 
-        # Find line number
-        line_num = content[:match.start()].count('\n') + 1
-        location = f'{relative_path}:{line_num}'
+        location = line_index.location(match.start())
 
         method = PlaywrightMethod(
             class_name=class_name,
@@ -279,47 +633,74 @@ def extract_methods_from_page_object(file_path: Path, relative_path: str) -> Lis
     return methods
 
 
-def extract_locators_from_page_object(file_path: Path, relative_path: str):
-    """Extract locator definitions from a page object file."""
+def _extract_page_object_locators(content: str, class_name: str, line_index: LineIndex) -> List[LocatorDefinition]:
+    """Extract locator definitions from the content of a page object file."""
     locators: List[LocatorDefinition] = []
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    class_match = re.search(r'export\s+class\s+(\w+)', content)
-    if not class_match:
-        return None, locators
-
-    class_name = class_match.group(1)
-
-    locator_pattern = re.compile(
-        r'^\s*private\s+(?:readonly\s+)?(\w+)\s*:\s*Locator\s*;',
-        re.MULTILINE
-    )
-
     locator_names = []
-    for match in locator_pattern.finditer(content):
+    for match in EXTRACTION_PATTERNS.finditer('locator_declaration', content):
         property_name = match.group(1)
-        line_num = content[:match.start()].count('\n') + 1
-        location = f'{relative_path}:{line_num}'
-        locator_names.append((property_name, location))
-
-    assignment_pattern = re.compile(
-        r'this\.(\w+)\s*=\s*([^;]+);',
-        re.MULTILINE | re.DOTALL
-    )
+        locator_names.append((property_name, line_index.location(match.start())))
 
     assignment_map = {}
-    for match in assignment_pattern.finditer(content):
+    for match in EXTRACTION_PATTERNS.finditer('locator_assignment', content):
         property_name = match.group(1)
         assignment = match.group(2).strip()
-        assignment_map[property_name] = re.sub(r'\s+', ' ', assignment)
+        assignment_map[property_name] = _WHITESPACE_RUN_PATTERN.sub(' ', assignment)
 
     for property_name, location in locator_names:
         assignment = assignment_map.get(property_name, 'Not assigned')
         locators.append(LocatorDefinition(class_name, property_name, assignment, location))
 
-    return class_name, locators
+    return locators
+
+
+def _read_page_object(file_path: Path, relative_path: str):
+    """Read a page object file and resolve its exported class name.
+
+    Returns (content, class_name, line_index), or None when the file does not
+    export a class.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    class_match = EXTRACTION_PATTERNS.search('class_declaration', content)
+    if not class_match:
+        return None
+
+    return content, class_match.group(1), LineIndex(content, relative_path)
+
+
+def parse_page_object(file_path: Path, relative_path: str):
+    """Read a page object file once and extract its class name, methods and locators.
+
+    Returns (class_name, methods, locators); class_name is None when the file
+    does not export a class.
+    """
+    parsed = _read_page_object(file_path, relative_path)
+    if parsed is None:
+        return None, [], []
+
+    content, class_name, line_index = parsed
+    methods = _extract_page_object_methods(content, class_name, line_index)
+    locators = _extract_page_object_locators(content, class_name, line_index)
+    return class_name, methods, locators
+
+
+def extract_methods_from_page_object(file_path: Path, relative_path: str) -> List[PlaywrightMethod]:
+    """Extract methods from a page object file."""
+    parsed = _read_page_object(file_path, relative_path)
+    if parsed is None:
+        return []
+    return _extract_page_object_methods(*parsed)
+
+
+def extract_locators_from_page_object(file_path: Path, relative_path: str):
+    """Extract locator definitions from a page object file."""
+    parsed = _read_page_object(file_path, relative_path)
+    if parsed is None:
+        return None, []
+    return parsed[1], _extract_page_object_locators(*parsed)
 
 
 # ============================================================================
@@ -327,13 +708,27 @@ def extract_locators_from_page_object(file_path: Path, relative_path: str):
 # ============================================================================
 
 class TestDataObject:
-    """Represents a test data object with metadata."""
+    """Represents a test data object with metadata.
+
+    Slotted to keep large projects compact; category is inferred on first
+    access and memoized.
+    """
+
+    __slots__ = ('name', 'file_path', 'raw_value', 'preview', '_category')
 
     def __init__(self, name: str, file_path: str, raw_value: str):
         self.name = name
         self.file_path = file_path
         self.raw_value = raw_value.strip()
-        self.category = self._infer_category()
+        # Set on page copies whose raw_value was cut to a preview: {'url', 'summary'}
+        self.preview: Optional[Dict[str, str]] = None
+        self._category: Optional[str] = None
+
+    @property
+    def category(self) -> str:
+        if self._category is None:
+            self._category = self._infer_category()
+        return self._category
 
     def _infer_category(self) -> str:
         """Infer category from file path dynamically."""
@@ -348,63 +743,523 @@ class TestDataObject:
             folder_name = parts[-2] if parts[-2] != 'data' else parts[-1].replace('.ts', '')
             # Convert folder name to category (e.g., 'loginUser' -> 'login-user-data')
             # Handle camelCase and convert to kebab-case
-            category = re.sub(r'(?<!^)(?=[A-Z])', '-', folder_name).lower()
+            category = _KEBAB_CASE_BOUNDARY_PATTERN.sub('-', folder_name).lower()
             return f'{category}-data'
 
         return 'other-data'
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
-        return {
+        data = {
             'name': self.name,
             'file': self.file_path,
             'raw_value': self.raw_value,
             'category': self.category
         }
+        if self.preview:
+            data['preview'] = self.preview
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'TestDataObject':
+        """Rebuild a data object from the output of to_dict, reusing its category."""
+        data_obj = cls(data['name'], data['file'], data['raw_value'])
+        data_obj._category = data.get('category')
+        return data_obj
+
+
+# Characters read per chunk when streaming data files; a declaration longer
+# than the buffer doubles the next read, so copying it stays linear
+DATA_READ_CHUNK_SIZE = 1 << 20
+
+# A following top-level export ends an initializer written without a semicolon
+_NEXT_EXPORT_PATTERN = re.compile(r'^export\s', re.MULTILINE)
+
+
+def _dedent_value(raw_value: str) -> str:
+    """Strip a raw initializer and remove its common indentation."""
+    # Remove leading and trailing whitespace/newlines
+    raw_value = raw_value.strip()
+
+    # Find minimum indentation (excluding empty lines)
+    lines = raw_value.split('\n')
+    non_empty_lines = [line for line in lines if line.strip()]
+
+    if non_empty_lines:
+        min_indent = min(len(line) - len(line.lstrip()) for line in non_empty_lines)
+        # Remove the minimum indentation from all lines
+        dedented_lines = []
+        for line in lines:
+            if line.strip():  # Non-empty line
+                dedented_lines.append(line[min_indent:] if len(line) > min_indent else line)
+            else:  # Empty line
+                dedented_lines.append('')
+        return '\n'.join(dedented_lines).strip()
+    return raw_value.strip()
+
+
+def iter_data_from_file(file_path: Path, relative_path: str):
+    """Yield data objects from a TypeScript data file as each declaration is found.
+
+    The file is read in chunks and only the unconsumed text (at most the
+    declaration being scanned plus one chunk) is kept, so memory follows the
+    largest single declaration rather than the file size. A value that runs
+    past the buffer keeps its scanner state across reads, so each character
+    is scanned once.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        buffer = ''
+        position = 0
+        at_eof = False
+        # Declaration whose value runs past the buffer: [name, value start, scanner state,
+        # where to look for the next export]
+        pending = None
+
+        while True:
+            # Position to keep the buffer from when a declaration runs past its end
+            incomplete_from = None
+
+            if pending is None:
+                match = EXTRACTION_PATTERNS.search('data_export', buffer, position)
+                if match and (at_eof or match.end() < len(buffer)):
+                    # Skip an optional type annotation, then require the initializer
+                    value_start = match.end()
+                    if buffer.startswith(':', value_start):
+                        value_start = _scan_to(buffer, value_start + 1, '=')
+
+                    if not at_eof and value_start >= len(buffer) - 1:
+                        incomplete_from = match.start()
+                    elif not buffer.startswith('=', value_start):
+                        position = match.end()
+                        continue
+                    else:
+                        pending = [match.group(1), value_start + 1, _ScanState(value_start + 1), value_start + 1]
+                elif match:
+                    incomplete_from = match.start()
+
+            if pending is not None:
+                # Capture everything from = to the first ; outside strings, comments and
+                # nested literals, including newlines and indentation
+                name, value_start, state, export_from = pending
+                next_export = _NEXT_EXPORT_PATTERN.search(buffer, export_from)
+                limit = next_export.start() if next_export else len(buffer)
+                if limit <= state.resume:
+                    value_end = limit
+                else:
+                    value_end = _scan_to(buffer, state.resume, ';', limit, angles=False, state=state)
+                if at_eof or value_end < len(buffer):
+                    yield TestDataObject(name, relative_path, _dedent_value(buffer[value_start:value_end]))
+                    position = value_end
+                    pending = None
+                    continue
+                # An export split by the end of the buffer starts in its last few characters
+                pending[3] = max(value_start, len(buffer) - len('export'))
+                incomplete_from = value_start
+
+            if at_eof:
+                return
+            if incomplete_from is None:
+                # No declaration starts in the buffer; keep just enough for a head split across chunks
+                incomplete_from = max(position, len(buffer) - 256)
+
+            chunk = f.read(max(DATA_READ_CHUNK_SIZE, len(buffer) - incomplete_from))
+            at_eof = not chunk
+            buffer = buffer[incomplete_from:] + chunk
+            position = 0
+            if pending is not None:
+                pending[1] -= incomplete_from
+                pending[2].resume -= incomplete_from
+                pending[3] -= incomplete_from
 
 
 def extract_data_from_file(file_path: Path, relative_path: str) -> List[TestDataObject]:
     """Extract data objects from a TypeScript data file."""
-    data_objects = []
+    return list(iter_data_from_file(file_path, relative_path))
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
 
-    # Pattern to match exported const declarations (both objects and arrays)
-    # Capture everything from = to ; including newlines and indentation
-    export_pattern = re.compile(
-        r'export\s+const\s+(\w+)(?::[^=]+)?\s*=\s*([\s\S]*?);',
-        re.MULTILINE
-    )
+# ============================================================================
+# Incremental Extraction Cache
+# ============================================================================
+
+# Bump when the layout of cached records changes
+CACHE_VERSION = 1
+
+
+def extract_source_file(kind: str, file_path: Path, relative_path: str) -> Dict:
+    """Run the extractors for one source file.
 
-    for match in export_pattern.finditer(content):
-        name = match.group(1)
-        raw_value = match.group(2)
-
-        # Remove leading and trailing whitespace/newlines
-        raw_value = raw_value.strip()
-
-        # Find minimum indentation (excluding empty lines)
-        lines = raw_value.split('\n')
-        non_empty_lines = [line for line in lines if line.strip()]
-
-        if non_empty_lines:
-            min_indent = min(len(line) - len(line.lstrip()) for line in non_empty_lines)
-            # Remove the minimum indentation from all lines
-            dedented_lines = []
-            for line in lines:
-                if line.strip():  # Non-empty line
-                    dedented_lines.append(line[min_indent:] if len(line) > min_indent else line)
-                else:  # Empty line
-                    dedented_lines.append('')
-            raw_value = '\n'.join(dedented_lines).strip()
+    kind is 'helper', 'page_object' or 'data'. The result always has the keys
+    methods, class_name, locators and data so callers can merge it uniformly.
+    A file deleted since it was discovered (as happens under --watch) has no
+    records.
+    """
+    records = {'methods': [], 'class_name': None, 'locators': [], 'data': []}
+
+    try:
+        if kind == 'helper':
+            records['methods'] = extract_methods_from_common_helpers(file_path, relative_path)
+        elif kind == 'page_object':
+            records['class_name'], records['methods'], records['locators'] = parse_page_object(file_path, relative_path)
         else:
-            raw_value = raw_value.strip()
+            records['data'] = extract_data_from_file(file_path, relative_path)
+    except FileNotFoundError:
+        pass
+
+    return records
+
+
+def _hash_file(file_path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _extractor_fingerprint() -> str:
+    """Hash of this script, so cached records are dropped whenever extraction logic changes."""
+    return _hash_file(Path(__file__))
+
+
+@contextmanager
+def atomic_open(path, mode: str = 'w', **kwargs):
+    """Open a temporary file next to path and move it over path when the block succeeds.
+
+    Readers, such as a publish step or an agent refreshing its copy, see either
+    the previous file or the complete new one, never a partially written file.
+    """
+    path = Path(path)
+    temp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        with open(temp_path, mode, **kwargs) as f:
+            yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+class ExtractionCache:
+    """Persistent JSON sidecar mapping source files to their extracted records.
+
+    Entries are keyed by relative path and validated by mtime and size first.
+    When those differ (e.g. on a fresh CI checkout) the content hash decides,
+    so only files whose content actually changed are extracted again.
+    """
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self.fingerprint = _extractor_fingerprint()
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._seen = set()
+        self._digests: Dict[str, str] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if payload.get('version') == CACHE_VERSION and payload.get('extractor') == self.fingerprint:
+            self.entries = payload.get('files', {})
+
+    def get(self, kind: str, file_path: Path, relative_path: str) -> Optional[Dict]:
+        """Return cached records for an unchanged file, or None if it must be extracted."""
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            # Deleted since discovery: a miss, and its entry is dropped on save
+            self.misses += 1
+            return None
+        self._seen.add(relative_path)
+        entry = self.entries.get(relative_path)
+
+        if entry and entry['kind'] == kind:
+            if entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                self.hits += 1
+                return _records_from_cache(entry['records'])
+
+            digest = _hash_file(file_path)
+            self._digests[relative_path] = digest
+            if entry['sha256'] == digest:
+                entry['mtime_ns'] = stat.st_mtime_ns
+                entry['size'] = stat.st_size
+                self.hits += 1
+                return _records_from_cache(entry['records'])
+
+        self.misses += 1
+        return None
+
+    def put(self, kind: str, file_path: Path, relative_path: str, records: Dict):
+        """Store freshly extracted records for a file (unless it was deleted in the meantime)."""
+        try:
+            stat = file_path.stat()
+            digest = self._digests.pop(relative_path, None) or _hash_file(file_path)
+        except FileNotFoundError:
+            return
+        self._seen.add(relative_path)
+        self.entries[relative_path] = {
+            'kind': kind,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': digest,
+            'records': _records_to_cache(records),
+        }
+
+    def save(self):
+        """Write the cache, dropping entries for files that no longer exist."""
+        files = {path: entry for path, entry in sorted(self.entries.items()) if path in self._seen}
+        payload = {'version': CACHE_VERSION, 'extractor': self.fingerprint, 'files': files}
+        with atomic_open(self.cache_file, encoding='utf-8') as f:
+            json.dump(payload, f, separators=(',', ':'))
+
+
+def _records_to_cache(records: Dict) -> Dict:
+    return {
+        'methods': [m.to_dict() for m in records['methods']],
+        'class_name': records['class_name'],
+        'locators': [locator.to_dict() for locator in records['locators']],
+        'data': [d.to_dict() for d in records['data']],
+    }
+
+
+def _records_from_cache(cached: Dict) -> Dict:
+    return {
+        'methods': [PlaywrightMethod.from_dict(m) for m in cached['methods']],
+        'class_name': cached['class_name'],
+        'locators': [LocatorDefinition.from_dict(locator) for locator in cached['locators']],
+        'data': [TestDataObject.from_dict(d) for d in cached['data']],
+    }
+
+
+# ============================================================================
+# Profiling (--profile)
+# ============================================================================
+
+# The extractor function behind each kind of source file, as named in reports
+EXTRACTOR_NAMES = {
+    'helper': 'extract_methods_from_common_helpers',
+    'page_object': 'parse_page_object',
+    'data': 'extract_data_from_file',
+}
+
+# Number of slowest files listed in the profile report
+PROFILE_SLOWEST_FILES = 10
+
+
+def profiled_extract_source_file(kind: str, file_path: Path, relative_path: str):
+    """Run extract_source_file and return (records, measurements) for the profile.
+
+    Module-level so it can run in extraction worker processes; perf_counter is
+    system-wide, so worker start times line up with the main process.
+    """
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    records = extract_source_file(kind, file_path, relative_path)
+    stats = {
+        'start': started,
+        'wall': time.perf_counter() - started,
+        'cpu': time.process_time() - cpu_started,
+        'bytes': file_path.stat().st_size,
+        'matches': len(records['methods']) + len(records['locators']) + len(records['data']),
+        'pid': os.getpid(),
+    }
+    return records, stats
+
+
+class Profiler:
+    """Wall and CPU time of each stage of a run plus per-file extraction measurements."""
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.origin = time.perf_counter()
+        self.stages: List[tuple] = []  # (name, start, wall, cpu)
+        self.files: List[tuple] = []   # (kind, relative_path, stats)
+        self.cached: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the body of a with block as one stage."""
+        started = time.perf_counter()
+        cpu_started = time.process_time()
+        try:
+            yield
+        finally:
+            self.add_stage(name, started, time.perf_counter() - started, time.process_time() - cpu_started)
+
+    def add_stage(self, name: str, started: float, wall: float, cpu: float):
+        self.stages.append((name, started, wall, cpu))
+
+    def record_file(self, kind: str, relative_path: str, stats: Dict):
+        self.files.append((kind, relative_path, stats))
+
+    def record_cached(self, kind: str):
+        self.cached[kind] = self.cached.get(kind, 0) + 1
+
+    def report(self):
+        """Print stage timings, per-extractor totals and the slowest files."""
+        print("\nProfile (CPU is this process only; extraction workers are counted per file):")
+        print(f"   {'Stage':<28} {'Wall ms':>10} {'CPU ms':>10}")
+        for name, _, wall, cpu in sorted(self.stages, key=lambda stage: stage[1]):
+            print(f"   {name:<28} {wall * 1000:>10.1f} {cpu * 1000:>10.1f}")
+
+        print(f"\n   {'Extractor':<36} {'Files':>6} {'Cached':>6} {'KB read':>10} {'Matches':>8} {'Wall ms':>10} {'CPU ms':>10}")
+        for kind, function_name in EXTRACTOR_NAMES.items():
+            measured = [stats for file_kind, _, stats in self.files if file_kind == kind]
+            print(
+                f"   {function_name:<36} {len(measured):>6} {self.cached.get(kind, 0):>6} "
+                f"{sum(stats['bytes'] for stats in measured) / 1024:>10.1f} "
+                f"{sum(stats['matches'] for stats in measured):>8} "
+                f"{sum(stats['wall'] for stats in measured) * 1000:>10.1f} "
+                f"{sum(stats['cpu'] for stats in measured) * 1000:>10.1f}"
+            )
+
+        slowest = sorted(self.files, key=lambda item: item[2]['wall'], reverse=True)[:PROFILE_SLOWEST_FILES]
+        if slowest:
+            print(f"\n   Slowest files:")
+            for kind, relative_path, stats in slowest:
+                print(f"   {stats['wall'] * 1000:>10.1f} ms  {relative_path} "
+                      f"({stats['matches']} matches, {stats['bytes'] / 1024:.1f} KB)")
+
+    def write_chrome_trace(self, trace_path: Path):
+        """Write the stages and file extractions as Chrome trace events (chrome://tracing, Perfetto)."""
+        def micros(seconds: float) -> float:
+            return round(seconds * 1_000_000, 1)
+
+        events = [
+            {'name': name, 'cat': 'stage', 'ph': 'X', 'pid': self.pid, 'tid': self.pid,
+             'ts': micros(started - self.origin), 'dur': micros(wall), 'args': {'cpu_ms': round(cpu * 1000, 3)}}
+            for name, started, wall, cpu in self.stages
+        ]
+        events += [
+            {'name': relative_path, 'cat': EXTRACTOR_NAMES[kind], 'ph': 'X', 'pid': self.pid, 'tid': stats['pid'],
+             'ts': micros(stats['start'] - self.origin), 'dur': micros(stats['wall']),
+             'args': {'bytes': stats['bytes'], 'matches': stats['matches'], 'cpu_ms': round(stats['cpu'] * 1000, 3)}}
+            for kind, relative_path, stats in self.files
+        ]
+        with open(trace_path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+# ============================================================================
+# Source Discovery and Extraction
+# ============================================================================
+
+def resolve_directory(project_root: Path, dir_path: str) -> Path:
+    """Resolve directory path - can be absolute or relative to project root."""
+    path = Path(dir_path)
+    if path.is_absolute():
+        return path
+    else:
+        return project_root / dir_path
+
+
+def discover_source_files(project_root: Path) -> List[tuple]:
+    """List (kind, file_path, relative_path) for every file to extract, in output order."""
+    sources = []
+
+    # helpers/*.ts files
+    helpers_dir = resolve_directory(project_root, HELPERS_DIR)
+    if helpers_dir.exists():
+        for ts_file in sorted(helpers_dir.glob('*.ts')):
+            # Create relative path for display - always show the configured directory structure
+            relative_path = f'{HELPERS_DIR}/{ts_file.name}' if not Path(HELPERS_DIR).is_absolute() else str(ts_file)
+            sources.append(('helper', ts_file, relative_path))
+
+    # page-objects/*.ts files
+    page_objects_dir = resolve_directory(project_root, PAGE_OBJECTS_DIR)
+    if page_objects_dir.exists():
+        for ts_file in sorted(page_objects_dir.glob('*.ts')):
+            if ts_file.name in EXCLUDED_PAGE_OBJECTS:
+                continue
+            # Create relative path for display - always show the configured directory structure
+            relative_path = f'{PAGE_OBJECTS_DIR}/{ts_file.name}' if not Path(PAGE_OBJECTS_DIR).is_absolute() else str(ts_file)
+            sources.append(('page_object', ts_file, relative_path))
+
+    # data/**/*.ts files
+    data_dir = resolve_directory(project_root, DATA_DIR)
+    if data_dir.exists():
+        ts_files = [f for f in data_dir.rglob('*.ts') if f.name not in EXCLUDED_DATA_FILES]
+        for ts_file in sorted(ts_files):
+            # Create relative path for display
+            if Path(DATA_DIR).is_absolute():
+                relative_path = str(ts_file)
+            else:
+                relative_path = str(ts_file.relative_to(project_root)).replace('\\', '/')
+            sources.append(('data', ts_file, relative_path))
+
+    return sources
+
+
+def extract_source_files(sources: List[tuple], cache: Optional[ExtractionCache] = None, jobs: int = 1,
+                         profiler: Optional[Profiler] = None) -> List[Dict]:
+    """Extract records for every source file, returned in the same order as sources.
+
+    Files found unchanged in the cache are reused. The rest are extracted
+    serially, or spread across a process pool when jobs > 1; results are
+    always collected back in source order so the output stays deterministic.
+    With a profiler, every extracted file is measured and recorded.
+    """
+    results: List[Optional[Dict]] = [None] * len(sources)
+    pending = []
+    for index, (kind, file_path, relative_path) in enumerate(sources):
+        if cache is not None:
+            results[index] = cache.get(kind, file_path, relative_path)
+        if results[index] is None:
+            pending.append(index)
+        elif profiler is not None:
+            profiler.record_cached(kind)
+
+    extract = extract_source_file if profiler is None else profiled_extract_source_file
+
+    def collect(index: int, extracted):
+        if profiler is not None:
+            extracted, stats = extracted
+            profiler.record_file(sources[index][0], sources[index][2], stats)
+        results[index] = extracted
+
+    if jobs > 1 and len(pending) > 1:
+        kinds, file_paths, relative_paths = zip(*(sources[index] for index in pending))
+        chunksize = max(1, len(pending) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            extracted = executor.map(extract, kinds, file_paths, relative_paths, chunksize=chunksize)
+            for index, records in zip(pending, extracted):
+                collect(index, records)
+    else:
+        for index in pending:
+            collect(index, extract(*sources[index]))
+
+    if cache is not None:
+        for index in pending:
+            cache.put(*sources[index], results[index])
+
+    return results
+
+
+def merge_records(sources: List[tuple], results: List[Dict], verbose: bool = False):
+    """Merge per-file records, in source order, into (all_methods, locators_by_class, all_data)."""
+    all_methods = []
+    locators_by_class: Dict[str, List[LocatorDefinition]] = {}
+    all_data = []
 
-        data_obj = TestDataObject(name, relative_path, raw_value)
-        data_objects.append(data_obj)
+    for (kind, ts_file, relative_path), records in zip(sources, results):
+        if records['methods']:
+            if verbose:
+                print(f"   FOUND Methods: {ts_file.name}: {len(records['methods'])} methods")
+            all_methods.extend(records['methods'])
+        if records['class_name']:
+            locators_by_class[records['class_name']] = records['locators']
+        if records['data']:
+            if verbose:
+                print(f"   FOUND Data: {relative_path}: {len(records['data'])} data object(s)")
+            all_data.extend(records['data'])
 
-    return data_objects
+    return all_methods, locators_by_class, all_data
 
 
 # ============================================================================
@@ -412,129 +1267,1854 @@ def extract_data_from_file(file_path: Path, relative_path: str) -> List[TestData
 # ============================================================================
 
 
-def generate_combined_html(
-    all_methods: List[PlaywrightMethod],
-    all_data: List[TestDataObject],
-    locators_by_class: Dict[str, List[LocatorDefinition]],
-    output_file: str = 'DATA_METHODS_REFERENCE.html'
-):
-    """Generate combined HTML documentation with tabs for methods and data."""
+def _iter_json_array(records, indent: int):
+    """Yield a JSON array of records one item at a time.
+
+    The text is identical to json.dumps([r.to_dict() for r in records], indent=indent)
+    without materializing the full list or string.
+    """
+    pad = ' ' * indent
+    empty = True
+    for record in records:
+        item = json.dumps(record.to_dict(), indent=indent).replace('\n', '\n' + pad)
+        yield ('[\n' if empty else ',\n') + pad + item
+        empty = False
+    yield '[]' if empty else '\n]'
+
+
+def _iter_definitions(all_methods, all_locators, all_data):
+    """Yield the script declarations of methodDefinitions, locatorDefinitions and dataDefinitions."""
+    yield """
+        // Methods data
+        const methodDefinitions = """
+    yield from _iter_json_array(all_methods, indent=2)
+    yield """;
+
+        // Locator data
+        const locatorDefinitions = """
+    yield from _iter_json_array(all_locators, indent=2)
+    yield """;
+
+        // Data definitions
+        const dataDefinitions = """
+    yield from _iter_json_array(all_data, indent=8)
+    yield """;
+"""
+
+
+# Fields stored as indexes into the shared string table ('str'), or as
+# [path index, line] pairs ('loc'), in compact output. Other fields are inlined.
+COMPACT_FIELD_CODECS = {
+    'class_name': 'str',
+    'return_type': 'str',
+    'method_type': 'str',
+    'purpose': 'str',
+    'file': 'str',
+    'category': 'str',
+    'location': 'loc',
+}
+
+
+class StringTable:
+    """Interns repeated strings so compact payloads can refer to them by index."""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+def _compact_fields(records) -> List[List[str]]:
+    """Return the [key, codec] pairs describing each row of a compact payload.
+
+    Optional keys (such as a data preview) that only some records carry are
+    included too; rows without them store null, which expands to no key.
+    """
+    keys = dict.fromkeys(key for record in records for key in record.to_dict())
+    return [[key, COMPACT_FIELD_CODECS.get(key, 'raw')] for key in keys]
+
+
+def _encode_compact_row(record: Dict, fields: List[List[str]], strings: StringTable) -> List:
+    row = []
+    for key, codec in fields:
+        value = record.get(key)
+        if codec == 'str':
+            row.append(strings.add(value))
+        elif codec == 'loc':
+            path, _, line = value.rpartition(':')
+            row.append([strings.add(path), int(line)])
+        else:
+            row.append(value)
+    return row
+
+
+def _iter_compact_definitions(all_methods, all_locators, all_data):
+    """Yield the definition declarations as minified, string-interned payloads.
+
+    Repeated values such as class names, file paths and method types are
+    stored once in referenceStrings; expandDefinitions() rebuilds the same
+    objects as the regular output when the page loads.
+    """
+    groups = [
+        ('Methods data', 'methodDefinitions', all_methods),
+        ('Locator data', 'locatorDefinitions', all_locators),
+        ('Data definitions', 'dataDefinitions', all_data),
+    ]
+
+    # The table has to be declared before the payloads that reference it,
+    # so intern every string first and encode the rows afterwards.
+    strings = StringTable()
+    for _, _, records in groups:
+        fields = _compact_fields(records)
+        for record in records:
+            _encode_compact_row(record.to_dict(), fields, strings)
+
+    yield """
+        // Expand compact definitions back into plain objects
+        function expandDefinitions(payload) {
+            return payload.rows.map(row => {
+                const record = {};
+                payload.fields.forEach(([key, codec], i) => {
+                    const value = row[i];
+                    if (codec === 'str') {
+                        record[key] = referenceStrings[value];
+                    } else if (codec === 'loc') {
+                        record[key] = referenceStrings[value[0]] + ':' + value[1];
+                    } else if (value !== null) {
+                        record[key] = value;
+                    }
+                });
+                return record;
+            });
+        }
+
+        // Shared string table
+        const referenceStrings = """
+    yield json.dumps(strings.strings, separators=(',', ':'))
+    yield ';\n'
 
-    # Process methods
-    page_methods = [m for m in all_methods if m.method_type == "page_object"]
+    for comment, name, records in groups:
+        fields = _compact_fields(records)
+        yield f"""
+        // {comment}
+        const {name} = expandDefinitions({{"fields":{json.dumps(fields, separators=(',', ':'))},"rows":["""
+        for index, record in enumerate(records):
+            row = json.dumps(_encode_compact_row(record.to_dict(), fields, strings), separators=(',', ':'))
+            yield row if index == 0 else ',' + row
+        yield ']});\n'
+
+
+def group_methods_by_class(all_methods: List[PlaywrightMethod]) -> Dict[str, List[PlaywrightMethod]]:
+    """Group page object methods by class name, keeping source order."""
     methods_by_class = {}
-    for method in page_methods:
+    for method in all_methods:
+        if method.method_type != "page_object":
+            continue
         if method.class_name not in methods_by_class:
             methods_by_class[method.class_name] = []
         methods_by_class[method.class_name].append(method)
-    methods_json = [m.to_dict() for m in all_methods]
-    locator_json = []
-    for locator_list in locators_by_class.values():
-        locator_json.extend([locator.to_dict() for locator in locator_list])
+    return methods_by_class
+
 
-    # Process data
+def group_data_by_category(all_data: List[TestDataObject]) -> Dict[str, List[TestDataObject]]:
+    """Group data objects by category, keeping source order."""
     data_by_category = {}
     for data_obj in all_data:
         if data_obj.category not in data_by_category:
             data_by_category[data_obj.category] = []
         data_by_category[data_obj.category].append(data_obj)
-    data_json = [d.to_dict() for d in all_data]
+    return data_by_category
 
-    def get_display_name(category: str) -> str:
-        """Convert category key to display name."""
-        if category == 'constants':
-            return 'Constants'
-        name = category.replace('-data', '').replace('-', ' ').title()
-        return f'{name} Data' if not category == 'constants' else name
 
-    def sort_categories(categories):
-        """Sort categories with 'constants' first, then alphabetically."""
-        sorted_cats = sorted(categories)
-        if 'constants' in sorted_cats:
-            sorted_cats.remove('constants')
-            sorted_cats.insert(0, 'constants')
-        return sorted_cats
+# ============================================================================
+# Search Index
+# ============================================================================
 
-    sorted_categories = sort_categories(data_by_category.keys())
-    total_locators = sum(len(locs) for locs in locators_by_class.values())
+# Page search weights: (record field, score when it contains the whole query,
+# score per query word longer than two characters that it contains)
+METHOD_SEARCH_FIELDS = [('method_name', 100, 20), ('class_name', 80, 15), ('purpose', 50, 10)]
+LOCATOR_SEARCH_FIELDS = [('property_name', 100, 20), ('class_name', 70, 15), ('assignment', 60, 10)]
+DATA_SEARCH_FIELDS = [('name', 100, 0), ('file', 50, 0), ('raw_value', 30, 0)]
+
+# Score for every method parameter whose name contains the query:
+# (match name, weight, record list field, name of the item field)
+METHOD_PARAM_FIELD = ('parameter', 30, 'parsed_params', 'name')
+
+# Fields too long to index by trigram (a data value can be megabytes); they are
+# kept out of the posting lists and scanned for the records those do not yield
+UNINDEXED_SEARCH_FIELDS = {'raw_value'}
+
+
+def _search_text(value: str) -> str:
+    """Lowercase a field and express it in UTF-16 code units, matching JavaScript string indexing."""
+    value = value.lower()
+    if value.isascii() or all(ord(char) < 0x10000 for char in value):
+        return value
+    return ''.join(
+        char if ord(char) < 0x10000 else
+        chr(0xD800 + ((ord(char) - 0x10000) >> 10)) + chr(0xDC00 + ((ord(char) - 0x10000) & 0x3FF))
+        for char in value
+    )
 
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Page Methods, Locators & Test Data Reference for AI Test Case Generation</title>
-    <style>
-        :root {{
-            --primary-color: #2196F3;
-            --primary-dark: #1565C0;
-            --primary-rgb: 33, 150, 243;
-        }}
 
-        body.theme-purple {{
-            --primary-color: #667eea;
-            --primary-dark: #764ba2;
-            --primary-rgb: 102, 126, 234;
-        }}
+class SearchIndex:
+    """Pre-lowercased search fields plus a trigram inverted index for one corpus.
+
+    A record can only contain a query (or query word) of three or more
+    characters if it contains every trigram of it, so intersecting the
+    trigram posting lists yields a small candidate set to score. Fields
+    marked 'scan' are left out of the posting lists; a query also scans them
+    for the records the posting lists do not yield.
+    """
+
+    def __init__(self, fields: List[Dict], docs: List[List]):
+        self.fields = fields
+        self.docs = docs
+        self.scanned = [position for position, field in enumerate(fields) if field.get('scan')]
+        self.postings: Dict[str, List[int]] = {}
+        for doc_id, values in enumerate(docs):
+            grams = set()
+            for field, value in zip(fields, values):
+                if field.get('scan'):
+                    continue
+                for text in (value if isinstance(value, list) else [value]):
+                    grams.update(text[i:i + 3] for i in range(len(text) - 2))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(doc_id)
+
+    @classmethod
+    def from_records(cls, records: List[Dict], weights, multi_field=None):
+        """Build an index over record dicts; multi_field is (name, weight, list key, item key) for list-valued fields."""
+        fields = [
+            {'match': name, 'key': name, 'weight': weight, 'wordWeight': word_weight}
+            for name, weight, word_weight in weights
+        ]
+        for field in fields:
+            if field['key'] in UNINDEXED_SEARCH_FIELDS:
+                field['scan'] = True
+        if multi_field:
+            name, weight, key, item = multi_field
+            fields.append({'match': name, 'key': key, 'item': item, 'weight': weight, 'wordWeight': 0})
+        docs = []
+        for record in records:
+            doc = [_search_text(record[name]) for name, _, _ in weights]
+            if multi_field:
+                doc.append([_search_text(value[multi_field[3]]) for value in record[multi_field[2]]])
+            docs.append(doc)
+        return cls(fields, docs)
+
+    def _term_candidates(self, term: str) -> set:
+        """Ids of the records that contain every trigram of term."""
+        lists = []
+        for i in range(len(term) - 2):
+            doc_ids = self.postings.get(term[i:i + 3])
+            if doc_ids is None:
+                return set()
+            lists.append(doc_ids)
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        for doc_ids in lists[1:]:
+            candidates.intersection_update(doc_ids)
+        return candidates
+
+    def _scan_matches(self, doc_id: int, query_lower: str, words: List[str]) -> bool:
+        """Whether a scanned field of the record contains the query, or a word where words count."""
+        doc = self.docs[doc_id]
+        for position in self.scanned:
+            terms = [query_lower] + words if self.fields[position]['wordWeight'] else [query_lower]
+            if any(term in doc[position] for term in terms):
+                return True
+        return False
+
+    def search(self, query: str, limit: int = 0) -> tuple:
+        """Return ([(doc id, score, matched fields)] best first, match count), as scoreDocuments does in the page.
+
+        With a limit only the best limit results are kept.
+        """
+        query_lower = _search_text(query)
+        words = [word for word in query_lower.split() if len(word) > 2]
+
+        if len(query_lower) < 3:
+            candidates = range(len(self.docs))
+        else:
+            ids = self._term_candidates(query_lower)
+            if any(field['wordWeight'] for field in self.fields):
+                for word in words:
+                    ids |= self._term_candidates(word)
+            if self.scanned:
+                ids.update(doc_id for doc_id in range(len(self.docs))
+                           if doc_id not in ids and self._scan_matches(doc_id, query_lower, words))
+            candidates = sorted(ids)
+
+        results = []
+        for doc_id in candidates:
+            score = 0
+            matches = []
+            for field, value in zip(self.fields, self.docs[doc_id]):
+                if 'item' in field:
+                    for item in value:
+                        if query_lower in item:
+                            score += field['weight']
+                            matches.append(field['match'])
+                    continue
+                if query_lower in value:
+                    score += field['weight']
+                    matches.append(field['match'])
+                if field['wordWeight']:
+                    score += field['wordWeight'] * sum(1 for word in words if word in value)
+            if score > 0:
+                results.append((doc_id, score, matches))
+
+        total = len(results)
+        if limit and limit < total:
+            return heapq.nsmallest(limit, results, key=lambda result: (-result[1], result[0])), total
+        results.sort(key=lambda result: -result[1])
+        return results, total
+
+    def iter_json(self, docs: bool = False):
+        """Yield the index as JSON, one posting list at a time, with delta-encoded posting lists.
+
+        The page lowercases the fields from its definitions, so the documents
+        are only included with docs=True, for pages that do not hold them.
+        """
+        yield '{"fields":' + json.dumps(self.fields, separators=(',', ':'))
+        yield ',"useWords":' + json.dumps(any(field['wordWeight'] for field in self.fields))
+        if docs:
+            yield ',"docs":'
+            yield from _iter_compact_array(self.docs)
+        yield ',"grams":{'
+        for position, gram in enumerate(sorted(self.postings)):
+            previous = 0
+            deltas = []
+            for doc_id in self.postings[gram]:
+                deltas.append(doc_id - previous)
+                previous = doc_id
+            yield ('' if position == 0 else ',') + json.dumps(gram) + ':' + json.dumps(deltas, separators=(',', ':'))
+        yield '}}'
+
+
+def _iter_compact_array(items):
+    """Yield a minified JSON array one item at a time."""
+    yield '['
+    for position, item in enumerate(items):
+        yield ('' if position == 0 else ',') + json.dumps(item, separators=(',', ':'))
+    yield ']'
+
+
+def build_search_indexes(method_records, locator_records, data_records) -> Dict[str, SearchIndex]:
+    """Build the methods, locators and data search indexes from record dicts."""
+    return {
+        'methods': SearchIndex.from_records(method_records, METHOD_SEARCH_FIELDS, METHOD_PARAM_FIELD),
+        'locators': SearchIndex.from_records(locator_records, LOCATOR_SEARCH_FIELDS),
+        'data': SearchIndex.from_records(data_records, DATA_SEARCH_FIELDS),
+    }
+
+
+def iter_search_index(all_methods, all_locators, all_data, docs: bool = False):
+    """Yield the serialized methods, locators and data search indexes as one JSON object."""
+    indexes = build_search_indexes(
+        [m.to_dict() for m in all_methods],
+        [locator.to_dict() for locator in all_locators],
+        [d.to_dict() for d in all_data],
+    )
+    for position, (key, index) in enumerate(indexes.items()):
+        yield ('{' if position == 0 else ',') + json.dumps(key) + ':'
+        yield from index.iter_json(docs)
+    yield '}'
+
+
+# Scores search queries against a serialized SearchIndex
+SEARCH_SCRIPT = """
+        // Indexed search: trigram posting lists narrow the candidates, scored against lowercased fields
+        const decodedPostings = new WeakMap();
+
+        // The searched fields of each record, in index field order
+        function searchFieldValues(index, records) {
+            return records.map(record => index.fields.map(field => field.item
+                ? record[field.key].map(item => item[field.item])
+                : record[field.key]));
+        }
 
-        body.theme-blue {{
-            --primary-color: #2196F3;
-            --primary-dark: #1565C0;
-            --primary-rgb: 33, 150, 243;
-        }}
+        // The index ships without its documents; they are lowercased once from the records
+        function attachDocuments(index, values) {
+            index.docs = values.map(doc => doc.map(value => Array.isArray(value)
+                ? value.map(item => item.toLowerCase())
+                : value.toLowerCase()));
+        }
 
-        body.theme-green {{
-            --primary-color: #4CAF50;
-            --primary-dark: #2E7D32;
-            --primary-rgb: 76, 175, 80;
-        }}
+        function postingList(index, gram) {
+            if (!decodedPostings.has(index)) {
+                decodedPostings.set(index, new Map());
+            }
+            const cache = decodedPostings.get(index);
+            if (!cache.has(gram)) {
+                const deltas = index.grams[gram];
+                let list = null;
+                if (deltas) {
+                    list = new Array(deltas.length);
+                    let id = 0;
+                    deltas.forEach((delta, i) => {
+                        id += delta;
+                        list[i] = id;
+                    });
+                }
+                cache.set(gram, list);
+            }
+            return cache.get(gram);
+        }
 
-        body.theme-light {{
-            --primary-color: #607D8B;
-            --primary-dark: #455A64;
-            --primary-rgb: 96, 125, 139;
-        }}
+        function intersectSorted(a, b) {
+            const result = [];
+            let i = 0;
+            let j = 0;
+            while (i < a.length && j < b.length) {
+                if (a[i] === b[j]) {
+                    result.push(a[i]);
+                    i++;
+                    j++;
+                } else if (a[i] < b[j]) {
+                    i++;
+                } else {
+                    j++;
+                }
+            }
+            return result;
+        }
 
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
+        // Ids of the records that contain every trigram of the term
+        function termCandidates(index, term) {
+            const lists = [];
+            for (let i = 0; i + 3 <= term.length; i++) {
+                const list = postingList(index, term.substring(i, i + 3));
+                if (!list) {
+                    return [];
+                }
+                lists.push(list);
+            }
+            lists.sort((a, b) => a.length - b.length);
+            return lists.reduce((result, list) => result.length === 0 ? result : intersectSorted(result, list));
+        }
 
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background-color: #f8f9fa;
-        }}
+        function candidateIds(index, queryLower, words) {
+            if (queryLower.length < 3) {
+                return index.docs.map((doc, id) => id);
+            }
+            const ids = new Set(termCandidates(index, queryLower));
+            if (index.useWords) {
+                words.forEach(word => termCandidates(index, word).forEach(id => ids.add(id)));
+            }
+            return Array.from(ids).sort((a, b) => a - b);
+        }
 
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
+        // Best first: higher score, then lower id, the order a stable sort by score gives
+        function ranksBefore(a, b) {
+            return a.score > b.score || (a.score === b.score && a.id < b.id);
+        }
 
-        .header {{
-            background: linear-gradient(135deg, var(--primary-color) 0%, var(--primary-dark) 100%);
-            color: white;
-            padding: 20px 0;
-            margin-bottom: 20px;
-            border-radius: 12px;
-            text-align: center;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-            position: relative;
-        }}
+        // Bounded heap of the best results so far, with the worst one kept at the root
+        function pushBounded(heap, result, limit) {
+            if (heap.length < limit) {
+                heap.push(result);
+                let i = heap.length - 1;
+                while (i > 0) {
+                    const parent = (i - 1) >> 1;
+                    if (!ranksBefore(heap[parent], heap[i])) break;
+                    [heap[parent], heap[i]] = [heap[i], heap[parent]];
+                    i = parent;
+                }
+            } else if (ranksBefore(result, heap[0])) {
+                heap[0] = result;
+                let i = 0;
+                while (true) {
+                    let worst = i;
+                    [2 * i + 1, 2 * i + 2].forEach(child => {
+                        if (child < heap.length && ranksBefore(heap[worst], heap[child])) worst = child;
+                    });
+                    if (worst === i) break;
+                    [heap[worst], heap[i]] = [heap[i], heap[worst]];
+                    i = worst;
+                }
+            }
+        }
 
-        .header h1 {{
-            font-size: 2.5rem;
-            margin-bottom: 10px;
-            font-weight: 300;
-        }}
+        // Recent queries per index with the ids they matched, least recently used first
+        const QUERY_CACHE_SIZE = 20;
+        const queryCaches = new WeakMap();
 
-        .header p {{
-            font-size: 1.1rem;
-            opacity: 0.9;
-            margin-bottom: 5px;
+        function queryCache(index) {
+            if (!queryCaches.has(index)) {
+                queryCaches.set(index, new Map());
+            }
+            return queryCaches.get(index);
+        }
+
+        // Whether every match of queryLower also matched the cached query. Extending a query only
+        // lengthens the full query and its last word, unless the extension starts a new word or
+        // the last word reaches the three characters it needs to count as a word on its own.
+        function narrows(index, cached, queryLower) {
+            if (!queryLower.startsWith(cached)) {
+                return false;
+            }
+            if (!index.useWords) {
+                return true;
+            }
+            if (/\\s/.test(queryLower.substring(cached.length))) {
+                return false;
+            }
+            const lastWord = cached.split(/\\s+/).pop();
+            return lastWord.length > 2 || lastWord === cached;
+        }
+
+        // Ids matched by the longest cached query that queryLower narrows, or null
+        function cachedCandidates(index, queryLower) {
+            const cache = queryCache(index);
+            let best = null;
+            cache.forEach((ids, cached) => {
+                if ((best === null || cached.length > best.length) && narrows(index, cached, queryLower)) {
+                    best = cached;
+                }
+            });
+            if (best === null) {
+                return null;
+            }
+            const ids = cache.get(best);
+            cache.delete(best);
+            cache.set(best, ids);
+            return ids;
+        }
+
+        function cacheMatches(index, queryLower, ids) {
+            const cache = queryCache(index);
+            cache.delete(queryLower);
+            cache.set(queryLower, Int32Array.from(ids));
+            if (cache.size > QUERY_CACHE_SIZE) {
+                cache.delete(cache.keys().next().value);
+            }
+        }
+
+        // Whether a field kept out of the posting lists (field.scan) contains the query, or a word where words count
+        function scanMatches(search, doc) {
+            return search.index.fields.some((field, f) => field.scan && (doc[f].includes(search.queryLower)
+                || (field.wordWeight > 0 && search.words.some(word => doc[f].includes(word)))));
+        }
+
+        // A search scores its candidates in steps, so the worker can stop it between steps.
+        // Unless the candidates come from a cached query, the steps then scan the fields kept out
+        // of the posting lists in every record the candidates leave out.
+        function startSearch(index, query, limit) {
+            const queryLower = query.toLowerCase();
+            const words = queryLower.split(/\\s+/).filter(word => word.length > 2);
+            const cached = cachedCandidates(index, queryLower);
+            const candidates = cached || candidateIds(index, queryLower, words);
+            const scan = !cached && queryLower.length >= 3 && index.fields.some(field => field.scan);
+            return {
+                index: index,
+                queryLower: queryLower,
+                words: words,
+                limit: limit,
+                candidates: candidates,
+                candidateSet: scan ? new Set(candidates) : null,
+                steps: candidates.length + (scan ? index.docs.length : 0),
+                next: 0,
+                results: [],
+                matched: [],
+                total: 0,
+            };
+        }
+
+        function scoreCandidates(search, count) {
+            const index = search.index;
+            const queryLower = search.queryLower;
+            const end = Math.min(search.next + count, search.steps);
+
+            for (; search.next < end; search.next++) {
+                let id = search.candidates[search.next];
+                if (search.next >= search.candidates.length) {
+                    id = search.next - search.candidates.length;
+                    if (search.candidateSet.has(id) || !scanMatches(search, index.docs[id])) {
+                        continue;
+                    }
+                }
+                const doc = index.docs[id];
+                let score = 0;
+                const matches = [];
+
+                index.fields.forEach((field, f) => {
+                    const value = doc[f];
+                    if (field.item) {
+                        value.forEach(item => {
+                            if (item.includes(queryLower)) {
+                                score += field.weight;
+                                matches.push(field.match);
+                            }
+                        });
+                        return;
+                    }
+                    if (value.includes(queryLower)) {
+                        score += field.weight;
+                        matches.push(field.match);
+                    }
+                    if (field.wordWeight) {
+                        search.words.forEach(word => {
+                            if (value.includes(word)) score += field.wordWeight;
+                        });
+                    }
+                });
+
+                if (score > 0) {
+                    search.total++;
+                    search.matched.push(id);
+                    if (search.limit) {
+                        pushBounded(search.results, { id: id, score: score, matches: matches }, search.limit);
+                    } else {
+                        search.results.push({ id: id, score: score, matches: matches });
+                    }
+                }
+            }
+            return search.next >= search.steps;
+        }
+
+        function finishSearch(search) {
+            cacheMatches(search.index, search.queryLower, search.matched);
+            search.results.sort((a, b) => ranksBefore(a, b) ? -1 : 1);
+            return { results: search.results, total: search.total };
+        }
+
+        // Returns the best `limit` results (all of them without a limit) ranked, plus the number of matches
+        function scoreDocuments(index, query, limit) {
+            const search = startSearch(index, query, limit);
+            scoreCandidates(search, search.steps);
+            return finishSearch(search);
+        }
+"""
+
+
+# ============================================================================
+# Search Result Rendering
+# ============================================================================
+
+# Builds search result tables from cloned row templates, one page of rows at a time
+SEARCH_RESULTS_SCRIPT = """
+        // Searches keep only the best SEARCH_RESULT_LIMIT matches; tables show SEARCH_PAGE_SIZE more rows per scroll
+        const SEARCH_RESULT_LIMIT = 500;
+        const SEARCH_PAGE_SIZE = 50;
+
+        const SEARCH_TEMPLATE_MARKUP = {
+            methodTable: `
+                <h4 class="search-section-title" data-field="title"></h4>
+                <div class="table-wrapper">
+                    <table class="steps-table">
+                        <thead>
+                            <tr>
+                                <th style="width: 50%; text-align: left;">Method</th>
+                                <th style="width: 25%;">Parameters</th>
+                                <th style="width: 25%;">Purpose</th>
+                            </tr>
+                        </thead>
+                        <tbody></tbody>
+                    </table>
+                </div>
+                <div style="height: 1px;" data-field="sentinel"></div>`,
+            locatorTable: `
+                <h4 class="search-section-title" data-field="title"></h4>
+                <div class="table-wrapper">
+                    <table class="steps-table">
+                        <thead>
+                            <tr>
+                                <th style="width: 30%; text-align: left;">Locator</th>
+                                <th style="width: 70%;">Definition</th>
+                            </tr>
+                        </thead>
+                        <tbody></tbody>
+                    </table>
+                </div>
+                <div style="height: 1px;" data-field="sentinel"></div>`,
+            dataTable: `
+                <div class="table-wrapper">
+                    <table class="data-table">
+                        <thead>
+                            <tr>
+                                <th style="width: 25%;">Data Name</th>
+                                <th style="width: 75%;">Detail</th>
+                            </tr>
+                        </thead>
+                        <tbody></tbody>
+                    </table>
+                </div>
+                <div style="height: 1px;" data-field="sentinel"></div>`,
+            methodRow: `
+                <tr>
+                    <td>
+                        <div class="table-step-pattern">
+                            <div class="step-text scrollable" data-field="signature"><span class="table-step-type" data-field="name"></span></div>
+                            <button class="copy-btn">
+                                <svg width="16" height="16" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
+                                    <path d="M16 1H4C2.9 1 2 1.9 2 3V17H4V3H16V1ZM19 5H8C6.9 5 6 5.9 6 7V21C6 22.1 6.9 23 8 23H19C20.1 23 21 22.1 21 21V7C21 5.9 20.1 5 19 5ZM19 21H8V7H19V21Z" fill="currentColor"/>
+                                </svg>
+                            </button>
+                        </div>
+                        <div style="font-size: 11px; color: #6c757d; margin-top: 4px;" data-field="class"></div>
+                    </td>
+                    <td>
+                        <div class="table-parameters" data-field="params"></div>
+                    </td>
+                    <td>
+                        <div class="table-purpose" data-field="purpose"></div>
+                    </td>
+                </tr>`,
+            paramItem: `<div class="table-param-item"><span class="table-param-type"></span></div>`,
+            locatorRow: `
+                <tr>
+                    <td>
+                        <div class="table-step-type" data-field="name"></div>
+                        <div style="font-size: 11px; color: #6c757d; margin-top: 4px;" data-field="class"></div>
+                    </td>
+                    <td>
+                        <div class="locator-definition" data-field="assignment"></div>
+                    </td>
+                </tr>`,
+            dataRow: `
+                <tr>
+                    <td>
+                        <span class="data-name" data-field="name"></span>
+                        <span class="data-location" data-field="file"></span>
+                    </td>
+                    <td>
+                        <div class="code-block" data-field="value"></div>
+                    </td>
+                </tr>`,
+        };
+        const searchTemplates = {};
+
+        function cloneSearchTemplate(name) {
+            if (!searchTemplates[name]) {
+                const template = document.createElement('template');
+                template.innerHTML = SEARCH_TEMPLATE_MARKUP[name].trim();
+                searchTemplates[name] = template;
+            }
+            return searchTemplates[name].content.cloneNode(true);
+        }
+
+        function searchField(element, field) {
+            return element.querySelector(`[data-field="${field}"]`);
+        }
+
+        // Appends text with its first case-insensitive match of the query highlighted
+        function appendHighlighted(element, text, query) {
+            const index = text.toLowerCase().indexOf(query.toLowerCase());
+            if (index === -1) {
+                element.append(text);
+                return;
+            }
+            const highlight = document.createElement('span');
+            highlight.className = 'highlight';
+            highlight.textContent = text.substring(index, index + query.length);
+            element.append(text.substring(0, index), highlight, text.substring(index + query.length));
+        }
+
+        function renderMethodResult(result, query) {
+            const method = result.method;
+            const row = cloneSearchTemplate('methodRow').firstElementChild;
+            appendHighlighted(searchField(row, 'name'), method.method_name, query);
+            searchField(row, 'signature').append(`(${method.parameters})`);
+            row.querySelector('.copy-btn').addEventListener('click', function() {
+                copyMethodSignature(method.method_name, this);
+            });
+            appendHighlighted(searchField(row, 'class'), method.class_name, query);
+            appendHighlighted(searchField(row, 'purpose'), method.purpose, query);
+
+            const params = searchField(row, 'params');
+            if (method.parsed_params && method.parsed_params.length > 0) {
+                method.parsed_params.forEach(param => {
+                    const item = cloneSearchTemplate('paramItem').firstElementChild;
+                    item.firstElementChild.textContent = `${param.name}: ${param.type}`;
+                    item.append(` - ${param.description}`);
+                    params.appendChild(item);
+                });
+            } else {
+                params.textContent = 'None';
+            }
+            return row;
+        }
+
+        function renderLocatorResult(result, query) {
+            const locator = result.locator;
+            const row = cloneSearchTemplate('locatorRow').firstElementChild;
+            appendHighlighted(searchField(row, 'name'), locator.property_name, query);
+            appendHighlighted(searchField(row, 'class'), locator.class_name, query);
+            appendHighlighted(searchField(row, 'assignment'), locator.assignment, query);
+            return row;
+        }
+
+        function renderDataResult(result, query) {
+            const data = result.data;
+            const row = cloneSearchTemplate('dataRow').firstElementChild;
+            appendHighlighted(searchField(row, 'name'), data.name, query);
+            searchField(row, 'file').textContent = data.file;
+            appendHighlighted(searchField(row, 'value'), data.raw_value, query);
+            return row;
+        }
+
+        function topResultsNote(...searches) {
+            const unresolved = searches.reduce((count, search) => count + (search.unresolved || 0), 0);
+            const note = searches.some(search => search.results.length + (search.unresolved || 0) < search.total)
+                ? `, showing the best ${SEARCH_RESULT_LIMIT} of each` : '';
+            return unresolved ? `${note}; ${unresolved} in sections that failed to load are not shown` : note;
+        }
+
+        // Appends a results table and fills it a page at a time as its sentinel scrolls into view
+        function appendSearchTable(container, templateName, title, results, renderRow, query) {
+            const section = cloneSearchTemplate(templateName);
+            if (title) {
+                searchField(section, 'title').textContent = title;
+            }
+            const tbody = section.querySelector('tbody');
+            const sentinel = searchField(section, 'sentinel');
+            container.appendChild(section);
+
+            let next = 0;
+            let observer = null;
+            function appendPage() {
+                const fragment = document.createDocumentFragment();
+                const end = Math.min(next + SEARCH_PAGE_SIZE, results.length);
+                for (; next < end; next++) {
+                    fragment.appendChild(renderRow(results[next], query));
+                }
+                tbody.appendChild(fragment);
+                if (next >= results.length) {
+                    if (observer) {
+                        observer.disconnect();
+                    }
+                    sentinel.remove();
+                } else if (observer) {
+                    // Observing again reports the sentinel right away if it is still in view
+                    observer.unobserve(sentinel);
+                    observer.observe(sentinel);
+                }
+            }
+
+            appendPage();
+            if (next < results.length) {
+                observer = new IntersectionObserver(entries => {
+                    if (entries.some(entry => entry.isIntersecting)) {
+                        appendPage();
+                    }
+                }, { rootMargin: '400px' });
+                observer.observe(sentinel);
+                container.searchPagers = container.searchPagers || [];
+                container.searchPagers.push(observer);
+            }
+        }
+
+        function releaseSearchPagers(container) {
+            (container.searchPagers || []).forEach(observer => observer.disconnect());
+            container.searchPagers = [];
+        }
+"""
+
+
+# ============================================================================
+# Search Worker
+# ============================================================================
+
+# Runs in the worker after SEARCH_SCRIPT; a newer search or a cancel on the same channel stops the running one
+SEARCH_WORKER_SCRIPT = """
+        // Candidates scored between checks for a newer search
+        const SEARCH_STEP_SIZE = 2000;
+        let workerIndex = null;
+        const latestSearches = {};
+
+        // Resuming through a message channel lets queued messages from the page run between steps
+        const resumeChannel = new MessageChannel();
+        const resumeQueue = [];
+        resumeChannel.port1.onmessage = () => resumeQueue.shift()();
+
+        function resumeSoon(step) {
+            resumeQueue.push(step);
+            resumeChannel.port2.postMessage(null);
+        }
+
+        self.onmessage = event => {
+            const message = event.data;
+            if (message.type === 'index') {
+                workerIndex = message.index;
+                Object.keys(message.values).forEach(kind => attachDocuments(workerIndex[kind], message.values[kind]));
+                return;
+            }
+            latestSearches[message.channel] = message.id;
+            if (message.type === 'search') {
+                runSearch(message);
+            }
+        };
+
+        function runSearch(message) {
+            const searches = message.kinds.map(kind => startSearch(workerIndex[kind], message.query, message.limit));
+            let current = 0;
+
+            function step() {
+                if (latestSearches[message.channel] !== message.id) {
+                    return;
+                }
+                let budget = SEARCH_STEP_SIZE;
+                while (current < searches.length && budget > 0) {
+                    const search = searches[current];
+                    const scored = search.next;
+                    if (scoreCandidates(search, budget)) {
+                        current++;
+                    }
+                    budget -= search.next - scored;
+                }
+                if (current < searches.length) {
+                    resumeSoon(step);
+                    return;
+                }
+
+                // Only the ranked ids go back; the page already holds the records
+                const results = {};
+                message.kinds.forEach((kind, i) => {
+                    const found = finishSearch(searches[i]);
+                    results[kind] = { ids: found.results.map(result => result.id), total: found.total };
+                });
+                self.postMessage({ id: message.id, results: results });
+            }
+
+            step();
+        }
+"""
+
+# Sends searches to the worker, started from an inline blob so single-file output keeps working
+SEARCH_CLIENT_SCRIPT = """
+        // Searches run in a worker; without worker support they run on this thread
+        let searchWorker = null;
+        let searchWorkerFailed = false;
+        let searchSequence = 0;
+        const latestSearchIds = {};
+        const pendingSearches = {};
+
+        function getSearchWorker() {
+            if (!searchWorker && !searchWorkerFailed) {
+                try {
+                    const workerUrl = URL.createObjectURL(new Blob([SEARCH_WORKER_SOURCE], { type: 'text/javascript' }));
+                    searchWorker = new Worker(workerUrl);
+                    searchWorker.onmessage = event => settleSearch(event.data.id, event.data.results);
+                    searchWorker.onerror = () => {
+                        searchWorker.terminate();
+                        searchWorker = null;
+                        searchWorkerFailed = true;
+                        Object.keys(pendingSearches).forEach(id => {
+                            const pending = pendingSearches[id];
+                            settleSearch(Number(id), searchInline(pending.kinds, pending.query));
+                        });
+                    };
+                    searchWorker.postMessage({ type: 'index', index: searchIndex, values: searchValues() });
+                } catch (err) {
+                    searchWorker = null;
+                    searchWorkerFailed = true;
+                }
+            }
+            return searchWorker;
+        }
+
+        // Field values of the indexes that do not carry their documents, for lowercasing where the search runs
+        const searchRecords = { methods: methodDefinitions, locators: locatorDefinitions, data: dataDefinitions };
+
+        function searchValues() {
+            const values = {};
+            Object.keys(searchIndex).forEach(kind => {
+                if (!searchIndex[kind].docs) {
+                    values[kind] = searchFieldValues(searchIndex[kind], searchRecords[kind]);
+                }
+            });
+            return values;
+        }
+
+        function searchInline(kinds, query) {
+            const values = searchValues();
+            Object.keys(values).forEach(kind => attachDocuments(searchIndex[kind], values[kind]));
+            const results = {};
+            kinds.forEach(kind => {
+                const found = scoreDocuments(searchIndex[kind], query, SEARCH_RESULT_LIMIT);
+                results[kind] = { ids: found.results.map(result => result.id), total: found.total };
+            });
+            return results;
+        }
+
+        // Resolves with {kind: {ids, total}}, or with null once a newer search on the channel replaced it
+        function requestSearch(channel, kinds, query) {
+            const id = ++searchSequence;
+            latestSearchIds[channel] = id;
+            dropPendingSearches(channel);
+            const worker = getSearchWorker();
+            if (!worker) {
+                return Promise.resolve(searchInline(kinds, query));
+            }
+            return new Promise(resolve => {
+                pendingSearches[id] = { channel: channel, kinds: kinds, query: query, resolve: resolve };
+                worker.postMessage({ type: 'search', channel: channel, id: id, query: query, kinds: kinds, limit: SEARCH_RESULT_LIMIT });
+            });
+        }
+
+        function settleSearch(id, results) {
+            const pending = pendingSearches[id];
+            if (pending) {
+                delete pendingSearches[id];
+                pending.resolve(latestSearchIds[pending.channel] === id ? results : null);
+            }
+        }
+
+        function dropPendingSearches(channel) {
+            Object.keys(pendingSearches).forEach(id => {
+                if (pendingSearches[id].channel === channel) {
+                    settleSearch(Number(id), null);
+                }
+            });
+        }
+
+        // Called on every keystroke, so the worker drops a search the user has already typed past
+        function cancelSearch(channel) {
+            const id = ++searchSequence;
+            latestSearchIds[channel] = id;
+            dropPendingSearches(channel);
+            if (searchWorker) {
+                searchWorker.postMessage({ type: 'cancel', channel: channel, id: id });
+            }
+        }
+
+        function rankedResults(found, definitions, field) {
+            return {
+                total: found.total,
+                results: found.ids.map(id => ({ id: id, [field]: definitions[id] })),
+            };
+        }
+"""
+
+
+def _iter_search_worker():
+    """Yield the worker source as a string constant plus the page side that talks to it."""
+    yield """
+        // Source of the search worker
+        const SEARCH_WORKER_SOURCE = """
+    yield json.dumps(SEARCH_SCRIPT + SEARCH_WORKER_SCRIPT)
+    yield ';\n'
+    yield SEARCH_CLIENT_SCRIPT
+
+
+# ============================================================================
+# Split Output (HTML shell + lazily fetched JSON shards)
+# ============================================================================
+
+SECTION_PLACEHOLDER = """                    <div class="empty-state">Expand this section to load it.</div>
+"""
+
+
+def _class_shard_names(all_methods, locators_by_class) -> List[str]:
+    """Class names in source order, i.e. the order their records appear in the definitions."""
+    names = dict.fromkeys(m.class_name for m in all_methods if m.method_type == "page_object")
+    names.update(dict.fromkeys(locators_by_class))
+    return list(names)
+
+
+def _id_ranges(ids: List[int]) -> List[List[int]]:
+    """Compress ascending ids into [start, count] runs."""
+    ranges = []
+    for record_id in ids:
+        if ranges and ranges[-1][0] + ranges[-1][1] == record_id:
+            ranges[-1][1] += 1
+        else:
+            ranges.append([record_id, 1])
+    return ranges
+
+
+def _build_shards(all_methods, all_data, locators_by_class):
+    """Return {relative shard name: (section id, {kind: [(global id, record)]})} in source order.
+
+    Global ids are positions in the methodDefinitions, locatorDefinitions and
+    dataDefinitions arrays, which the search index refers to.
+    """
+    shards = {}
+    for class_name in _class_shard_names(all_methods, locators_by_class):
+        shards[f'classes/{class_name}.json'] = (class_name.lower(), {'methods': [], 'locators': []})
+    for method_id, method in enumerate(all_methods):
+        if method.method_type == "page_object":
+            shards[f'classes/{method.class_name}.json'][1]['methods'].append((method_id, method))
+    locator_id = 0
+    for class_name, locators in locators_by_class.items():
+        for locator in locators:
+            shards[f'classes/{class_name}.json'][1]['locators'].append((locator_id, locator))
+            locator_id += 1
+    for data_id, data_obj in enumerate(all_data):
+        name = f'data/{data_obj.category}.json'
+        if name not in shards:
+            shards[name] = (data_obj.category, {'data': []})
+        shards[name][1]['data'].append((data_id, data_obj))
+    return shards
+
+
+def build_shard_manifest(all_methods, all_data, locators_by_class, shard_dir: str) -> Dict:
+    """Describe every shard: its section, URL and the global ids of the records it holds."""
+    sections = {'methods': [], 'data': []}
+    for name, (section_id, records) in _build_shards(all_methods, all_data, locators_by_class).items():
+        entry = {'id': section_id, 'url': f'{shard_dir}/{name}'}
+        for kind, items in records.items():
+            entry[kind] = _id_ranges([record_id for record_id, _ in items])
+        sections['data' if 'data' in records else 'methods'].append(entry)
+    return {'index': f'{shard_dir}/index.json', 'sections': sections}
+
+
+def write_shards(all_methods, all_data, locators_by_class, shard_path: Path):
+    """Write the search index plus one JSON shard per page object class and per data category."""
+    shards = {
+        name: {kind: [record.to_dict() for _, record in items] for kind, items in records.items()}
+        for name, (_, records) in _build_shards(all_methods, all_data, locators_by_class).items()
+    }
+
+    # Drop shards of classes or categories that no longer exist
+    for subdir in ('classes', 'data'):
+        (shard_path / subdir).mkdir(parents=True, exist_ok=True)
+        for stale in (shard_path / subdir).glob('*.json'):
+            if f'{subdir}/{stale.name}' not in shards:
+                stale.unlink()
+
+    for name, shard in shards.items():
+        _write_if_changed(shard_path / name, json.dumps(shard, separators=(',', ':')))
+
+    all_locators = [locator for locator_list in locators_by_class.values() for locator in locator_list]
+    # Split pages only hold the records of loaded shards, so the index carries its documents
+    _write_if_changed(shard_path / 'index.json', ''.join(iter_search_index(all_methods, all_locators, all_data, docs=True)))
+
+
+def _write_if_changed(path: Path, text: str):
+    """Write text to path unless the file already holds exactly that text.
+
+    Leaving unchanged shards untouched keeps their mtimes stable, so a
+    regeneration only rewrites the shards whose records actually changed.
+    """
+    data = text.encode('utf-8')
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    with atomic_open(path, 'wb') as f:
+        f.write(data)
+
+
+# Client-side renderers producing the same markup as the Python section generators
+CLIENT_RENDER_SCRIPT = """
+        // Render sections from definition records
+        const copyIconSvg = '<svg width="16" height="16" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg"><path d="M16 1H4C2.9 1 2 1.9 2 3V17H4V3H16V1ZM19 5H8C6.9 5 6 5.9 6 7V21C6 22.1 6.9 23 8 23H19C20.1 23 21 22.1 21 21V7C21 5.9 20.1 5 19 5ZM19 21H8V7H19V21Z" fill="currentColor"/></svg>';
+
+        function renderLocatorCard(locator) {
+            return `<div class="locator-card"><div class="locator-name">${locator.property_name}</div><div class="locator-definition">${locator.assignment}</div></div>`;
+        }
+
+        function renderMethodRow(method) {
+            let paramsHtml = 'None';
+            if (method.parsed_params && method.parsed_params.length > 0) {
+                paramsHtml = method.parsed_params.map(param =>
+                    `<div class="table-param-item"><span class="table-param-type">${param.name}: ${param.type}</span> - ${param.description}</div>`
+                ).join('');
+            }
+            return `<tr>
+                <td>
+                    <div class="table-step-pattern">
+                        <div class="step-text scrollable"><span class="table-step-type">${method.method_name}</span>(${method.parameters})</div>
+                        <button class="copy-btn" onclick="copyMethodSignature('${method.method_name}', this)">${copyIconSvg}</button>
+                    </div>
+                </td>
+                <td><div class="table-parameters">${paramsHtml}</div></td>
+                <td><div class="table-purpose">${method.purpose}</div></td>
+            </tr>`;
+        }
+
+        function renderLocatorGrid(cardsHtml) {
+            return '<div class="locator-section"><div class="locator-section-header">Locators</div><div class="locator-grid">'
+                + cardsHtml + '</div></div>';
+        }
+
+        function renderMethodsTable(rowsHtml) {
+            return `<div class="table-wrapper"><table class="steps-table"><thead><tr>
+                <th style="width: 50%; text-align: left;">Method</th>
+                <th style="width: 25%;">Parameters</th>
+                <th style="width: 25%;">Purpose</th>
+            </tr></thead><tbody>` + rowsHtml + '</tbody></table></div>';
+        }
+
+        // With rows=false only the containers are rendered, for rows appended later
+        function renderClassSection(methods, locators, rows = true) {
+            let html = '';
+            if (locators.length > 0) {
+                html += renderLocatorGrid(rows ? locators.map(renderLocatorCard).join('') : '');
+            } else {
+                html += '<div class="empty-state">No locators detected for this page object.</div>';
+            }
+            if (methods.length > 0) {
+                html += renderMethodsTable(rows ? methods.map(renderMethodRow).join('') : '');
+            } else {
+                html += '<div class="empty-state">No methods detected for this page object.</div>';
+            }
+            return html;
+        }
+
+        function renderDataRow(data) {
+            const needsShowMore = data.raw_value.split('\\n').length > 3 || Boolean(data.preview);
+            const fullValue = data.preview ? ` data-full-value="${data.preview.url}"` : '';
+            return `<tr>
+                <td>
+                    <span class="data-name">${data.name}</span>
+                    <span class="data-location">${data.file}</span>
+                </td>
+                <td>
+                    <div class="code-block${needsShowMore ? ' collapsed' : ''}" id="code-${data.name}"${fullValue}>${data.raw_value}</div>
+                    ${data.preview ? `<div class="data-location">${data.preview.summary}</div>` : ''}
+                    ${needsShowMore ? `<button class="show-more-btn" onclick="toggleShowMore('code-${data.name}', this)">Show More</button>` : ''}
+                </td>
+            </tr>`;
+        }
+
+        function renderDataSection(dataObjects, rows = true) {
+            return `<div class="table-wrapper"><table class="data-table"><thead><tr>
+                <th style="width: 25%;">Data Name</th>
+                <th style="width: 75%;">Detail</th>
+            </tr></thead><tbody>` + (rows ? dataObjects.map(renderDataRow).join('') : '') + '</tbody></table></div>';
+        }
+"""
+
+SPLIT_SHARD_SCRIPT = """
+        // Shards are fetched when their section is expanded or a search hits them
+        const shardSections = {};
+        const shardOwners = { methods: [], locators: [], data: [] };
+        Object.keys(shardManifest.sections).forEach(tab => {
+            shardManifest.sections[tab].forEach(shard => {
+                shardSections[shard.id] = shard;
+                Object.keys(shardOwners).forEach(kind => {
+                    (shard[kind] || []).forEach(([start, count]) => {
+                        for (let id = start; id < start + count; id++) {
+                            shardOwners[kind][id] = shard.id;
+                        }
+                    });
+                });
+            });
+        });
+        const definitionsByKind = { methods: methodDefinitions, locators: locatorDefinitions, data: dataDefinitions };
+        const shardRecords = {};
+        const shardRequests = {};
+        // When each shard last failed to load; searches retry one after SHARD_RETRY_DELAY ms
+        const failedShards = {};
+        const SHARD_RETRY_DELAY = 5000;
+        let searchIndex = null;
+        let searchIndexRequest = null;
+
+        function fetchJson(url) {
+            return fetch(url).then(response => {
+                if (!response.ok) {
+                    throw new Error(response.status + ' ' + response.statusText);
+                }
+                return response.json();
+            });
+        }
+
+        function loadSearchIndex() {
+            if (!searchIndexRequest) {
+                searchIndexRequest = fetchJson(shardManifest.index).then(index => {
+                    searchIndex = index;
+                });
+            }
+            return searchIndexRequest;
+        }
+
+        function loadShard(sectionId) {
+            if (!shardRequests[sectionId]) {
+                const shard = shardSections[sectionId];
+                const content = document.getElementById('content_' + sectionId);
+                shardRequests[sectionId] = fetchJson(shard.url)
+                    .then(records => {
+                        shardRecords[sectionId] = records;
+                        delete failedShards[sectionId];
+                        placeShardRecords(shard, records);
+                        content.innerHTML = records.data
+                            ? renderDataSection(records.data)
+                            : renderClassSection(records.methods, records.locators);
+                    })
+                    .catch(err => {
+                        // Forgotten, so the shard is fetched again the next time it is needed
+                        delete shardRequests[sectionId];
+                        failedShards[sectionId] = Date.now();
+                        content.innerHTML = `<div class="empty-state">Failed to load ${shard.url}: ${err.message}</div>`;
+                    });
+            }
+            return shardRequests[sectionId];
+        }
+
+        // Put shard records at their global positions so search result ids resolve
+        function placeShardRecords(shard, records) {
+            Object.keys(definitionsByKind).forEach(kind => {
+                let position = 0;
+                (shard[kind] || []).forEach(([start, count]) => {
+                    for (let id = start; id < start + count; id++) {
+                        definitionsByKind[kind][id] = records[kind][position++];
+                    }
+                });
+            });
+        }
+
+        function shardsForResults(results, kind) {
+            const missing = new Set();
+            results.forEach(result => {
+                const owner = shardOwners[kind][result.id];
+                const failedAt = failedShards[owner];
+                if (!(owner in shardRecords) && !(failedAt && Date.now() - failedAt < SHARD_RETRY_DELAY)) {
+                    missing.add(owner);
+                }
+            });
+            return Array.from(missing);
+        }
+
+        // Leaves out the results whose shard failed to load, counting them as unresolved
+        function dropUnresolved(ranked, field) {
+            const results = ranked.results.filter(result => result[field] !== undefined);
+            ranked.unresolved = ranked.results.length - results.length;
+            ranked.results = results;
+        }
+"""
+
+SPLIT_TOGGLE_HOOK = """
+
+            if (!content.classList.contains('collapsed')) {
+                // Collapsing a section that failed to load lets the next expand retry it
+                delete failedShards[sectionId];
+            } else if (sectionId in shardSections && !(sectionId in shardRecords) && !(sectionId in failedShards)) {
+                loadShard(sectionId).then(() => toggleSection(sectionId));
+                return;
+            }"""
+
+SPLIT_METHODS_INDEX_HOOK = """
+
+            if (!searchIndex) {
+                loadSearchIndex().then(() => performMethodsSearch(methodsSearchBox.value.trim()));
+                return;
+            }"""
+
+SPLIT_METHODS_SHARD_HOOK = """
+
+                const missingShards = shardsForResults(methodResults.results, 'methods').concat(shardsForResults(locatorResults.results, 'locators'));
+                if (missingShards.length > 0) {
+                    Promise.all(missingShards.map(loadShard)).then(() => performMethodsSearch(methodsSearchBox.value.trim()));
+                    return;
+                }
+                dropUnresolved(methodResults, 'method');
+                dropUnresolved(locatorResults, 'locator');
+"""
+
+SPLIT_DATA_INDEX_HOOK = """
+
+            if (!searchIndex) {
+                loadSearchIndex().then(() => performDataSearch(dataSearchBox.value.trim()));
+                return;
+            }"""
+
+SPLIT_DATA_SHARD_HOOK = """
+
+                const missingShards = shardsForResults(results.results, 'data');
+                if (missingShards.length > 0) {
+                    Promise.all(missingShards.map(loadShard)).then(() => performDataSearch(dataSearchBox.value.trim()));
+                    return;
+                }
+                dropUnresolved(results, 'data');
+"""
+
+
+def _iter_split_definitions(manifest: Dict):
+    """Yield empty definition arrays plus the shard manifest for split output."""
+    yield """
+        // Definitions are filled in as shards are loaded
+        const methodDefinitions = [];
+        const locatorDefinitions = [];
+        const dataDefinitions = [];
+
+        // Shards written next to this page
+        const shardManifest = """
+    yield json.dumps(manifest, separators=(',', ':'))
+    yield ';\n'
+
+
+# ============================================================================
+# Virtualized Sections
+# ============================================================================
+
+VIRTUAL_SECTIONS_SCRIPT = """
+        // Sections are built from the definitions only while expanded, a batch of rows at a time
+        const VIRTUAL_BATCH_SIZE = 50;
+        const virtualSections = {};
+
+        function virtualSection(sectionId) {
+            if (!virtualSections[sectionId]) {
+                virtualSections[sectionId] = { methods: [], locators: [], data: null };
+            }
+            return virtualSections[sectionId];
+        }
+
+        methodDefinitions.forEach(method => {
+            if (method.method_type === 'page_object') {
+                virtualSection(method.class_name.toLowerCase()).methods.push(method);
+            }
+        });
+        locatorDefinitions.forEach(locator => {
+            virtualSection(locator.class_name.toLowerCase()).locators.push(locator);
+        });
+        dataDefinitions.forEach(data => {
+            const section = virtualSection(data.category);
+            section.data = section.data || [];
+            section.data.push(data);
+        });
+
+        function materializeSection(sectionId) {
+            const content = document.getElementById('content_' + sectionId);
+            const section = virtualSections[sectionId];
+            // A section collapsed and expanded again before its release ran still has the old observer
+            releaseObserver(content);
+            let segments;
+            if (section.data) {
+                content.innerHTML = renderDataSection(section.data, false);
+                segments = [{ target: content.querySelector('tbody'), items: section.data, render: renderDataRow }];
+            } else {
+                content.innerHTML = renderClassSection(section.methods, section.locators, false);
+                segments = [
+                    { target: content.querySelector('.locator-grid'), items: section.locators, render: renderLocatorCard },
+                    { target: content.querySelector('tbody'), items: section.methods, render: renderMethodRow },
+                ].filter(segment => segment.target);
+            }
+
+            const sentinel = document.createElement('div');
+            sentinel.style.height = '1px';
+            content.appendChild(sentinel);
+
+            let segment = 0;
+            let next = 0;
+            function appendBatch() {
+                let budget = VIRTUAL_BATCH_SIZE;
+                while (budget > 0 && segment < segments.length) {
+                    const current = segments[segment];
+                    const end = Math.min(next + budget, current.items.length);
+                    current.target.insertAdjacentHTML('beforeend', current.items.slice(next, end).map(current.render).join(''));
+                    budget -= end - next;
+                    next = end;
+                    if (next >= current.items.length) {
+                        segment++;
+                        next = 0;
+                    }
+                }
+                if (segment >= segments.length) {
+                    releaseObserver(content);
+                    sentinel.remove();
+                }
+            }
+
+            appendBatch();
+            if (segment < segments.length) {
+                content.virtualObserver = new IntersectionObserver(entries => {
+                    if (entries.some(entry => entry.isIntersecting)) {
+                        appendBatch();
+                    }
+                }, { rootMargin: '400px' });
+                content.virtualObserver.observe(sentinel);
+            }
+        }
+
+        function releaseObserver(content) {
+            if (content.virtualObserver) {
+                content.virtualObserver.disconnect();
+                content.virtualObserver = null;
+            }
+        }
+
+        // Drop the rows of a collapsed section once its closing transition is over
+        function releaseSection(sectionId) {
+            const content = document.getElementById('content_' + sectionId);
+            setTimeout(() => {
+                if (content.classList.contains('collapsed')) {
+                    releaseObserver(content);
+                    content.innerHTML = '';
+                }
+            }, 300);
+        }
+"""
+
+VIRTUAL_TOGGLE_HOOK = """
+
+            if (sectionId in virtualSections) {
+                if (content.classList.contains('collapsed')) {
+                    materializeSection(sectionId);
+                } else {
+                    releaseSection(sectionId);
+                }
+            }"""
+
+
+# ============================================================================
+# Data Value Previews
+# ============================================================================
+
+# Characters allowed per preview line, so single-line values are bounded too
+PREVIEW_LINE_CHARS = 200
+
+FULL_VALUE_SCRIPT = """
+        // Truncated data previews fetch their full value on first expand
+        function loadFullValue(codeBlock) {
+            const url = codeBlock.dataset.fullValue;
+            delete codeBlock.dataset.fullValue;
+            fetch(url).then(response => {
+                if (!response.ok) {
+                    throw new Error(`${url}: HTTP ${response.status}`);
+                }
+                return response.text();
+            }).then(text => {
+                codeBlock.textContent = text;
+            }).catch(error => {
+                codeBlock.dataset.fullValue = url;
+                console.error('Could not load the full value', error);
+            });
+        }
+"""
+
+FULL_VALUE_TOGGLE_HOOK = """
+
+            if (codeBlock.dataset.fullValue) {
+                loadFullValue(codeBlock);
+            }"""
+
+
+def _format_size(size: int) -> str:
+    """Human-readable byte count, e.g. '56.7 KB'."""
+    for unit in ('bytes', 'KB', 'MB'):
+        if size < 1024 or unit == 'MB':
+            return f'{size} {unit}' if unit == 'bytes' else f'{size:.1f} {unit}'
+        size /= 1024
+
+
+def preview_data_objects(all_data: List[TestDataObject], values_path: Path, max_lines: int) -> List[TestDataObject]:
+    """Return page copies of all_data with long values cut to a bounded preview.
+
+    A value longer than max_lines lines (or max_lines * PREVIEW_LINE_CHARS
+    characters) is written in full to values_path/<position>.txt; its copy
+    keeps the first lines plus a size summary and the sidecar URL.
+    """
+    values_path.mkdir(parents=True, exist_ok=True)
+    written = set()
+    previews = []
+    for value_id, data_obj in enumerate(all_data):
+        lines = data_obj.raw_value.split('\n')
+        preview = '\n'.join(lines[:max_lines])[:max_lines * PREVIEW_LINE_CHARS]
+        if preview == data_obj.raw_value:
+            previews.append(data_obj)
+            continue
+
+        name = f'{value_id}.txt'
+        _write_if_changed(values_path / name, data_obj.raw_value)
+        written.add(name)
+
+        preview_obj = TestDataObject(data_obj.name, data_obj.file_path, preview)
+        size = _format_size(len(data_obj.raw_value.encode('utf-8')))
+        preview_obj.preview = {
+            'url': f'{values_path.name}/{name}',
+            'summary': f'Preview only: the full value is {len(lines):,} line{"s" if len(lines) != 1 else ""} ({size})',
+        }
+        previews.append(preview_obj)
+
+    # Drop full values of objects that are gone or now fit their preview
+    for stale in values_path.glob('*.txt'):
+        if stale.name not in written:
+            stale.unlink()
+
+    return previews
+
+
+# ============================================================================
+# Page Sections and Document Assembly
+# ============================================================================
+
+
+def _iter_class_section_body(methods: List[PlaywrightMethod], locators: List[LocatorDefinition]):
+    """Yield the locator cards and methods table of one class section."""
+    if locators:
+        yield """
+                    <div class="locator-section">
+                        <div class="locator-section-header">Locators</div>
+                        <div class="locator-grid">
+"""
+        for locator in locators:
+            yield f"""
+                            <div class="locator-card">
+                                <div class="locator-name">{locator.property_name}</div>
+                                <div class="locator-definition">{locator.assignment}</div>
+                            </div>
+"""
+        yield """
+                        </div>
+                    </div>
+"""
+    else:
+        yield """
+                    <div class="empty-state">No locators detected for this page object.</div>
+"""
+
+    if methods:
+        yield """
+                    <div class="table-wrapper">
+                        <table class="steps-table">
+                            <thead>
+                                <tr>
+                                    <th style="width: 50%; text-align: left;">Method</th>
+                                    <th style="width: 25%;">Parameters</th>
+                                    <th style="width: 25%;">Purpose</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+"""
+
+        for method in methods:
+            params_html = "None"
+            if method.parsed_params:
+                params_html = ""
+                for param in method.parsed_params:
+                    params_html += f'<div class="table-param-item"><span class="table-param-type">{param["name"]}: {param["type"]}</span> - {param["description"]}</div>'
+
+            yield f"""
+                            <tr>
+                                <td>
+                                    <div class="table-step-pattern">
+                                        <div class="step-text scrollable">
+                                            <span class="table-step-type">{method.method_name}</span>({method.parameters})
+                                        </div>
+                                        <button class="copy-btn" onclick="copyMethodSignature('{method.method_name}', this)">
+                                            <svg width="16" height="16" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
+                                                <path d="M16 1H4C2.9 1 2 1.9 2 3V17H4V3H16V1ZM19 5H8C6.9 5 6 5.9 6 7V21C6 22.1 6.9 23 8 23H19C20.1 23 21 22.1 21 21V7C21 5.9 20.1 5 19 5ZM19 21H8V7H19V21Z" fill="currentColor"/>
+                                            </svg>
+                                        </button>
+                                    </div>
+                                </td>
+                                <td>
+                                    <div class="table-parameters">{params_html}</div>
+                                </td>
+                                <td>
+                                    <div class="table-purpose">{method.purpose}</div>
+                                </td>
+                            </tr>
+"""
+
+        yield """
+                            </tbody>
+                        </table>
+                    </div>
+"""
+    else:
+        yield """
+                    <div class="empty-state">No methods detected for this page object.</div>
+"""
+
+
+def _iter_data_section_body(data_objs: List[TestDataObject]):
+    """Yield the data table of one data category section."""
+    yield """                    <div class="table-wrapper">
+                        <table class="data-table">
+                            <thead>
+                                <tr>
+                                    <th style="width: 25%;">Data Name</th>
+                                    <th style="width: 75%;">Detail</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+"""
+
+    for data_obj in data_objs:
+        lines = data_obj.raw_value.split('\n')
+        needs_show_more = len(lines) > 3 or data_obj.preview is not None
+        collapsed_class = ' collapsed' if needs_show_more else ''
+        full_value = f' data-full-value="{data_obj.preview["url"]}"' if data_obj.preview else ''
+
+        yield f"""                                <tr>
+                                    <td>
+                                        <span class="data-name">{data_obj.name}</span>
+                                        <span class="data-location">{data_obj.file_path}</span>
+                                    </td>
+                                    <td>
+                                        <div class="code-block{collapsed_class}" id="code-{data_obj.name}"{full_value}>{data_obj.raw_value}</div>
+"""
+        if data_obj.preview:
+            yield f"""                                        <div class="data-location">{data_obj.preview['summary']}</div>
+"""
+        if needs_show_more:
+            yield f"""                                        <button class="show-more-btn" onclick="toggleShowMore('code-{data_obj.name}', this)">Show More</button>
+"""
+
+        yield """                                    </td>
+                                </tr>
+"""
+
+    yield """                            </tbody>
+                        </table>
+                    </div>
+"""
+
+
+class PagePart(str):
+    """Yielded by _iter_page between chunks: the chunks after it belong to this part."""
+
+
+HTML_PART = PagePart('html')
+CSS_PART = PagePart('css')
+DATA_PART = PagePart('data')
+SCRIPT_PART = PagePart('js')
+
+
+def iter_combined_html(
+    all_methods: List[PlaywrightMethod],
+    all_data: List[TestDataObject],
+    locators_by_class: Dict[str, List[LocatorDefinition]],
+    compact: bool = False,
+    shard_dir: Optional[str] = None,
+    virtualize: bool = False
+):
+    """Yield the combined HTML documentation chunk by chunk.
+
+    Chunks follow the document order: the head and CSS, each class section,
+    each data category, then the script with the embedded definitions.
+    With compact=True the definitions are emitted minified and string-interned.
+    With shard_dir set, only the page shell is emitted and each section is
+    fetched from the JSON shards under that (page-relative) directory.
+    With virtualize=True sections are left empty and built from the embedded
+    definitions, in batches as they scroll into view, only while expanded.
+    """
+    part = HTML_PART
+    for chunk in _iter_page(all_methods, all_data, locators_by_class, compact, shard_dir, virtualize):
+        if not isinstance(chunk, PagePart):
+            yield chunk
+            continue
+        # The CSS goes inline in a <style> element, the data and code in one <script> element
+        if part == HTML_PART and chunk != HTML_PART:
+            yield '    <style>\n' if chunk == CSS_PART else '    <script>\n'
+        elif part != HTML_PART and chunk == HTML_PART:
+            yield '    </style>\n' if part == CSS_PART else '    </script>\n'
+        part = chunk
+
+
+def _iter_page(all_methods, all_data, locators_by_class, compact, shard_dir, virtualize):
+    """Yield the page chunks of iter_combined_html, with PagePart markers instead of <style> and <script> tags."""
+
+    methods_by_class = group_methods_by_class(all_methods)
+    data_by_category = group_data_by_category(all_data)
+    split = shard_dir is not None
+
+    # Sections of split and virtualized output start collapsed and are filled on expand
+    content_class = 'section-content collapsed' if split or virtualize else 'section-content'
+    toggle_icon = '►' if split or virtualize else '▼'
+    toggle_hook = SPLIT_TOGGLE_HOOK if split else VIRTUAL_TOGGLE_HOOK if virtualize else ''
+    # Truncated data previews load their full value on first "Show More"
+    has_previews = any(data_obj.preview for data_obj in all_data)
+    show_more_hook = FULL_VALUE_TOGGLE_HOOK if has_previews else ''
+
+    def get_display_name(category: str) -> str:
+        """Convert category key to display name."""
+        if category == 'constants':
+            return 'Constants'
+        name = category.replace('-data', '').replace('-', ' ').title()
+        return f'{name} Data' if not category == 'constants' else name
+
+    def sort_categories(categories):
+        """Sort categories with 'constants' first, then alphabetically."""
+        sorted_cats = sorted(categories)
+        if 'constants' in sorted_cats:
+            sorted_cats.remove('constants')
+            sorted_cats.insert(0, 'constants')
+        return sorted_cats
+
+    sorted_categories = sort_categories(data_by_category.keys())
+    total_locators = sum(len(locs) for locs in locators_by_class.values())
+
+    yield f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Page Methods, Locators & Test Data Reference for AI Test Case Generation</title>
+"""
+    yield CSS_PART
+    yield f"""        :root {{
+            --primary-color: #2196F3;
+            --primary-dark: #1565C0;
+            --primary-rgb: 33, 150, 243;
+        }}
+
+        body.theme-purple {{
+            --primary-color: #667eea;
+            --primary-dark: #764ba2;
+            --primary-rgb: 102, 126, 234;
+        }}
+
+        body.theme-blue {{
+            --primary-color: #2196F3;
+            --primary-dark: #1565C0;
+            --primary-rgb: 33, 150, 243;
+        }}
+
+        body.theme-green {{
+            --primary-color: #4CAF50;
+            --primary-dark: #2E7D32;
+            --primary-rgb: 76, 175, 80;
+        }}
+
+        body.theme-light {{
+            --primary-color: #607D8B;
+            --primary-dark: #455A64;
+            --primary-rgb: 96, 125, 139;
+        }}
+
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            background-color: #f8f9fa;
+        }}
+
+        .container {{
+            max-width: 1400px;
+            margin: 0 auto;
+            padding: 20px;
+        }}
+
+        .header {{
+            background: linear-gradient(135deg, var(--primary-color) 0%, var(--primary-dark) 100%);
+            color: white;
+            padding: 20px 0;
+            margin-bottom: 20px;
+            border-radius: 12px;
+            text-align: center;
+            box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+            position: relative;
+        }}
+
+        .header h1 {{
+            font-size: 2.5rem;
+            margin-bottom: 10px;
+            font-weight: 300;
+        }}
+
+        .header p {{
+            font-size: 1.1rem;
+            opacity: 0.9;
+            margin-bottom: 5px;
         }}
 
         .theme-selector {{
@@ -1200,8 +3780,9 @@ def generate_combined_html(
                 grid-template-columns: 1fr;
             }}
         }}
-    </style>
-</head>
+"""
+    yield HTML_PART
+    yield f"""</head>
 <body>
     <div class="container">
         <div class="header">
@@ -1235,7 +3816,7 @@ def generate_combined_html(
 """
 
     # Add methods search
-    html_content += f"""
+    yield f"""
             <div class="search-container">
                 <div class="search-wrapper">
                     <input type="text" id="methodsSearchBox" class="search-box" placeholder="Search methods, locators... (e.g., 'login', 'verify', 'click')" autocomplete="off">
@@ -1283,9 +3864,9 @@ def generate_combined_html(
         method_count = len(methods_by_class.get(class_name, []))
         locator_count = len(locators_by_class.get(class_name, []))
         anchor = class_name.lower()
-        html_content += f'                        <li><a href="#{anchor}">{class_name} <span class="item-count">{method_count} methods + {locator_count} locators</span></a></li>\n'
+        yield f'                        <li><a href="#{anchor}">{class_name} <span class="item-count">{method_count} methods + {locator_count} locators</span></a></li>\n'
 
-    html_content += """                    </ul>
+    yield """                    </ul>
                 </div>
             </div>
 
@@ -1300,97 +3881,26 @@ def generate_combined_html(
         locator_count = len(locators)
         anchor = class_name.lower()
 
-        html_content += f"""
+        yield f"""
             <div class="section" id="{anchor}">
                 <div class="section-header" onclick="toggleSection('{anchor}')">
                     <span>{class_name} ({method_count} methods + {locator_count} locators)</span>
-                    <button class="section-toggle" id="toggle_{anchor}">▼</button>
+                    <button class="section-toggle" id="toggle_{anchor}">{toggle_icon}</button>
                 </div>
-                <div class="section-content" id="content_{anchor}">
+                <div class="{content_class}" id="content_{anchor}">
 """
 
-        if locators:
-            html_content += """
-                    <div class="locator-section">
-                        <div class="locator-section-header">Locators</div>
-                        <div class="locator-grid">
-"""
-            for locator in locators:
-                html_content += f"""
-                            <div class="locator-card">
-                                <div class="locator-name">{locator.property_name}</div>
-                                <div class="locator-definition">{locator.assignment}</div>
-                            </div>
-"""
-            html_content += """
-                        </div>
-                    </div>
-"""
+        if split or virtualize:
+            yield SECTION_PLACEHOLDER
         else:
-            html_content += """
-                    <div class="empty-state">No locators detected for this page object.</div>
-"""
-
-        if methods:
-            html_content += """
-                    <div class="table-wrapper">
-                        <table class="steps-table">
-                            <thead>
-                                <tr>
-                                    <th style="width: 50%; text-align: left;">Method</th>
-                                    <th style="width: 25%;">Parameters</th>
-                                    <th style="width: 25%;">Purpose</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-"""
+            yield from _iter_class_section_body(methods, locators)
 
-            for method in methods:
-                params_html = "None"
-                if method.parsed_params:
-                    params_html = ""
-                    for param in method.parsed_params:
-                        params_html += f'<div class="table-param-item"><span class="table-param-type">{param["name"]}: {param["type"]}</span> - {param["description"]}</div>'
-
-                html_content += f"""
-                            <tr>
-                                <td>
-                                    <div class="table-step-pattern">
-                                        <div class="step-text scrollable">
-                                            <span class="table-step-type">{method.method_name}</span>({method.parameters})
-                                        </div>
-                                        <button class="copy-btn" onclick="copyMethodSignature('{method.method_name}', this)">
-                                            <svg width="16" height="16" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
-                                                <path d="M16 1H4C2.9 1 2 1.9 2 3V17H4V3H16V1ZM19 5H8C6.9 5 6 5.9 6 7V21C6 22.1 6.9 23 8 23H19C20.1 23 21 22.1 21 21V7C21 5.9 20.1 5 19 5ZM19 21H8V7H19V21Z" fill="currentColor"/>
-                                            </svg>
-                                        </button>
-                                    </div>
-                                </td>
-                                <td>
-                                    <div class="table-parameters">{params_html}</div>
-                                </td>
-                                <td>
-                                    <div class="table-purpose">{method.purpose}</div>
-                                </td>
-                            </tr>
-"""
-
-            html_content += """
-                            </tbody>
-                        </table>
-                    </div>
-"""
-        else:
-            html_content += """
-                    <div class="empty-state">No methods detected for this page object.</div>
-"""
-
-        html_content += """
+        yield """
                 </div>
             </div>
 """
 
-    html_content += """
+    yield """
             </div>
         </div>
 
@@ -1399,7 +3909,7 @@ def generate_combined_html(
 """
 
     # Add data search
-    html_content += """
+    yield """
             <div class="search-container">
                 <div class="search-wrapper">
                     <input type="text" id="dataSearchBox" class="search-box" placeholder="Search test data... (e.g., 'USERS', 'PRODUCTS', 'LOGIN_USER')" autocomplete="off">
@@ -1423,9 +3933,9 @@ def generate_combined_html(
     for category in sorted_categories:
         count = len(data_by_category[category])
         display_name = get_display_name(category)
-        html_content += f'                        <li><a href="#{category}">{display_name} <span class="item-count">{count} object{"s" if count > 1 else ""}</span></a></li>\n'
+        yield f'                        <li><a href="#{category}">{display_name} <span class="item-count">{count} object{"s" if count > 1 else ""}</span></a></li>\n'
 
-    html_content += """                    </ul>
+    yield """                    </ul>
                 </div>
             </div>
 
@@ -1438,62 +3948,33 @@ def generate_combined_html(
         display_name = get_display_name(category)
         file_path = data_objs[0].file_path if data_objs else ""
 
-        html_content += f"""
+        yield f"""
             <div class="section" id="{category}">
                 <div class="section-header" onclick="toggleSection('{category}')">
                     <span>{display_name} ({file_path}) <button class="copy-icon-btn" onclick="event.stopPropagation(); copyPath(this, '{file_path}')" title="Copy file path"><svg xmlns="http://www.w3.org/2000/svg" width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><rect x="9" y="9" width="13" height="13" rx="2" ry="2"></rect><path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"></path></svg></button></span>
-                    <button class="section-toggle" id="toggle_{category}">▼</button>
+                    <button class="section-toggle" id="toggle_{category}">{toggle_icon}</button>
                 </div>
-                <div class="section-content" id="content_{category}">
-                    <div class="table-wrapper">
-                        <table class="data-table">
-                            <thead>
-                                <tr>
-                                    <th style="width: 25%;">Data Name</th>
-                                    <th style="width: 75%;">Detail</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-"""
-
-        for data_obj in data_objs:
-            lines = data_obj.raw_value.split('\n')
-            needs_show_more = len(lines) > 3
-            collapsed_class = ' collapsed' if needs_show_more else ''
-
-            html_content += f"""                                <tr>
-                                    <td>
-                                        <span class="data-name">{data_obj.name}</span>
-                                        <span class="data-location">{data_obj.file_path}</span>
-                                    </td>
-                                    <td>
-                                        <div class="code-block{collapsed_class}" id="code-{data_obj.name}">{data_obj.raw_value}</div>
-"""
-            if needs_show_more:
-                html_content += f"""                                        <button class="show-more-btn" onclick="toggleShowMore('code-{data_obj.name}', this)">Show More</button>
-"""
-
-            html_content += """                                    </td>
-                                </tr>
+                <div class="{content_class}" id="content_{category}">
 """
+        if split or virtualize:
+            yield SECTION_PLACEHOLDER
+        else:
+            yield from _iter_data_section_body(data_objs)
 
-        html_content += """                            </tbody>
-                        </table>
-                    </div>
-                </div>
+        yield """                </div>
             </div>
 """
 
-    html_content += """
+    yield """
             </div>
         </div>
     </div>
 
-    <script>
 """
+    yield SCRIPT_PART
 
     # Add JavaScript
-    html_content += f"""
+    yield f"""
         // Theme switching
         function changeTheme(theme) {{
             // Remove all theme classes
@@ -1538,16 +4019,36 @@ def generate_combined_html(
                 clearMethodsSearch();
             }}
         }}
-
-        // Methods data
-        const methodDefinitions = {json.dumps(methods_json, indent=2)};
-
-        // Locator data
-        const locatorDefinitions = {json.dumps(locator_json, indent=2)};
-
-        // Data definitions
-        const dataDefinitions = {json.dumps(data_json, indent=8)};
-
+"""
+    all_locators = [locator for locator_list in locators_by_class.values() for locator in locator_list]
+    yield DATA_PART
+    if split:
+        yield from _iter_split_definitions(build_shard_manifest(all_methods, all_data, locators_by_class, shard_dir))
+        yield SCRIPT_PART
+        yield CLIENT_RENDER_SCRIPT
+        yield SPLIT_SHARD_SCRIPT
+        yield SEARCH_SCRIPT
+    else:
+        if compact:
+            yield from _iter_compact_definitions(all_methods, all_locators, all_data)
+        else:
+            yield from _iter_definitions(all_methods, all_locators, all_data)
+        yield """
+        // Prebuilt search index
+        const searchIndex = """
+        yield from iter_search_index(all_methods, all_locators, all_data)
+        yield ';\n'
+        yield SCRIPT_PART
+        yield SEARCH_SCRIPT
+        if virtualize:
+            yield CLIENT_RENDER_SCRIPT
+            yield VIRTUAL_SECTIONS_SCRIPT
+    if has_previews:
+        yield FULL_VALUE_SCRIPT
+    yield SEARCH_RESULTS_SCRIPT
+    yield from _iter_search_worker()
+
+    yield f"""
         // Methods search
         const methodsSearchBox = document.getElementById('methodsSearchBox');
         const methodsSearchClear = document.getElementById('methodsSearchClear');
@@ -1559,6 +4060,7 @@ def generate_combined_html(
 
         methodsSearchBox.addEventListener('input', function() {{
             clearTimeout(methodsSearchTimeout);
+            cancelSearch('methods');
             methodsSearchTimeout = setTimeout(() => {{
                 performMethodsSearch(this.value.trim());
                 toggleMethodsSearchClearButton();
@@ -1584,115 +4086,24 @@ def generate_combined_html(
             if (!query) {{
                 showAllMethods();
                 return;
-            }}
-
-            const methodResults = searchMethods(query);
-            const locatorResults = searchLocators(query);
-            displayMethodsSearchResults(methodResults, locatorResults, query);
-        }}
-
-        function searchMethods(query) {{
-            const queryLower = query.toLowerCase();
-            const results = [];
-
-            methodDefinitions.forEach(method => {{
-                let score = 0;
-                let matches = [];
-
-                if (method.method_name.toLowerCase().includes(queryLower)) {{
-                    score += 100;
-                    matches.push('method_name');
-                }}
-
-                if (method.class_name.toLowerCase().includes(queryLower)) {{
-                    score += 80;
-                    matches.push('class_name');
-                }}
-
-                if (method.purpose.toLowerCase().includes(queryLower)) {{
-                    score += 50;
-                    matches.push('purpose');
-                }}
-
-                method.parsed_params.forEach(param => {{
-                    if (param.name.toLowerCase().includes(queryLower)) {{
-                        score += 30;
-                        matches.push('parameter');
-                    }}
-                }});
-
-                const queryWords = queryLower.split(/\\s+/);
-                queryWords.forEach(word => {{
-                    if (word.length > 2) {{
-                        if (method.method_name.toLowerCase().includes(word)) score += 20;
-                        if (method.class_name.toLowerCase().includes(word)) score += 15;
-                        if (method.purpose.toLowerCase().includes(word)) score += 10;
-                    }}
-                }});
-
-                if (score > 0) {{
-                    results.push({{
-                        method: method,
-                        score: score,
-                        matches: matches
-                    }});
-                }}
-            }});
+            }}{SPLIT_METHODS_INDEX_HOOK if split else ''}
 
-            results.sort((a, b) => b.score - a.score);
-            return results;
-        }}
-
-        function searchLocators(query) {{
-            const queryLower = query.toLowerCase();
-            const results = [];
-
-            locatorDefinitions.forEach(locator => {{
-                let score = 0;
-                let matches = [];
-
-                if (locator.property_name.toLowerCase().includes(queryLower)) {{
-                    score += 100;
-                    matches.push('property_name');
-                }}
-
-                if (locator.class_name.toLowerCase().includes(queryLower)) {{
-                    score += 70;
-                    matches.push('class_name');
-                }}
-
-                if (locator.assignment.toLowerCase().includes(queryLower)) {{
-                    score += 60;
-                    matches.push('assignment');
-                }}
-
-                const queryWords = queryLower.split(/\\s+/);
-                queryWords.forEach(word => {{
-                    if (word.length > 2) {{
-                        if (locator.property_name.toLowerCase().includes(word)) score += 20;
-                        if (locator.class_name.toLowerCase().includes(word)) score += 15;
-                        if (locator.assignment.toLowerCase().includes(word)) score += 10;
-                    }}
-                }});
-
-                if (score > 0) {{
-                    results.push({{
-                        locator: locator,
-                        score: score,
-                        matches: matches
-                    }});
+            requestSearch('methods', ['methods', 'locators'], query).then(found => {{
+                if (!found) {{
+                    return;
                 }}
+                const methodResults = rankedResults(found.methods, methodDefinitions, 'method');
+                const locatorResults = rankedResults(found.locators, locatorDefinitions, 'locator');{SPLIT_METHODS_SHARD_HOOK if split else ''}
+                displayMethodsSearchResults(methodResults, locatorResults, query);
             }});
-
-            results.sort((a, b) => b.score - a.score);
-            return results;
         }}
 
         function displayMethodsSearchResults(methodResults, locatorResults, query) {{
             allMethods.style.display = 'none';
             methodsTableOfContents.style.display = 'none';
+            releaseSearchPagers(methodsSearchResults);
 
-            if (methodResults.length === 0 && locatorResults.length === 0) {{
+            if (methodResults.total === 0 && locatorResults.total === 0) {{
                 methodsSearchResults.innerHTML = `
                     <div class="search-stats">No method or locator results found for "${{query}}"</div>
                     <div class="no-results">
@@ -1703,119 +4114,20 @@ def generate_combined_html(
                 return;
             }}
 
-            const totalMatches = methodResults.length + locatorResults.length;
-            let html = `<div class="search-stats">Found ${{totalMatches}} match${{totalMatches !== 1 ? 'es' : ''}} for "${{query}}" (${{methodResults.length}} method${{methodResults.length !== 1 ? 's' : ''}}, ${{locatorResults.length}} locator${{locatorResults.length !== 1 ? 's' : ''}})</div>`;
-
-            if (methodResults.length > 0) {{
-                html += `
-                    <h4 class="search-section-title">Method Matches (${{methodResults.length}})</h4>
-                    <div class="table-wrapper">
-                        <table class="steps-table">
-                            <thead>
-                                <tr>
-                                    <th style="width: 50%; text-align: left;">Method</th>
-                                    <th style="width: 25%;">Parameters</th>
-                                    <th style="width: 25%;">Purpose</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-                `;
-
-                methodResults.forEach(result => {{
-                    const method = result.method;
-
-                    let paramsHtml = "None";
-                    if (method.parsed_params && method.parsed_params.length > 0) {{
-                        paramsHtml = "";
-                        method.parsed_params.forEach(param => {{
-                            paramsHtml += `<div class="table-param-item"><span class="table-param-type">${{param.name}}: ${{param.type}}</span> - ${{param.description}}</div>`;
-                        }});
-                    }}
-
-                    const highlightedMethodName = highlightMatch(method.method_name, query);
-                    const highlightedClassName = highlightMatch(method.class_name, query);
-                    const highlightedPurpose = highlightMatch(method.purpose, query);
-
-                    html += `
-                            <tr>
-                                <td>
-                                    <div class="table-step-pattern">
-                                        <div class="step-text scrollable">
-                                            <span class="table-step-type">${{highlightedMethodName}}</span>(${{method.parameters}})
-                                        </div>
-                                        <button class="copy-btn" onclick="copyMethodSignature('${{method.method_name}}', this)">
-                                            <svg width="16" height="16" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
-                                                <path d="M16 1H4C2.9 1 2 1.9 2 3V17H4V3H16V1ZM19 5H8C6.9 5 6 5.9 6 7V21C6 22.1 6.9 23 8 23H19C20.1 23 21 22.1 21 21V7C21 5.9 20.1 5 19 5ZM19 21H8V7H19V21Z" fill="currentColor"/>
-                                            </svg>
-                                        </button>
-                                    </div>
-                                    <div style="font-size: 11px; color: #6c757d; margin-top: 4px;">
-                                        ${{highlightedClassName}}
-                                    </div>
-                                </td>
-                                <td>
-                                    <div class="table-parameters">${{paramsHtml}}</div>
-                                </td>
-                                <td>
-                                    <div class="table-purpose">${{highlightedPurpose}}</div>
-                                </td>
-                            </tr>
-                    `;
-                }});
+            const totalMatches = methodResults.total + locatorResults.total;
+            methodsSearchResults.innerHTML = `<div class="search-stats">Found ${{totalMatches}} match${{totalMatches !== 1 ? 'es' : ''}} for "${{query}}" (${{methodResults.total}} method${{methodResults.total !== 1 ? 's' : ''}}, ${{locatorResults.total}} locator${{locatorResults.total !== 1 ? 's' : ''}})${{topResultsNote(methodResults, locatorResults)}}</div>`;
 
-                html += `
-                            </tbody>
-                        </table>
-                    </div>
-                `;
+            if (methodResults.total > 0) {{
+                appendSearchTable(methodsSearchResults, 'methodTable', `Method Matches (${{methodResults.total}})`, methodResults.results, renderMethodResult, query);
             }}
-
-            if (locatorResults.length > 0) {{
-                html += `
-                    <h4 class="search-section-title">Locator Matches (${{locatorResults.length}})</h4>
-                    <div class="table-wrapper">
-                        <table class="steps-table">
-                            <thead>
-                                <tr>
-                                    <th style="width: 30%; text-align: left;">Locator</th>
-                                    <th style="width: 70%;">Definition</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-                `;
-
-                locatorResults.forEach(result => {{
-                    const locator = result.locator;
-                    const highlightedLocatorName = highlightMatch(locator.property_name, query);
-                    const highlightedAssignment = highlightMatch(locator.assignment, query);
-                    const highlightedClassName = highlightMatch(locator.class_name, query);
-
-                    html += `
-                            <tr>
-                                <td>
-                                    <div class="table-step-type">${{highlightedLocatorName}}</div>
-                                    <div style="font-size: 11px; color: #6c757d; margin-top: 4px;">
-                                        ${{highlightedClassName}}
-                                    </div>
-                                </td>
-                                <td>
-                                    <div class="locator-definition">${{highlightedAssignment}}</div>
-                                </td>
-                            </tr>
-                    `;
-                }});
-
-                html += `
-                            </tbody>
-                        </table>
-                    </div>
-                `;
+            if (locatorResults.total > 0) {{
+                appendSearchTable(methodsSearchResults, 'locatorTable', `Locator Matches (${{locatorResults.total}})`, locatorResults.results, renderLocatorResult, query);
             }}
-
-            methodsSearchResults.innerHTML = html;
         }}
 
         function showAllMethods() {{
+            cancelSearch('methods');
+            releaseSearchPagers(methodsSearchResults);
             methodsSearchResults.innerHTML = '';
             allMethods.style.display = 'block';
             methodsTableOfContents.style.display = 'block';
@@ -1832,6 +4144,7 @@ def generate_combined_html(
 
         dataSearchBox.addEventListener('input', function() {{
             clearTimeout(dataSearchTimeout);
+            cancelSearch('data');
             dataSearchTimeout = setTimeout(() => {{
                 performDataSearch(this.value.trim());
                 toggleDataSearchClearButton();
@@ -1857,48 +4170,23 @@ def generate_combined_html(
             if (!query) {{
                 showAllData();
                 return;
-            }}
-
-            const results = searchData(query);
-            displayDataSearchResults(results, query);
-        }}
-
-        function searchData(query) {{
-            const queryLower = query.toLowerCase();
-            const results = [];
-
-            dataDefinitions.forEach(data => {{
-                let score = 0;
-
-                if (data.name.toLowerCase().includes(queryLower)) {{
-                    score += 100;
-                }}
-
-                if (data.file.toLowerCase().includes(queryLower)) {{
-                    score += 50;
-                }}
-
-                if (data.raw_value.toLowerCase().includes(queryLower)) {{
-                    score += 30;
-                }}
+            }}{SPLIT_DATA_INDEX_HOOK if split else ''}
 
-                if (score > 0) {{
-                    results.push({{
-                        data: data,
-                        score: score
-                    }});
+            requestSearch('data', ['data'], query).then(found => {{
+                if (!found) {{
+                    return;
                 }}
+                const results = rankedResults(found.data, dataDefinitions, 'data');{SPLIT_DATA_SHARD_HOOK if split else ''}
+                displayDataSearchResults(results, query);
             }});
-
-            results.sort((a, b) => b.score - a.score);
-            return results;
         }}
 
         function displayDataSearchResults(results, query) {{
             allData.style.display = 'none';
             dataTableOfContents.style.display = 'none';
+            releaseSearchPagers(dataSearchResults);
 
-            if (results.length === 0) {{
+            if (results.total === 0) {{
                 dataSearchResults.innerHTML = `
                     <div class="search-stats">No results found for "${{query}}"</div>
                     <div class="no-results">
@@ -1909,75 +4197,22 @@ def generate_combined_html(
                 return;
             }}
 
-            let html = `<div class="search-stats">Found ${{results.length}} matching data object${{results.length !== 1 ? 's' : ''}} for "${{query}}"</div>`;
-
-            html += `
-                <div class="table-wrapper">
-                    <table class="data-table">
-                        <thead>
-                            <tr>
-                                <th style="width: 25%;">Data Name</th>
-                                <th style="width: 75%;">Detail</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-            `;
-
-            results.forEach(result => {{
-                const data = result.data;
-                const highlightedName = highlightMatch(data.name, query);
-                const highlightedValue = highlightMatch(data.raw_value, query);
-
-                html += `
-                            <tr>
-                                <td>
-                                    <span class="data-name">${{highlightedName}}</span>
-                                    <span class="data-location">${{data.file}}</span>
-                                </td>
-                                <td>
-                                    <div class="code-block">${{highlightedValue}}</div>
-                                </td>
-                            </tr>
-                `;
-            }});
-
-            html += `
-                        </tbody>
-                    </table>
-                </div>
-            `;
-
-            dataSearchResults.innerHTML = html;
+            dataSearchResults.innerHTML = `<div class="search-stats">Found ${{results.total}} matching data object${{results.total !== 1 ? 's' : ''}} for "${{query}}"${{topResultsNote(results)}}</div>`;
+            appendSearchTable(dataSearchResults, 'dataTable', null, results.results, renderDataResult, query);
         }}
 
         function showAllData() {{
+            cancelSearch('data');
+            releaseSearchPagers(dataSearchResults);
             dataSearchResults.innerHTML = '';
             allData.style.display = 'block';
             dataTableOfContents.style.display = 'block';
         }}
 
-        function highlightMatch(text, query) {{
-            const queryLower = query.toLowerCase();
-            const textLower = text.toLowerCase();
-
-            if (!textLower.includes(queryLower)) {{
-                return text;
-            }}
-
-            const index = textLower.indexOf(queryLower);
-            if (index === -1) return text;
-
-            return text.substring(0, index) +
-                   '<span class="highlight">' +
-                   text.substring(index, index + query.length) +
-                   '</span>' +
-                   text.substring(index + query.length);
-        }}
-
         // Toggle section
         function toggleSection(sectionId) {{
             const content = document.getElementById('content_' + sectionId);
-            const toggle = document.getElementById('toggle_' + sectionId);
+            const toggle = document.getElementById('toggle_' + sectionId);{toggle_hook}
 
             if (content.classList.contains('collapsed')) {{
                 content.classList.remove('collapsed');
@@ -2023,7 +4258,7 @@ def generate_combined_html(
 
         // Toggle show more
         function toggleShowMore(codeId, button) {{
-            const codeBlock = document.getElementById(codeId);
+            const codeBlock = document.getElementById(codeId);{show_more_hook}
 
             if (codeBlock.classList.contains('collapsed')) {{
                 codeBlock.classList.remove('collapsed');
@@ -2084,10 +4319,12 @@ def generate_combined_html(
         window.addEventListener('load', function() {{
             methodsSearchBox.focus();
 
-            // Initialize all sections as expanded with large max-height
+            // Initialize all sections as expanded with large max-height (lazy shards stay collapsed)
             const sections = document.querySelectorAll('[id^="content_"]');
             sections.forEach(section => {{
-                section.style.maxHeight = '10000px';
+                if (!section.classList.contains('collapsed')) {{
+                    section.style.maxHeight = '10000px';
+                }}
             }});
 
             // Initialize TOCs as expanded with large fixed max-height
@@ -2110,108 +4347,774 @@ def generate_combined_html(
                 clearDataSearch();
             }}
         }});
-    </script>
-</body>
+"""
+    yield HTML_PART
+    yield """</body>
 </html>"""
 
-    # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+
+# Fingerprinted page assets (--assets): file name stem and extension per page part
+ASSET_FILES = {CSS_PART: ('styles', 'css'), DATA_PART: ('data', 'js'), SCRIPT_PART: ('app', 'js')}
+ASSET_HASH_LENGTH = 12
+
+
+def _write_asset(path: Path, data: bytes) -> List[str]:
+    """Write data and its precompressed variants, returning their file names.
+
+    The name is derived from the content, so an existing file already holds it.
+    """
+    variants = {path: lambda: data, path.with_name(path.name + '.gz'): lambda: gzip.compress(data, 9, mtime=0)}
+    if brotli is not None:
+        variants[path.with_name(path.name + '.br')] = lambda: brotli.compress(data)
+    for variant, encode in variants.items():
+        if not variant.exists():
+            with atomic_open(variant, 'wb') as f:
+                f.write(encode())
+    return [variant.name for variant in variants]
+
+
+def write_page_assets(all_methods, all_data, locators_by_class, output_file, compact=False, shard_dir=None,
+                      virtualize=False) -> List[str]:
+    """Write the page as a small HTML entry point plus content-hashed CSS, data and code files.
+
+    The parts go to '<output>_assets/<part>.<hash>.<ext>' with a gzip variant,
+    and a brotli one when the brotli module is installed, for servers that send
+    precompressed files. A part that did not change keeps its name, so it can be
+    cached indefinitely and only the changed parts are downloaded again. Unless
+    the page is split, sections are rendered from the data file as with
+    virtualize=True, so the entry point does not repeat the data as markup.
+    Returns the names of the files in the assets directory.
+    """
+    virtualize = virtualize or shard_dir is None
+    assets_path = Path(output_file).with_name(f'{Path(output_file).stem}_assets')
+    assets_path.mkdir(parents=True, exist_ok=True)
+
+    # The entry point keeps the markup, with a slot where each part was inlined
+    html = []
+    parts = {part: [] for part in ASSET_FILES}
+    slots = {}
+    part = HTML_PART
+    for chunk in _iter_page(all_methods, all_data, locators_by_class, compact, shard_dir, virtualize):
+        if isinstance(chunk, PagePart):
+            if part == HTML_PART and chunk != HTML_PART:
+                slots[CSS_PART if chunk == CSS_PART else SCRIPT_PART] = len(html)
+                html.append('')
+            part = chunk
+        elif part == HTML_PART:
+            html.append(chunk)
+        else:
+            parts[part].append(chunk)
+
+    written = []
+    urls = {}
+    for part, (stem, extension) in ASSET_FILES.items():
+        data = ''.join(parts[part]).encode('utf-8')
+        name = f'{stem}.{hashlib.sha256(data).hexdigest()[:ASSET_HASH_LENGTH]}.{extension}'
+        written += _write_asset(assets_path / name, data)
+        urls[part] = f'{assets_path.name}/{name}'
+
+    html[slots[CSS_PART]] = f'    <link rel="stylesheet" href="{urls[CSS_PART]}">\n'
+    # The data and the code share one <script> element inline; the data has to run first
+    html[slots[SCRIPT_PART]] = (
+        f'    <script src="{urls[DATA_PART]}"></script>\n'
+        f'    <script src="{urls[SCRIPT_PART]}"></script>\n'
+    )
+    with atomic_open(output_file, encoding='utf-8') as f:
+        f.writelines(html)
+
+    # Drop the parts of earlier generations
+    for stale in assets_path.iterdir():
+        if stale.is_file() and stale.name not in written:
+            stale.unlink()
+
+    return written
+
+
+def generate_combined_html(
+    all_methods: List[PlaywrightMethod],
+    all_data: List[TestDataObject],
+    locators_by_class: Dict[str, List[LocatorDefinition]],
+    output_file: str = 'DATA_METHODS_REFERENCE.html',
+    compact: bool = False,
+    split: bool = False,
+    virtualize: bool = False,
+    preview_lines: int = 0,
+    assets: bool = False,
+    profiler: Optional[Profiler] = None
+):
+    """Generate combined HTML documentation with tabs for methods and data.
+
+    With split=True the page is a small shell and every class and data
+    category is written as a JSON shard in a '<output>_shards' directory.
+    With virtualize=True section rows are rendered client-side on demand.
+    With preview_lines > 0 long data values are cut to that many lines and
+    written in full to a '<output>_values' directory, fetched on "Show More".
+    With assets=True the CSS, data and code are written as fingerprinted,
+    precompressed files in a '<output>_assets' directory (see write_page_assets).
+    With a profiler, rendering and writing the page are recorded as separate stages.
+    """
+    if preview_lines:
+        values_path = Path(output_file).with_name(f'{Path(output_file).stem}_values')
+        all_data = preview_data_objects(all_data, values_path, preview_lines)
+
+    shard_dir = None
+    if split:
+        shard_path = Path(output_file).with_name(f'{Path(output_file).stem}_shards')
+        write_shards(all_methods, all_data, locators_by_class, shard_path)
+        shard_dir = shard_path.name
+
+    if assets:
+        started = time.perf_counter()
+        cpu_started = time.process_time()
+        write_page_assets(all_methods, all_data, locators_by_class, output_file, compact, shard_dir, virtualize)
+        if profiler is not None:
+            profiler.add_stage('write assets', started, time.perf_counter() - started, time.process_time() - cpu_started)
+        return output_file
+
+    chunks = iter_combined_html(
+        all_methods, all_data, locators_by_class, compact=compact, shard_dir=shard_dir, virtualize=virtualize
+    )
+
+    # Stream chunks straight into a buffered file instead of building the whole document
+    with atomic_open(output_file, encoding='utf-8', buffering=1024 * 1024) as f:
+        if profiler is None:
+            for chunk in chunks:
+                f.write(chunk)
+        else:
+            started = time.perf_counter()
+            cpu_started = time.process_time()
+            write_wall = write_cpu = 0.0
+            for chunk in chunks:
+                write_started = time.perf_counter()
+                write_cpu_started = time.process_time()
+                f.write(chunk)
+                write_wall += time.perf_counter() - write_started
+                write_cpu += time.process_time() - write_cpu_started
+            write_started = time.perf_counter()
+            f.flush()
+            write_wall += time.perf_counter() - write_started
+            total_wall = time.perf_counter() - started
+            profiler.add_stage('render html', started, total_wall - write_wall, time.process_time() - cpu_started - write_cpu)
+            profiler.add_stage('write html', started, write_wall, write_cpu)
+
+    return output_file
+
+
+# ============================================================================
+# Machine-readable Output (JSON / NDJSON)
+# ============================================================================
+
+def _reference_groups(all_methods, all_data, locators_by_class):
+    """Return (kind, key, records) for methods, locators and data, in definition order."""
+    all_locators = [locator for locator_list in locators_by_class.values() for locator in locator_list]
+    return [
+        ('method', 'methods', all_methods),
+        ('locator', 'locators', all_locators),
+        ('data', 'data', all_data),
+    ]
+
+
+def iter_reference_json(all_methods, all_data, locators_by_class):
+    """Yield a JSON document {generated_at, methods, locators, data} with one record per line."""
+    generated_at = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    yield f'{{"generated_at":{json.dumps(generated_at)}'
+    for _, key, records in _reference_groups(all_methods, all_data, locators_by_class):
+        yield f',"{key}":['
+        for index, record in enumerate(records):
+            yield ('\n' if index == 0 else ',\n') + json.dumps(record.to_dict(), separators=(',', ':'))
+        yield '\n]' if records else ']'
+    yield '}\n'
+
+
+def iter_reference_ndjson(all_methods, all_data, locators_by_class):
+    """Yield one JSON object per line, each tagged with its record kind.
+
+    The first line is a summary with the generation time and record counts,
+    so consumers can size buffers or stop reading early.
+    """
+    groups = _reference_groups(all_methods, all_data, locators_by_class)
+    summary = {'kind': 'summary', 'generated_at': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}
+    summary.update((key, len(records)) for _, key, records in groups)
+    yield json.dumps(summary, separators=(',', ':')) + '\n'
+    for kind, _, records in groups:
+        for record in records:
+            yield json.dumps({'kind': kind, **record.to_dict()}, separators=(',', ':')) + '\n'
+
+
+def generate_reference_data(all_methods, all_data, locators_by_class, output_file, output_format: str):
+    """Write the extracted records as a JSON document or as NDJSON."""
+    chunks = iter_reference_json if output_format == 'json' else iter_reference_ndjson
+    with atomic_open(output_file, encoding='utf-8', buffering=1024 * 1024) as f:
+        for chunk in chunks(all_methods, all_data, locators_by_class):
+            f.write(chunk)
 
     return output_file
 
 
+# ============================================================================
+# Output Manifest (--manifest)
+# ============================================================================
+
+MANIFEST_VERSION = 2
+# Exit status when --manifest finds nothing changed since the previous run
+EXIT_UNCHANGED = 3
+
+
+def build_manifest(all_methods, all_data, locators_by_class, options: Dict) -> Dict:
+    """Describe what an output is generated from, leaving out volatile fields like the generation time.
+
+    model hashes every extracted record in output order, generator hashes this
+    script and options holds the output settings, so an equal manifest means
+    the outputs would only differ in their timestamps. The files written are
+    added by write_output (see hash_output_files).
+    """
+    digest = hashlib.sha256()
+    counts = {}
+    for kind, key, records in _reference_groups(all_methods, all_data, locators_by_class):
+        counts[key] = len(records)
+        for record in records:
+            digest.update(json.dumps({'kind': kind, **record.to_dict()}, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+            digest.update(b'\n')
+    return {
+        'version': MANIFEST_VERSION,
+        'model': digest.hexdigest(),
+        'generator': _extractor_fingerprint(),
+        'options': options,
+        'counts': counts,
+    }
+
+
+def hash_output_files(output_path: Path, options: Dict) -> Dict[str, str]:
+    """sha256 of the output and of every file in the sidecar directories its options write.
+
+    Keys are paths relative to the output's directory; a missing output
+    file is left out, so the result no longer matches the recorded one.
+    """
+    paths = [output_path] if output_path.is_file() else []
+    for option, suffix in (('split', '_shards'), ('preview_lines', '_values'), ('assets', '_assets')):
+        sidecar_path = output_path.with_name(f'{output_path.stem}{suffix}')
+        if options.get(option) and sidecar_path.is_dir():
+            paths.extend(sorted(path for path in sidecar_path.rglob('*') if path.is_file()))
+
+    hashes = {}
+    for path in paths:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        hashes[path.relative_to(output_path.parent).as_posix()] = digest.hexdigest()
+    return hashes
+
+
+def outputs_unchanged(manifest_path: Path, manifest: Dict, output_path: Path) -> bool:
+    """Whether the previous run recorded this manifest and every file it wrote is still there, unmodified."""
+    previous = read_manifest(manifest_path)
+    if not previous or 'files' not in previous:
+        return False
+    if {key: value for key, value in previous.items() if key != 'files'} != manifest:
+        return False
+    return hash_output_files(output_path, manifest['options']) == previous['files']
+
+
+def read_manifest(manifest_path: Path) -> Optional[Dict]:
+    """The manifest of the previous run, or None if there is no readable one."""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(manifest_path: Path, manifest: Dict):
+    with atomic_open(manifest_path, encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+
+
+# ============================================================================
+# Reference Server
+# ============================================================================
+
+
+DEFAULT_SERVE_HOST = '127.0.0.1'
+DEFAULT_SERVE_PORT = 8765
+DEFAULT_SEARCH_LIMIT = 50
+
+
+class ReferenceStore:
+    """Extracted records held in memory with prebuilt search indexes and lookup tables.
+
+    Class and category responses never change while a store is live, so they
+    are serialized once up front; searches only score the trigram candidates.
+    """
+
+    def __init__(self, all_methods, all_data, locators_by_class):
+        self.records = {
+            'methods': [m.to_dict() for m in all_methods],
+            'locators': [locator.to_dict() for locator_list in locators_by_class.values() for locator in locator_list],
+            'data': [d.to_dict() for d in all_data],
+        }
+        self.indexes = build_search_indexes(self.records['methods'], self.records['locators'], self.records['data'])
+
+        methods_by_class = group_methods_by_class(all_methods)
+        self.classes = {
+            name: _json_bytes({
+                'name': name,
+                'methods': [m.to_dict() for m in methods_by_class.get(name, [])],
+                'locators': [locator.to_dict() for locator in locators_by_class.get(name, [])],
+            })
+            for name in _class_shard_names(all_methods, locators_by_class)
+        }
+        self.categories = {
+            category: _json_bytes({'category': category, 'data': [d.to_dict() for d in data_objs]})
+            for category, data_objs in group_data_by_category(all_data).items()
+        }
+        self.class_list = _json_bytes({'classes': list(self.classes)})
+        self.category_list = _json_bytes({'categories': list(self.categories)})
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> Dict:
+        """Ranked methods, locators and data matching query; limit 0 returns every match."""
+        response = {'query': query}
+        for key, index in self.indexes.items():
+            results, total = index.search(query, limit) if query.strip() else ([], 0)
+            response[key] = [
+                {'score': score, 'matches': matches, 'record': self.records[key][doc_id]}
+                for doc_id, score, matches in results
+            ]
+            response[f'{key}_total'] = total
+        return response
+
+
+def _json_bytes(payload) -> bytes:
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+class ReferenceRequestHandler(BaseHTTPRequestHandler):
+    """Answers /search?q=, /class/<name> and /data/<category> from the server's ReferenceStore."""
+
+    server_version = 'DataMethodsReference/1.0'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path.rstrip('/')
+        store = self.server.store
+
+        if path == '/search':
+            # An empty q is a valid (empty) search, so keep blank values
+            params = parse_qs(url.query, keep_blank_values=True)
+            if 'q' not in params:
+                return self._send_json(400, _json_bytes({'error': 'Missing q parameter'}))
+            try:
+                limit = int(params.get('limit', [''])[0] or DEFAULT_SEARCH_LIMIT)
+            except ValueError:
+                return self._send_json(400, _json_bytes({'error': 'limit must be a number'}))
+            return self._send_json(200, _json_bytes(store.search(params['q'][0], max(limit, 0))))
+
+        if path == '/class':
+            return self._send_json(200, store.class_list)
+        if path.startswith('/class/'):
+            body = store.classes.get(unquote(path[len('/class/'):]))
+            if body is None:
+                return self._send_json(404, _json_bytes({'error': 'Unknown class'}))
+            return self._send_json(200, body)
+
+        if path == '/data':
+            return self._send_json(200, store.category_list)
+        if path.startswith('/data/'):
+            body = store.categories.get(unquote(path[len('/data/'):]))
+            if body is None:
+                return self._send_json(404, _json_bytes({'error': 'Unknown data category'}))
+            return self._send_json(200, body)
+
+        self._send_json(404, _json_bytes({'error': 'Not found'}))
+
+    def _send_json(self, status: int, body: bytes):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        # Let a reference page opened from disk query the server
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_reference_server(store: ReferenceStore, host: str, port: int) -> ThreadingHTTPServer:
+    """Bind a threaded server answering from store; assigning server.store swaps in new records."""
+    server = ThreadingHTTPServer((host, port), ReferenceRequestHandler)
+    server.daemon_threads = True
+    server.store = store
+    return server
+
+
+# ============================================================================
+# Watch Mode
+# ============================================================================
+
+
+DEFAULT_WATCH_INTERVAL = 0.5
+
+
+def _source_stamp(file_path: Path):
+    """Cheap change marker for a source file: (mtime_ns, size)."""
+    stat = file_path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def watch_sources(project_root: Path, sources: List[tuple], results: List[Dict], write_output,
+                  cache: Optional[ExtractionCache] = None, interval: float = DEFAULT_WATCH_INTERVAL) -> int:
+    """Poll the source directories and regenerate the output whenever a file changes.
+
+    Records of every file are kept in memory, so each refresh re-extracts only
+    the files whose mtime or size changed (plus new ones), drops deleted ones
+    and hands the merged records to write_output, which returns a short name
+    of what it updated. Runs until interrupted.
+    """
+    records_by_path = {relative_path: records for (_, _, relative_path), records in zip(sources, results)}
+    stamps = {}
+    for kind, file_path, relative_path in sources:
+        try:
+            stamps[relative_path] = _source_stamp(file_path)
+        except FileNotFoundError:
+            pass
+
+    print(f"\nWatching {HELPERS_DIR}, {PAGE_OBJECTS_DIR} and {DATA_DIR} for changes (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(interval)
+
+            current_sources = []
+            current_stamps = {}
+            changed = []
+            for kind, file_path, relative_path in discover_source_files(project_root):
+                try:
+                    stamp = _source_stamp(file_path)
+                except FileNotFoundError:
+                    continue  # Deleted between discovery and stat
+                current_sources.append((kind, file_path, relative_path))
+                current_stamps[relative_path] = stamp
+                if stamps.get(relative_path) != stamp:
+                    changed.append((kind, file_path, relative_path))
+            removed = [relative_path for relative_path in stamps if relative_path not in current_stamps]
+            if not changed and not removed:
+                continue
+
+            started = time.perf_counter()
+            for source in changed:
+                try:
+                    records_by_path[source[2]] = extract_source_file(*source)
+                except (OSError, UnicodeDecodeError) as e:
+                    # Most likely caught mid-write; retry on the next poll
+                    print(f"   WARNING: could not read {source[2]}: {e}")
+                    current_stamps.pop(source[2])
+                    continue
+                if cache is not None:
+                    cache.put(*source, records_by_path[source[2]])
+            for relative_path in removed:
+                records_by_path.pop(relative_path, None)
+            stamps = current_stamps
+
+            current_sources = [source for source in current_sources if source[2] in records_by_path]
+            all_methods, locators_by_class, all_data = merge_records(
+                current_sources, [records_by_path[source[2]] for source in current_sources]
+            )
+            target = write_output(all_methods, all_data, locators_by_class)
+            print(f"Updated {target} ({len(changed)} changed, {len(removed)} removed, "
+                  f"{len(all_methods)} methods, {len(all_data)} data objects) "
+                  f"in {time.perf_counter() - started:.2f}s")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    finally:
+        if cache is not None:
+            cache.save()
+
+    return 0
+
+
+def serve_reference(args, project_root: Path, sources, results, cache, all_methods, all_data, locators_by_class) -> int:
+    """Run the reference server, optionally refreshing its records in --watch mode."""
+    try:
+        server = create_reference_server(ReferenceStore(all_methods, all_data, locators_by_class), args.host, args.port)
+    except OSError as e:
+        print(f"ERROR: Cannot listen on {args.host}:{args.port}: {e}")
+        return 1
+
+    base_url = f"http://{args.host}:{server.server_address[1]}"
+    print(f"\nServing {len(all_methods)} methods and {len(all_data)} data objects at {base_url}")
+    print(f"   - {base_url}/search?q=<query>[&limit=N]")
+    print(f"   - {base_url}/class/<name>")
+    print(f"   - {base_url}/data/<category>")
+
+    if not args.watch:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nStopped serving")
+        finally:
+            server.server_close()
+        return 0
+
+    def refresh_store(all_methods, all_data, locators_by_class) -> str:
+        server.store = ReferenceStore(all_methods, all_data, locators_by_class)
+        return 'server records'
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        return watch_sources(project_root, sources, results, refresh_store, cache, args.interval)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _add_extraction_arguments(parser, defaults: bool = True):
+    """Add the extraction and --watch options, accepted before and after the serve subcommand.
+
+    The serve copy passes defaults=False so options given before the
+    subcommand are not reset to their defaults by the subparser.
+    """
+    def default(value):
+        return value if defaults else argparse.SUPPRESS
+
+    parser.add_argument(
+        '--cache',
+        default=default(DEFAULT_CACHE_FILE),
+        help=f'Extraction cache file, relative to the project root (default: {DEFAULT_CACHE_FILE})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        default=default(False),
+        help='Extract every file again without reading or writing the cache'
+    )
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=default(1),
+        help='Number of worker processes used to extract files; 0 uses every CPU (default: 1)'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        default=default(False),
+        help='Keep running and re-extract whenever a helper, page object or data file changes, '
+             'regenerating the output (or refreshing the records serve answers from)'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=default(DEFAULT_WATCH_INTERVAL),
+        help=f'Seconds between change checks in --watch mode (default: {DEFAULT_WATCH_INTERVAL})'
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate combined HTML reference for methods and data')
     parser.add_argument(
         '--output',
         '-o',
-        default=DEFAULT_OUTPUT_FILE,
-        help=f'Output HTML file (default: {DEFAULT_OUTPUT_FILE})'
+        default=None,
+        help=f'Output file (default: {DEFAULT_OUTPUT_FILE}, with a .json/.ndjson suffix for those formats)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=OUTPUT_FORMATS,
+        default='html',
+        help='html: interactive reference page; json: one document of all records; '
+             'ndjson: one record per line for streaming consumers (default: html)'
+    )
+    _add_extraction_arguments(parser)
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Embed the definitions as minified JSON with repeated strings stored once'
+    )
+    parser.add_argument(
+        '--split',
+        action='store_true',
+        help='Write a small HTML shell plus one JSON shard per class and data category, '
+             'fetched on demand (the page must be served over HTTP)'
+    )
+    parser.add_argument(
+        '--virtualize',
+        action='store_true',
+        help='Render section rows from the embedded definitions only when expanded and scrolled into view'
+    )
+    parser.add_argument(
+        '--preview-lines',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Show only the first N lines of long data values and fetch the rest on "Show More" from a '
+             'sidecar directory (the page must be served over HTTP; search covers the previews only)'
+    )
+    parser.add_argument(
+        '--assets',
+        action='store_true',
+        help='Write the CSS, JavaScript and data as content-hashed files with precompressed .gz variants '
+             '(and .br ones when the brotli module is installed) next to a small HTML entry point; '
+             'sections are rendered from the data file as with --virtualize unless --split is given'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Report wall and CPU time per stage, files, bytes and matches per extractor, and the slowest files'
+    )
+    parser.add_argument(
+        '--profile-stats',
+        metavar='FILE',
+        help='Also write cProfile statistics of the main process to FILE (implies --profile)'
+    )
+    parser.add_argument(
+        '--profile-trace',
+        metavar='FILE',
+        help='Also write a Chrome trace JSON of the stages and per-file extraction to FILE (implies --profile)'
+    )
+    parser.add_argument(
+        '--manifest',
+        nargs='?',
+        const='',
+        metavar='FILE',
+        help='Record a hash of the extracted records, this script and the output options in FILE '
+             '(default: <output>.manifest.json); when it matches the previous run and every output file it '
+             'recorded is unchanged, '
+             f'leave the output untouched and exit with status {EXIT_UNCHANGED}'
     )
+    subparsers = parser.add_subparsers(dest='command')
+    serve_parser = subparsers.add_parser(
+        'serve',
+        help='Keep the extracted records in memory and answer search, class and data queries over HTTP'
+    )
+    serve_parser.add_argument(
+        '--host',
+        default=DEFAULT_SERVE_HOST,
+        help=f'Interface to listen on (default: {DEFAULT_SERVE_HOST})'
+    )
+    serve_parser.add_argument(
+        '--port',
+        type=int,
+        default=DEFAULT_SERVE_PORT,
+        help=f'Port to listen on; 0 picks a free one (default: {DEFAULT_SERVE_PORT})'
+    )
+    _add_extraction_arguments(serve_parser, defaults=False)
 
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error('--jobs must be 0 or a positive number')
+    if args.interval <= 0:
+        parser.error('--interval must be a positive number of seconds')
+    if args.split and args.virtualize:
+        parser.error('--split already renders sections on demand; use it without --virtualize')
+    if args.preview_lines < 0:
+        parser.error('--preview-lines must be 0 or a positive number')
+    html_options = args.compact or args.split or args.virtualize or args.preview_lines or args.assets
+    if args.format != 'html' and html_options:
+        parser.error('--compact, --split, --virtualize, --preview-lines and --assets only apply to --format html')
+    if args.command == 'serve' and (args.output or args.format != 'html' or html_options or args.manifest is not None):
+        parser.error('serve answers queries from memory; --output, --format, --manifest and the HTML options do not apply')
 
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
 
     print(f"Scanning project: {project_root}")
 
-    # Extract methods & locators
-    all_methods = []
-    locators_by_class: Dict[str, List[LocatorDefinition]] = {}
-
-    # Helper function to resolve directory paths (absolute or relative)
-    def resolve_directory(dir_path: str) -> Path:
-        """Resolve directory path - can be absolute or relative to project root."""
-        path = Path(dir_path)
-        if path.is_absolute():
-            return path
-        else:
-            return project_root / dir_path
-
-    # Extract from helpers/*.ts files
-    helpers_dir = resolve_directory(HELPERS_DIR)
-    if helpers_dir.exists():
-        ts_files = sorted(helpers_dir.glob('*.ts'))
-        for ts_file in ts_files:
-            # Create relative path for display - always show the configured directory structure
-            relative_path = f'{HELPERS_DIR}/{ts_file.name}' if not Path(HELPERS_DIR).is_absolute() else str(ts_file)
-            common_methods = extract_methods_from_common_helpers(ts_file, relative_path)
-            if common_methods:
-                print(f"   FOUND Methods: {ts_file.name}: {len(common_methods)} methods")
-                all_methods.extend(common_methods)
-
-    # Extract from page-objects/*.ts files
-    page_objects_dir = resolve_directory(PAGE_OBJECTS_DIR)
-
-    if page_objects_dir.exists():
-        ts_files = sorted(page_objects_dir.glob('*.ts'))
-        for ts_file in ts_files:
-            if ts_file.name in EXCLUDED_PAGE_OBJECTS:
-                continue
-            # Create relative path for display - always show the configured directory structure
-            relative_path = f'{PAGE_OBJECTS_DIR}/{ts_file.name}' if not Path(PAGE_OBJECTS_DIR).is_absolute() else str(ts_file)
-            page_methods = extract_methods_from_page_object(ts_file, relative_path)
-            if page_methods:
-                print(f"   FOUND Methods: {ts_file.name}: {len(page_methods)} methods")
-                all_methods.extend(page_methods)
-            class_name, locators = extract_locators_from_page_object(ts_file, relative_path)
-            if class_name:
-                locators_by_class[class_name] = locators
-
-    # Extract data
-    all_data = []
-    data_dir = resolve_directory(DATA_DIR)
-    if data_dir.exists():
-        ts_files = [f for f in data_dir.rglob('*.ts') if f.name not in EXCLUDED_DATA_FILES]
-        for ts_file in sorted(ts_files):
-            # Create relative path for display
-            if Path(DATA_DIR).is_absolute():
-                relative_path = str(ts_file)
-            else:
-                relative_path = str(ts_file.relative_to(project_root)).replace('\\', '/')
-            data_objects = extract_data_from_file(ts_file, relative_path)
-            if data_objects:
-                print(f"   FOUND Data: {relative_path}: {len(data_objects)} data object(s)")
-                all_data.extend(data_objects)
-
-    if not all_methods and not all_data:
+    profiling = args.profile or args.profile_stats or args.profile_trace
+    profiler = Profiler()
+    stats_profile = cProfile.Profile() if args.profile_stats else None
+    if stats_profile is not None:
+        stats_profile.enable()
+
+    def finish_profile():
+        """Print the profile and write the requested dumps (first run only)."""
+        if stats_profile is not None:
+            stats_profile.disable()
+            stats_profile.dump_stats(args.profile_stats)
+        if profiling:
+            profiler.report()
+        if args.profile_stats:
+            print(f"\nWrote cProfile stats: {args.profile_stats} (python -m pstats {args.profile_stats})")
+        if args.profile_trace:
+            profiler.write_chrome_trace(Path(args.profile_trace))
+            print(f"Wrote Chrome trace: {args.profile_trace} (open in chrome://tracing or ui.perfetto.dev)")
+
+    cache = None if args.no_cache else ExtractionCache(project_root / args.cache)
+    jobs = args.jobs or os.cpu_count() or 1
+
+    with profiler.stage('discovery'):
+        sources = discover_source_files(project_root)
+    with profiler.stage('extraction'):
+        results = extract_source_files(sources, cache, jobs, profiler if profiling else None)
+
+    # Merge methods, locators and data in source order
+    with profiler.stage('merge'):
+        all_methods, locators_by_class, all_data = merge_records(sources, results, verbose=True)
+
+    if cache is not None:
+        with profiler.stage('cache save'):
+            cache.save()
+        print(f"Cache: {cache.hits} file(s) unchanged, {cache.misses} file(s) extracted")
+
+    if not all_methods and not all_data and not (args.watch or args.command == 'serve'):
         print("ERROR: No methods or data found")
         return 1
 
-    # Generate combined HTML
-    output_path = project_root / args.output
-    generate_combined_html(all_methods, all_data, locators_by_class, output_path)
-
-    print(f"\nGenerated: {output_path}")
-    print(f"Total: {len(all_methods)} methods, {len(all_data)} data objects")
-    print(f"\nHTML document includes:")
-    print(f"   - Tab navigation between Methods and Data")
-    print(f"   - Interactive search for both sections")
-    print(f"   - All features from both reference pages")
-
-    return 0
+    output_path = project_root / (args.output or Path(DEFAULT_OUTPUT_FILE).with_suffix(f'.{args.format}'))
+
+    if args.command == 'serve':
+        finish_profile()
+        return serve_reference(args, project_root, sources, results, cache, all_methods, all_data, locators_by_class)
+
+    manifest_path = None
+    if args.manifest is not None:
+        manifest_path = project_root / args.manifest if args.manifest else output_path.with_name(f'{output_path.name}.manifest.json')
+    manifest_options = {
+        'format': args.format, 'output': output_path.name, 'compact': args.compact, 'split': args.split,
+        'virtualize': args.virtualize, 'preview_lines': args.preview_lines, 'assets': args.assets,
+    }
+
+    def write_output(all_methods, all_data, locators_by_class, profiler: Optional[Profiler] = None,
+                     manifest: Optional[Dict] = None) -> str:
+        if manifest_path is not None and manifest is None:
+            manifest = build_manifest(all_methods, all_data, locators_by_class, manifest_options)
+        if args.format != 'html':
+            generate_reference_data(all_methods, all_data, locators_by_class, output_path, args.format)
+        else:
+            generate_combined_html(
+                all_methods, all_data, locators_by_class, output_path,
+                compact=args.compact, split=args.split, virtualize=args.virtualize,
+                preview_lines=args.preview_lines, assets=args.assets, profiler=profiler
+            )
+        # Written last, so an interrupted run never records outputs it did not finish
+        if manifest_path is not None:
+            write_manifest(manifest_path, {**manifest, 'files': hash_output_files(output_path, manifest_options)})
+        return output_path.name
+
+    unchanged = False
+    manifest = None
+    if manifest_path is not None:
+        with profiler.stage('manifest'):
+            manifest = build_manifest(all_methods, all_data, locators_by_class, manifest_options)
+            unchanged = outputs_unchanged(manifest_path, manifest, output_path)
+
+    if unchanged:
+        print(f"\nUnchanged: {output_path} (model {manifest['model'][:12]}, see {manifest_path.name})")
+    else:
+        with profiler.stage('generate output'):
+            write_output(all_methods, all_data, locators_by_class, profiler if profiling else None, manifest)
+
+        print(f"\nGenerated: {output_path}")
+        print(f"Total: {len(all_methods)} methods, {len(all_data)} data objects")
+        if args.format == 'html':
+            print(f"\nHTML document includes:")
+            print(f"   - Tab navigation between Methods and Data")
+            print(f"   - Interactive search for both sections")
+            print(f"   - All features from both reference pages")
+
+    finish_profile()
+
+    if args.watch:
+        return watch_sources(project_root, sources, results, write_output, cache, args.interval)
+
+    return EXIT_UNCHANGED if unchanged else 0
 
 
 if __name__ == '__main__':
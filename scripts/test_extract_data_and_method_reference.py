@@ -0,0 +1,624 @@
+#!/usr/bin/env python3
+"""
+Regression tests for extract_data_and_method_reference.py: the TypeScript
+signature tokenizer, the chunked data file scanner, extraction and its cache,
+the search index and server, page output and the output manifest.
+
+USAGE:
+    python -m unittest discover -s scripts
+    python -m pytest scripts
+"""
+
+import contextlib
+import io
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent))
+import extract_data_and_method_reference as reference  # noqa: E402
+
+
+def parameters_of(parameters: str):
+    """(name, type) pairs parsed from a parameter list."""
+    method = reference.PlaywrightMethod('Page', 'method', parameters, 'void', 'page.ts:1')
+    return [(param['name'], param['type']) for param in method.parsed_params]
+
+
+class SplitTopLevelTest(unittest.TestCase):
+
+    def test_generics(self):
+        self.assertEqual(
+            reference.split_top_level('a: Map<string, number>, b: Record<string, Array<[number, string]>>'),
+            ['a: Map<string, number>', ' b: Record<string, Array<[number, string]>>']
+        )
+
+    def test_object_types_and_nested_parentheses(self):
+        self.assertEqual(
+            reference.split_top_level('o: { a: string, b: (x: number, y: number) => void }, c'),
+            ['o: { a: string, b: (x: number, y: number) => void }', ' c']
+        )
+
+    def test_strings_and_comments(self):
+        self.assertEqual(
+            reference.split_top_level("a = 'x, (y', b = \"<z,\", c = `${d, e}`, /* f, g */ h // i, j"),
+            ["a = 'x, (y'", ' b = "<z,"', ' c = `${d, e}`', ' /* f, g */ h // i, j']
+        )
+
+    def test_arrow_does_not_close_angle(self):
+        self.assertEqual(
+            reference.split_top_level('f: Array<(x: number) => void>, g'),
+            ['f: Array<(x: number) => void>', ' g']
+        )
+
+
+class ParseParametersTest(unittest.TestCase):
+
+    def test_comparison_in_default_value(self):
+        self.assertEqual(
+            parameters_of('a: number = 1 < 2 ? 3 : 4, b: string'),
+            [('a', 'number'), ('b', 'string')]
+        )
+        self.assertEqual(
+            parameters_of('q: number = 5 <= 6 ? 1 : 0, cb = () => x > 1, r: string'),
+            [('q', 'number'), ('cb', 'any'), ('r', 'string')]
+        )
+
+    def test_generic_default_value(self):
+        self.assertEqual(
+            parameters_of('m: Map<string, number>, cache = new Map<string, number>(), c: string'),
+            [('m', 'Map<string, number>'), ('cache', 'any'), ('c', 'string')]
+        )
+
+    def test_object_type_with_default(self):
+        self.assertEqual(
+            parameters_of('options: { label: string; index?: number } = { label: "a, b" }, retries = 3'),
+            [('options', '{ label: string; index?: number }'), ('retries', 'any')]
+        )
+
+    def test_function_and_conditional_types(self):
+        self.assertEqual(
+            parameters_of('cb: (a: number, b: string) => Promise<void>, t: T extends Array<infer U> ? U : never'),
+            [('cb', '(a: number, b: string) => Promise<void>'), ('t', 'T extends Array<infer U> ? U : never')]
+        )
+
+    def test_destructured_parameter_with_defaults(self):
+        self.assertEqual(
+            parameters_of('{ a = 1 < 2, b }: Options, c: string'),
+            [('{ a = 1 < 2, b }', 'Options'), ('c', 'string')]
+        )
+
+    def test_empty(self):
+        self.assertEqual(parameters_of(''), [])
+        self.assertEqual(parameters_of('  '), [])
+
+
+class MatchSignatureTest(unittest.TestCase):
+
+    def test_generic_return_type(self):
+        content = 'method(a: Map<string, number>, b = 1 < 2): Promise<Map<string, number[]>> { return x; }'
+        params, return_type, body_start = reference.match_signature(content, content.index('('))
+        self.assertEqual(params, 'a: Map<string, number>, b = 1 < 2')
+        self.assertEqual(return_type.strip(), 'Promise<Map<string, number[]>>')
+        self.assertEqual(content[body_start], '{')
+
+    def test_object_literal_return_type(self):
+        content = 'method(): { a: string; b: number } { return x; }'
+        params, return_type, body_start = reference.match_signature(content, content.index('('))
+        self.assertEqual(params, '')
+        self.assertEqual(return_type.strip(), '{ a: string; b: number }')
+        self.assertEqual(content[body_start:], '{ return x; }')
+
+    def test_parenthesis_in_string(self):
+        content = "method(label = ')', b: string) {}"
+        params, return_type, _ = reference.match_signature(content, content.index('('))
+        self.assertEqual(params, "label = ')', b: string")
+        self.assertIsNone(return_type)
+
+    def test_declaration_without_body(self):
+        content = 'method(a: string): void;\nother() {}'
+        self.assertIsNone(reference.match_signature(content, content.index('(')))
+
+
+DATA_FILE = """import type {Product} from '../data-interfaces';
+
+export const PRODUCTS: Array<Record<string, string | number>> = [
+  {
+    'productName': 'Iphone 6; 32gb',
+    'note': "a \\"quoted\\"; value",
+    'imgSrc': `imgs/${'x;y'}.jpg` // trailing; comment
+  },
+  /* block; comment */
+  { 'productName': 'Nokia', 'productPrice': 820 }
+];
+
+export const NO_SEMICOLON = { a: 1 }
+export const TIMEOUT: number = 10000;
+export const nested = { fn: (a: number) => { return a; }, list: [1, 2, 3] };
+export const LAST = 'end'
+"""
+
+EXPECTED_DATA = [
+    ('PRODUCTS', "[\n  {\n    'productName': 'Iphone 6; 32gb',\n    'note': \"a \\\"quoted\\\"; value\",\n"
+                 "    'imgSrc': `imgs/${'x;y'}.jpg` // trailing; comment\n  },\n  /* block; comment */\n"
+                 "  { 'productName': 'Nokia', 'productPrice': 820 }\n]"),
+    ('NO_SEMICOLON', '{ a: 1 }'),
+    ('TIMEOUT', '10000'),
+    ('nested', '{ fn: (a: number) => { return a; }, list: [1, 2, 3] }'),
+    ('LAST', "'end'"),
+]
+
+
+class DataScannerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def extract(self, text: str, chunk_size: int):
+        path = Path(self.temp_dir.name) / 'data.ts'
+        path.write_text(text, encoding='utf-8')
+        with mock.patch.object(reference, 'DATA_READ_CHUNK_SIZE', chunk_size):
+            return [(data.name, data.raw_value) for data in reference.iter_data_from_file(path, 'data/data.ts')]
+
+    def test_every_chunk_size(self):
+        for chunk_size in (1, 2, 3, 5, 16, 64, 1 << 20):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.extract(DATA_FILE, chunk_size), EXPECTED_DATA)
+
+    def test_declaration_larger_than_many_chunks(self):
+        items = ',\n'.join(f"  {{ 'name': 'Product {index}; model {index % 7}' }}" for index in range(2000))
+        text = f'export const CATALOG = [\n{items}\n];\nexport const AFTER = 1;\n'
+        for chunk_size in (1, 7, 4096):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    self.extract(text, chunk_size),
+                    [('CATALOG', f'[\n{items}\n]'), ('AFTER', '1')]
+                )
+
+    def test_value_is_scanned_once_across_reads(self):
+        items = ',\n'.join(f"  {{ 'name': 'Product {index}; model {index % 7}' }}" for index in range(2000))
+        text = f'export const CATALOG = [\n{items}\n];\n'
+        scanned = []
+        scan_to = reference._scan_to
+
+        def counting_scan_to(text, start, stops, end=None, *args, **kwargs):
+            scanned.append((len(text) if end is None else end) - start)
+            return scan_to(text, start, stops, end, *args, **kwargs)
+
+        with mock.patch.object(reference, '_scan_to', counting_scan_to):
+            self.assertEqual(self.extract(text, 256), [('CATALOG', f'[\n{items}\n]')])
+        self.assertLess(sum(scanned), len(text) * 1.05)
+
+    def test_unterminated_value_runs_to_end_of_file(self):
+        for chunk_size in (1, 4, 1 << 20):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.extract("export const A = 'x';\nexport const B = [1, 2", chunk_size),
+                                 [('A', "'x'"), ('B', '[1, 2')])
+
+
+PROJECT_FILES = {
+    'helpers/LoginHelpers.ts': """import { test } from '@playwright/test';
+
+export class LoginHelpers {
+  static async login(poManager: POManager, username: string, password: string){
+    return await test.step(`Login as ${username}`, async () => {
+      await poManager.getLoginPage().login(username, password);
+    });
+  }
+}
+""",
+    'page-objects/CartPage.ts': """import { Locator, Page, expect } from '@playwright/test';
+
+export class CartPage {
+  private readonly btn_Checkout: Locator;
+
+  constructor(page: Page) {
+    this.btn_Checkout = page.getByRole('button', {name: 'Checkout'});
+  }
+
+  async clickCheckout() {
+    await this.btn_Checkout.click();
+  }
+
+  async verifyTotal(expectedText: string, timeout: number = 10000) {
+    await expect(this.btn_Checkout).toHaveText(expectedText, { timeout });
+  }
+}
+""",
+    'data/products/products.ts': DATA_FILE,
+    'data/constants.ts': "export const BASE_URL = 'https://example.com';\n",
+}
+
+
+def write_project(root: Path):
+    """A small project in the layout the generator scans."""
+    for name, text in PROJECT_FILES.items():
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text(text, encoding='utf-8')
+
+
+class ExtractionCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        write_project(self.root)
+        self.cache_file = self.root / reference.DEFAULT_CACHE_FILE
+
+    def extract(self, fingerprint: str = 'generator'):
+        """Run extraction through a fresh cache; return (data names, hits, misses)."""
+        with mock.patch.object(reference, '_extractor_fingerprint', return_value=fingerprint):
+            cache = reference.ExtractionCache(self.cache_file)
+            sources = reference.discover_source_files(self.root)
+            results = reference.extract_source_files(sources, cache)
+            cache.save()
+        _, _, all_data = reference.merge_records(sources, results)
+        return [data.name for data in all_data], cache.hits, cache.misses
+
+    def set_mtime(self, path: Path, mtime_ns: int):
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_unchanged_files_are_hits(self):
+        names, hits, misses = self.extract()
+        self.assertEqual((hits, misses), (0, len(PROJECT_FILES)))
+        self.assertEqual(self.extract(), (names, len(PROJECT_FILES), 0))
+
+    def test_touched_file_with_same_content_is_a_hit(self):
+        self.extract()
+        path = self.root / 'data/constants.ts'
+        self.set_mtime(path, path.stat().st_mtime_ns + 10 ** 9)
+        self.assertEqual(self.extract()[1:], (len(PROJECT_FILES), 0))
+        # The new mtime was recorded, so the next run does not hash the file again
+        with mock.patch.object(reference, '_hash_file', side_effect=AssertionError('hashed')):
+            with mock.patch.object(reference, '_extractor_fingerprint', return_value='generator'):
+                cache = reference.ExtractionCache(self.cache_file)
+                self.assertIsNotNone(cache.get('data', path, 'data/constants.ts'))
+
+    def test_changed_content_with_same_mtime_is_a_miss(self):
+        self.extract()
+        path = self.root / 'data/constants.ts'
+        mtime_ns = path.stat().st_mtime_ns
+        path.write_text("export const BASE_URL = 'https://example.org/v2';\n", encoding='utf-8')
+        self.set_mtime(path, mtime_ns)
+        names, hits, misses = self.extract()
+        self.assertEqual((hits, misses), (len(PROJECT_FILES) - 1, 1))
+        self.assertIn('BASE_URL', names)
+
+    def test_changed_size_is_a_miss(self):
+        self.extract()
+        with open(self.root / 'data/constants.ts', 'a', encoding='utf-8') as f:
+            f.write("export const RETRIES = 3;\n")
+        names, hits, misses = self.extract()
+        self.assertEqual((hits, misses), (len(PROJECT_FILES) - 1, 1))
+        self.assertIn('RETRIES', names)
+
+    def test_generator_change_drops_every_entry(self):
+        self.extract()
+        self.assertEqual(self.extract('changed generator')[1:], (0, len(PROJECT_FILES)))
+
+    def test_file_deleted_after_discovery_is_skipped(self):
+        self.extract()
+        sources = reference.discover_source_files(self.root)
+        (self.root / 'data/constants.ts').unlink()
+        (self.root / 'helpers/LoginHelpers.ts').unlink()
+        with mock.patch.object(reference, '_extractor_fingerprint', return_value='generator'):
+            cache = reference.ExtractionCache(self.cache_file)
+            cache.entries['helpers/LoginHelpers.ts']['size'] += 1
+            results = reference.extract_source_files(sources, cache)
+            cache.save()
+        _, _, all_data = reference.merge_records(sources, results)
+        self.assertNotIn('BASE_URL', [data.name for data in all_data])
+        self.assertNotIn('data/constants.ts', json.loads(self.cache_file.read_text(encoding='utf-8'))['files'])
+
+
+def expand_definitions(payload: dict, strings: list) -> list:
+    """The records expandDefinitions() rebuilds in the page from a compact payload."""
+    records = []
+    for row in payload['rows']:
+        record = {}
+        for (key, codec), value in zip(payload['fields'], row):
+            if codec == 'str':
+                record[key] = strings[value]
+            elif codec == 'loc':
+                record[key] = f'{strings[value[0]]}:{value[1]}'
+            elif value is not None:
+                record[key] = value
+        records.append(record)
+    return records
+
+
+class CompactDefinitionsTest(unittest.TestCase):
+
+    def test_payloads_expand_to_the_records(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            write_project(root)
+            sources = reference.discover_source_files(root)
+            all_methods, locators_by_class, all_data = reference.merge_records(
+                sources, reference.extract_source_files(sources)
+            )
+            # One long value is cut to a preview, so only some data records carry the preview key
+            all_data = reference.preview_data_objects(all_data, root / 'values', 3)
+        self.assertEqual(sum(1 for data in all_data if data.preview), 1)
+        all_locators = [locator for locators in locators_by_class.values() for locator in locators]
+
+        text = ''.join(reference._iter_compact_definitions(all_methods, all_locators, all_data))
+        strings = json.loads(re.search(r'const referenceStrings = (.*);\n', text).group(1))
+        payloads = dict(re.findall(r'const (\w+) = expandDefinitions\((.*)\);\n', text))
+        for name, records in (('methodDefinitions', all_methods), ('locatorDefinitions', all_locators),
+                              ('dataDefinitions', all_data)):
+            with self.subTest(name):
+                self.assertTrue(records)
+                self.assertEqual(expand_definitions(json.loads(payloads[name]), strings),
+                                 [record.to_dict() for record in records])
+
+    def test_strings_are_interned_once(self):
+        methods = [reference.PlaywrightMethod('CartPage', f'method{index}', '', 'void', f'page-objects/CartPage.ts:{index}')
+                   for index in range(3)]
+        text = ''.join(reference._iter_compact_definitions(methods, [], []))
+        strings = json.loads(re.search(r'const referenceStrings = (.*);\n', text).group(1))
+        self.assertEqual(strings.count('CartPage'), 1)
+        self.assertEqual(strings.count('page-objects/CartPage.ts'), 1)
+
+
+class SearchRankingTest(unittest.TestCase):
+
+    def setUp(self):
+        methods = [
+            reference.PlaywrightMethod('LoginPage', 'clickLogin', '', 'void', 'page-objects/LoginPage.ts:1'),
+            reference.PlaywrightMethod('CartPage', 'openCart', 'cart: string', 'void', 'page-objects/CartPage.ts:1'),
+            reference.PlaywrightMethod('CartPage', 'clickCheckout', '', 'void', 'page-objects/CartPage.ts:2'),
+            reference.PlaywrightMethod('HomePage', 'verifyCartCount', '', 'void', 'page-objects/HomePage.ts:1'),
+        ]
+        self.index = reference.SearchIndex.from_records(
+            [method.to_dict() for method in methods], reference.METHOD_SEARCH_FIELDS, reference.METHOD_PARAM_FIELD
+        )
+
+    def ranking(self, query: str, limit: int = 0):
+        results, total = self.index.search(query, limit)
+        return [(doc_id, score) for doc_id, score, _ in results], total
+
+    def test_scores_and_order(self):
+        # openCart: name 100 + 20 for the word, class 80 + 15, inferred purpose 50 + 10, parameter 30
+        self.assertEqual(self.ranking('cart'), ([(1, 305), (3, 180), (2, 95)], 3))
+
+    def test_limit_keeps_the_best_in_order(self):
+        full, total = self.ranking('cart')
+        for limit in (1, 2, 3, 10):
+            with self.subTest(limit=limit):
+                self.assertEqual(self.ranking('cart', limit), (full[:limit], total))
+
+    def test_equal_scores_keep_the_lower_id_first(self):
+        self.assertEqual(self.ranking('ck'), ([(0, 150), (2, 150)], 2))
+        # No record holds the whole query; each scores per matching word
+        self.assertEqual(self.ranking('click cart'), ([(1, 45), (2, 45), (0, 30), (3, 30)], 4))
+
+
+class ReferenceServerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        log_message = mock.patch.object(reference.ReferenceRequestHandler, 'log_message')
+        log_message.start()
+        cls.addClassCleanup(log_message.stop)
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(cls.temp_dir.name)
+        write_project(root)
+        sources = reference.discover_source_files(root)
+        all_methods, locators_by_class, all_data = reference.merge_records(sources, reference.extract_source_files(sources))
+        cls.server = reference.create_reference_server(
+            reference.ReferenceStore(all_methods, all_data, locators_by_class), '127.0.0.1', 0
+        )
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_address[1]}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.temp_dir.cleanup()
+
+    def get(self, path: str):
+        try:
+            with urllib.request.urlopen(self.base_url + path) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_search(self):
+        status, body = self.get('/search?q=checkout&limit=5')
+        self.assertEqual(status, 200)
+        self.assertEqual([result['record']['method_name'] for result in body['methods']], ['clickCheckout'])
+        self.assertEqual(body['methods_total'], 1)
+
+    def test_empty_query_is_an_empty_search(self):
+        for path in ('/search?q=', '/search?q=%20'):
+            with self.subTest(path=path):
+                status, body = self.get(path)
+                self.assertEqual(status, 200)
+                self.assertEqual((body['methods'], body['locators'], body['data']), ([], [], []))
+
+    def test_bad_requests(self):
+        self.assertEqual(self.get('/search')[0], 400)
+        self.assertEqual(self.get('/search?q=cart&limit=many'), (400, {'error': 'limit must be a number'}))
+
+    def test_classes_and_categories(self):
+        status, body = self.get('/class/CartPage')
+        self.assertEqual(status, 200)
+        self.assertEqual([method['method_name'] for method in body['methods']], ['clickCheckout', 'verifyTotal'])
+        self.assertEqual(self.get('/data/products-data')[0], 200)
+        self.assertEqual(self.get('/class'), (200, {'classes': ['LoginHelpers', 'CartPage']}))
+
+    def test_not_found(self):
+        self.assertEqual(self.get('/class/MissingPage'), (404, {'error': 'Unknown class'}))
+        self.assertEqual(self.get('/data/missing'), (404, {'error': 'Unknown data category'}))
+        self.assertEqual(self.get('/unknown'), (404, {'error': 'Not found'}))
+
+
+class ParallelExtractionTest(unittest.TestCase):
+
+    def test_jobs_match_serial_extraction(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            write_project(root)
+            for index in range(6):
+                page = PROJECT_FILES['page-objects/CartPage.ts'].replace('CartPage', f'Page{index}')
+                (root / f'page-objects/Page{index}.ts').write_text(page, encoding='utf-8')
+            sources = reference.discover_source_files(root)
+
+            def merged(jobs: int):
+                all_methods, locators_by_class, all_data = reference.merge_records(
+                    sources, reference.extract_source_files(sources, None, jobs)
+                )
+                return (
+                    [method.to_dict() for method in all_methods],
+                    {name: [locator.to_dict() for locator in locators] for name, locators in locators_by_class.items()},
+                    [data.to_dict() for data in all_data],
+                )
+
+            serial = merged(1)
+            self.assertEqual(len(serial[1]), 7)
+            self.assertEqual(merged(2), serial)
+            self.assertEqual(list(merged(2)[1]), list(serial[1]))
+
+
+class ManifestTest(unittest.TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        write_project(self.root)
+        # The generator scans the parent of its own directory and fingerprints its own source
+        (self.root / 'scripts').mkdir()
+        self.script = shutil.copy(reference.__file__, self.root / 'scripts' / 'reference.py')
+
+    def run_main(self, *args: str) -> int:
+        argv = ['extract_data_and_method_reference.py', '--no-cache', '--manifest', *args]
+        with mock.patch.object(reference, '__file__', str(self.script)), \
+                mock.patch.object(sys, 'argv', argv), contextlib.redirect_stdout(io.StringIO()):
+            return reference.main()
+
+    def test_unchanged_run_exits_3_and_keeps_the_output(self):
+        self.assertEqual(self.run_main(), 0)
+        output = self.root / reference.DEFAULT_OUTPUT_FILE
+        written = output.read_bytes()
+        self.assertEqual(self.run_main(), reference.EXIT_UNCHANGED)
+        self.assertEqual(output.read_bytes(), written)
+
+    def test_changed_options_regenerate(self):
+        self.assertEqual(self.run_main(), 0)
+        self.assertEqual(self.run_main('--compact'), 0)
+        self.assertEqual(self.run_main('--compact'), reference.EXIT_UNCHANGED)
+        self.assertEqual(self.run_main(), 0)
+
+    def test_changed_source_regenerates(self):
+        self.assertEqual(self.run_main(), 0)
+        with open(self.root / 'data/constants.ts', 'a', encoding='utf-8') as f:
+            f.write("export const RETRIES = 3;\n")
+        self.assertEqual(self.run_main(), 0)
+        self.assertIn('RETRIES', (self.root / reference.DEFAULT_OUTPUT_FILE).read_text(encoding='utf-8'))
+
+    def test_missing_or_modified_sidecar_files_regenerate(self):
+        self.assertEqual(self.run_main('--split'), 0)
+        shards = self.root / 'DATA_METHODS_REFERENCE_shards'
+        shard = next(path for path in sorted(shards.rglob('*.json')) if path.name != 'index.json')
+        shard.unlink()
+        self.assertEqual(self.run_main('--split'), 0)
+        self.assertTrue(shard.exists())
+        self.assertEqual(self.run_main('--split'), reference.EXIT_UNCHANGED)
+
+        with open(shards / 'index.json', 'a', encoding='utf-8') as f:
+            f.write(' ')
+        self.assertEqual(self.run_main('--split'), 0)
+        self.assertEqual(self.run_main('--split'), reference.EXIT_UNCHANGED)
+
+    def test_missing_output_regenerates(self):
+        self.assertEqual(self.run_main(), 0)
+        (self.root / reference.DEFAULT_OUTPUT_FILE).unlink()
+        self.assertEqual(self.run_main(), 0)
+        self.assertTrue((self.root / reference.DEFAULT_OUTPUT_FILE).exists())
+
+class DataSearchIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.records = [
+            {'name': 'PRODUCTS', 'file': 'data/products/products.ts', 'raw_value': "[{ 'productName': 'Nokia' }]"},
+            {'name': 'USERS', 'file': 'data/users/users.ts', 'raw_value': "[{ 'user': 'products admin' }]"},
+            {'name': 'TIMEOUT', 'file': 'data/config.ts', 'raw_value': '10000'},
+        ]
+        self.index = reference.SearchIndex.from_records(self.records, reference.DATA_SEARCH_FIELDS)
+
+    def test_postings_cover_name_and_file_only(self):
+        self.assertEqual(self.index.postings['pro'], [0])
+        self.assertEqual(self.index.postings['use'], [1])
+        self.assertNotIn('nok', self.index.postings)
+
+    def test_values_are_scanned(self):
+        results, total = self.index.search('products')
+        self.assertEqual([(doc_id, score) for doc_id, score, _ in results], [(0, 150), (1, 30)])
+        self.assertEqual(total, 2)
+        self.assertEqual([doc_id for doc_id, _, _ in self.index.search('nokia')[0]], [0])
+        self.assertEqual(self.index.search('missing'), ([], 0))
+
+
+class PreviewPageTest(unittest.TestCase):
+
+    @staticmethod
+    def catalog(entries: int) -> str:
+        return '[\n' + ',\n'.join(f"  {{ 'name': 'Product {index}' }}" for index in range(entries)) + '\n]'
+
+    def page_size(self, value: str, **options) -> int:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / 'reference.html'
+            data = [reference.TestDataObject('CATALOG', 'data/catalog/catalog.ts', value)]
+            reference.generate_combined_html([], data, {}, str(output_file), preview_lines=5, **options)
+            return output_file.stat().st_size
+
+    def test_page_size_does_not_grow_with_value_size(self):
+        for options in ({}, {'compact': True}, {'virtualize': True}):
+            with self.subTest(**options):
+                small = self.page_size(self.catalog(100), **options)
+                large = self.page_size(self.catalog(50000), **options)
+                self.assertLess(large - small, 64)
+
+    def test_search_index_holds_the_preview_only(self):
+        value = self.catalog(50) + "\n// needle"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            previews = reference.preview_data_objects(
+                [reference.TestDataObject('CATALOG', 'data/catalog.ts', value)], Path(temp_dir) / 'values', 5
+            )
+        self.assertNotIn('needle', previews[0].raw_value)
+        self.assertNotIn('needle', ''.join(reference.iter_search_index([], [], previews)))
+        self.assertNotIn('needle', ''.join(reference.iter_search_index([], [], previews, docs=True)))
+
+
+class PageAssetsTest(unittest.TestCase):
+
+    def test_stale_cleanup_keeps_directories(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / 'reference.html'
+            assets_path = Path(temp_dir) / 'reference_assets'
+            (assets_path / 'images').mkdir(parents=True)
+            (assets_path / 'page.old.css').write_text('', encoding='utf-8')
+            data = [reference.TestDataObject('A', 'data/a.ts', "'a'")]
+            written = reference.write_page_assets([], data, {}, output_file)
+            self.assertTrue((assets_path / 'images').is_dir())
+            self.assertFalse((assets_path / 'page.old.css').exists())
+            self.assertEqual(sorted(path.name for path in assets_path.iterdir()), sorted(written + ['images']))
+
+
+if __name__ == '__main__':
+    unittest.main()